@@ -7,8 +7,12 @@ applicable standards based on file extension and checks for DON'T pattern violat
 """
 
 import fnmatch
+import functools
+import hashlib
 import json
+import os
 import re
+import socket
 import sys
 from pathlib import Path
 from typing import TypedDict
@@ -39,9 +43,190 @@ class ValidatorOutput(TypedDict, total=False):
     suggestion: str
 
 
+try:
+    import orjson
+
+    def _dumps(obj: object) -> str:
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    _dumps = json.dumps
+    _loads = json.loads
+
+
 EDIT_WRITE_TOOLS = {"Edit", "Write"}
 
-_skills_cache: dict[str, list[str]] = {}
+# Shared with config_utils; RED64_CACHE_DIR overrides the location
+# (the test suite points it at a throwaway directory).
+CACHE_DIR = Path(os.environ.get("RED64_CACHE_DIR") or Path.home() / ".cache" / "red64")
+
+_CODE_FENCE_RE = re.compile(r"```\w*\n(.*?)```", re.DOTALL)
+
+_CRITICAL_PATTERNS: list[tuple[str, re.Pattern]] = [
+    ("single-letter variable", re.compile(r"\bconst [a-z] =")),
+    ("hungarian notation", re.compile(r"\b(str|arr|obj|int|bool)[A-Z]")),
+]
+
+_VIOLATION_CHECKS: list[tuple[str, str, str]] = [
+    (": any", "any type usage", "Use explicit types instead of 'any'."),
+    (": any =", "any type usage", "Use explicit types instead of 'any'."),
+    (": any;", "any type usage", "Use explicit types instead of 'any'."),
+    ("var ", "var keyword usage", "Use 'const' or 'let' instead of 'var'."),
+    ("eval(", "eval() usage", "Avoid using eval() for security reasons."),
+]
+
+try:
+    import ahocorasick
+
+    _VIOLATION_AC = ahocorasick.Automaton()
+    for _check, _name, _suggestion in _VIOLATION_CHECKS:
+        _VIOLATION_AC.add_word(_check, _check)
+    _VIOLATION_AC.make_automaton()
+except ImportError:
+    _VIOLATION_AC = None
+
+_VIOLATION_RE = re.compile(
+    "|".join(re.escape(check) for check, _, _ in _VIOLATION_CHECKS)
+)
+
+
+def _find_violation_checks(content_lower: str) -> set[str]:
+    """Find which fixed violation substrings occur in the content.
+
+    Scans the content once via an Aho-Corasick automaton when
+    pyahocorasick is available, else via a precompiled alternation
+    regex, instead of one substring check per violation.
+
+    Args:
+        content_lower: Lowercased content being validated.
+
+    Returns:
+        Set of violation check substrings present in the content.
+    """
+    if _VIOLATION_AC is not None:
+        return {check for _, check in _VIOLATION_AC.iter(content_lower)}
+    return {match.group(0) for match in _VIOLATION_RE.finditer(content_lower)}
+
+
+_LOWER_CHUNK_SIZE = 8192
+
+_MAX_CHECK_LEN = max(len(check) for check, _, _ in _VIOLATION_CHECKS)
+
+
+def _iter_lowered_chunks(content: str, overlap: int):
+    """Yield lowercased chunks of content with boundary overlap.
+
+    Avoids allocating a full lowercased copy of large content; each
+    chunk carries the previous chunk's tail so matches spanning a
+    boundary are not missed.
+
+    Args:
+        content: Content to scan.
+        overlap: Number of trailing characters to repeat per chunk.
+
+    Yields:
+        Lowercased content chunks.
+    """
+    for start in range(0, len(content), _LOWER_CHUNK_SIZE):
+        yield content[max(0, start - overlap):start + _LOWER_CHUNK_SIZE].lower()
+
+
+_lowered_patterns_cache: dict[tuple[str, ...], list[tuple[str, str, str]]] = {}
+
+
+def _lowered_patterns(patterns: list[str]) -> list[tuple[str, str, str]]:
+    """Return cached (pattern, lowered, lowered-no-spaces) triples.
+
+    The DON'T patterns never change at runtime, so the lowered
+    variants are computed once per pattern list instead of inside
+    the per-content check loops.
+
+    Args:
+        patterns: List of DON'T pattern strings.
+
+    Returns:
+        List of (original, lowered, lowered with spaces removed) tuples.
+    """
+    key = tuple(patterns)
+    triples = _lowered_patterns_cache.get(key)
+    if triples is None:
+        triples = []
+        for pattern in patterns:
+            lowered = pattern.lower()
+            triples.append((pattern, lowered, lowered.replace(" ", "")))
+        _lowered_patterns_cache[key] = triples
+    return triples
+
+
+# In-process pattern cache; each entry carries the same skill-file
+# validity key as the disk cache so long-lived (--daemon) processes
+# pick up skill edits without a restart.
+_skills_cache: dict[str, tuple[list[list], list[str]]] = {}
+
+
+def _skills_cache_key(skills_dir: Path) -> list[list] | None:
+    """Build an invalidation key from the skill files in a plugin.
+
+    Args:
+        skills_dir: Path to the plugin's skills directory.
+
+    Returns:
+        Sorted list of [name, mtime_ns, size] per .md file, or None
+        if the directory cannot be read.
+    """
+    try:
+        entries = []
+        with os.scandir(skills_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".md") and entry.is_file(follow_symlinks=False):
+                    stat = entry.stat()
+                    entries.append([entry.name, stat.st_mtime_ns, stat.st_size])
+        entries.sort()
+        return entries
+    except OSError:
+        return None
+
+
+def _read_disk_cache(cache_key: str, validity_key: list[list]) -> list[str] | None:
+    """Read cached DON'T patterns from disk if still valid.
+
+    Args:
+        cache_key: Logical key (the plugin path).
+        validity_key: Current skill-file key to compare against.
+
+    Returns:
+        Cached pattern list, or None on miss/invalidation.
+    """
+    digest = hashlib.blake2b(cache_key.encode(), digest_size=16).hexdigest()
+    try:
+        with open(CACHE_DIR / f"dont-{digest}.json") as f:
+            entry = json.load(f)
+        if entry.get("key") == validity_key:
+            return entry["data"]
+    except (OSError, json.JSONDecodeError, KeyError):
+        pass
+    return None
+
+
+def _write_disk_cache(cache_key: str, validity_key: list[list], data: list[str]) -> None:
+    """Write DON'T patterns to the disk cache, ignoring failures.
+
+    Args:
+        cache_key: Logical key (the plugin path).
+        validity_key: Skill-file key recorded for invalidation.
+        data: Pattern list to store.
+    """
+    digest = hashlib.blake2b(cache_key.encode(), digest_size=16).hexdigest()
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_file = CACHE_DIR / f"dont-{digest}.json"
+        tmp_file = cache_file.with_suffix(".tmp")
+        with open(tmp_file, "w") as f:
+            json.dump({"key": validity_key, "data": data}, f)
+        tmp_file.replace(cache_file)
+    except OSError:
+        pass
 
 
 def get_plugins_dir(cwd: str, plugins_dir: str | None = None) -> Path:
@@ -71,10 +256,15 @@ def load_config(cwd: str) -> dict:
     try:
         import yaml
 
+        try:
+            from yaml import CSafeLoader as loader
+        except ImportError:
+            from yaml import SafeLoader as loader
+
         config_path = Path(cwd) / ".red64" / "config.yaml"
         if config_path.exists():
             with open(config_path) as f:
-                return yaml.safe_load(f) or {}
+                return yaml.load(f, Loader=loader) or {}
     except Exception:
         pass
     return {}
@@ -134,8 +324,33 @@ def file_matches_patterns(file_path: str, patterns: list[str]) -> bool:
     Returns:
         True if file matches any pattern, False otherwise.
     """
-    file_name = Path(file_path).name
-    return any(fnmatch.fnmatch(file_name, pattern) for pattern in patterns)
+    if not patterns:
+        return False
+    # Plain string slicing; avoids a Path allocation on a hot check.
+    file_name = file_path[file_path.rfind("/") + 1:]
+    return _compile_glob_patterns(patterns).match(file_name) is not None
+
+
+_glob_re_cache: dict[tuple[str, ...], re.Pattern] = {}
+
+
+def _compile_glob_patterns(patterns: list[str]) -> re.Pattern:
+    """Compile glob patterns into one cached alternation regex.
+
+    Args:
+        patterns: List of glob patterns.
+
+    Returns:
+        Compiled regex matching any of the patterns.
+    """
+    key = tuple(sorted(patterns))
+    compiled = _glob_re_cache.get(key)
+    if compiled is None:
+        compiled = re.compile(
+            "|".join(f"(?:{fnmatch.translate(p)})" for p in key)
+        )
+        _glob_re_cache[key] = compiled
+    return compiled
 
 
 def extract_dont_section(skill_content: str) -> str:
@@ -147,21 +362,25 @@ def extract_dont_section(skill_content: str) -> str:
     Returns:
         Content of the DON'T section, or empty string if not found.
     """
-    dont_pattern = re.compile(
-        r"^##\s*DON'T\s*$",
-        re.MULTILINE | re.IGNORECASE
-    )
-    match = dont_pattern.search(skill_content)
-    if not match:
+    lines = skill_content.split("\n")
+
+    start_index = None
+    for i, line in enumerate(lines):
+        if line.startswith("##") and line[2:].strip().lower() == "don't":
+            start_index = i + 1
+            break
+
+    if start_index is None:
         return ""
 
-    start_pos = match.end()
-    next_h2_pattern = re.compile(r"^##\s+", re.MULTILINE)
-    next_match = next_h2_pattern.search(skill_content, start_pos)
+    end_index = len(lines)
+    for i in range(start_index, len(lines)):
+        line = lines[i]
+        if line.startswith("## ") or line.startswith("##\t"):
+            end_index = i
+            break
 
-    if next_match:
-        return skill_content[start_pos:next_match.start()].strip()
-    return skill_content[start_pos:].strip()
+    return "\n".join(lines[start_index:end_index]).strip()
 
 
 def extract_code_examples(dont_section: str) -> list[str]:
@@ -173,11 +392,38 @@ def extract_code_examples(dont_section: str) -> list[str]:
     Returns:
         List of code example strings.
     """
-    code_pattern = re.compile(r"```\w*\n(.*?)```", re.DOTALL)
-    matches = code_pattern.findall(dont_section)
+    matches = _CODE_FENCE_RE.findall(dont_section)
     return [match.strip() for match in matches if match.strip()]
 
 
+def _read_dont_section(skill_path: str) -> str:
+    """Stream a skill file and return only its DON'T section.
+
+    Reads line-by-line and stops at the header following the DON'T
+    section, so the rest of a large SKILL.md is never read.
+
+    Args:
+        skill_path: Path to the SKILL.md file.
+
+    Returns:
+        Content of the DON'T section, or empty string if not found.
+    """
+    section_lines: list[str] = []
+    in_dont = False
+
+    with open(skill_path, "r", encoding="utf-8") as f:
+        for line in f:
+            if not in_dont:
+                if line.startswith("##") and line[2:].strip().lower() == "don't":
+                    in_dont = True
+                continue
+            if line.startswith("## ") or line.startswith("##\t"):
+                break
+            section_lines.append(line)
+
+    return "".join(section_lines).strip()
+
+
 def load_dont_patterns_from_plugin(plugin_path: Path) -> list[str]:
     """Load and parse DON'T patterns from all skills in a plugin.
 
@@ -188,27 +434,39 @@ def load_dont_patterns_from_plugin(plugin_path: Path) -> list[str]:
         List of DON'T pattern strings and code examples.
     """
     cache_key = str(plugin_path)
-    if cache_key in _skills_cache:
-        return _skills_cache[cache_key]
-
     patterns: list[str] = []
     skills_dir = plugin_path / "skills"
 
-    if not skills_dir.exists():
+    validity_key = _skills_cache_key(skills_dir)
+    if validity_key is None:
+        # Missing or unreadable skills directory; nothing to cache.
         return patterns
 
-    for skill_file in skills_dir.glob("*.md"):
-        try:
-            content = skill_file.read_text()
-            dont_section = extract_dont_section(content)
-            if dont_section:
-                patterns.append(dont_section)
-                code_examples = extract_code_examples(dont_section)
-                patterns.extend(code_examples)
-        except IOError:
-            continue
-
-    _skills_cache[cache_key] = patterns
+    entry = _skills_cache.get(cache_key)
+    if entry is not None and entry[0] == validity_key:
+        return entry[1]
+
+    cached = _read_disk_cache(cache_key, validity_key)
+    if cached is not None:
+        _skills_cache[cache_key] = (validity_key, cached)
+        return cached
+
+    with os.scandir(skills_dir) as it:
+        for entry in it:
+            if not entry.name.endswith(".md") or not entry.is_file(follow_symlinks=False):
+                continue
+            try:
+                dont_section = _read_dont_section(entry.path)
+                if dont_section:
+                    patterns.append(dont_section)
+                    code_examples = extract_code_examples(dont_section)
+                    patterns.extend(code_examples)
+            except IOError:
+                continue
+
+    _write_disk_cache(cache_key, validity_key, patterns)
+
+    _skills_cache[cache_key] = (validity_key, patterns)
     return patterns
 
 
@@ -227,21 +485,21 @@ def check_content_against_patterns(
     Returns:
         ValidatorOutput with block decision if violation found, None otherwise.
     """
-    content_lower = content.lower()
-
-    violation_checks = [
-        (": any", "any type usage", "Use explicit types instead of 'any'."),
-        (": any =", "any type usage", "Use explicit types instead of 'any'."),
-        (": any;", "any type usage", "Use explicit types instead of 'any'."),
-        ("var ", "var keyword usage", "Use 'const' or 'let' instead of 'var'."),
-        ("eval(", "eval() usage", "Avoid using eval() for security reasons."),
-    ]
-
-    for check_pattern, violation_name, suggestion in violation_checks:
-        if check_pattern in content_lower:
-            for pattern in patterns:
-                pattern_lower = pattern.lower()
-                if check_pattern.replace(" ", "") in pattern_lower.replace(" ", ""):
+    if len(content) <= _LOWER_CHUNK_SIZE:
+        found_checks = _find_violation_checks(content.lower())
+    else:
+        # Scan lazily-lowered chunks so large files avoid a full copy.
+        found_checks = set()
+        for chunk in _iter_lowered_chunks(content, _MAX_CHECK_LEN - 1):
+            found_checks |= _find_violation_checks(chunk)
+
+    triples = _lowered_patterns(patterns)
+
+    for check_pattern, violation_name, suggestion in _VIOLATION_CHECKS:
+        if check_pattern in found_checks:
+            check_nospace = check_pattern.replace(" ", "")
+            for _, _, pattern_nospace in triples:
+                if check_nospace in pattern_nospace:
                     return {
                         "event": "PreToolUse",
                         "decision": "block",
@@ -249,8 +507,8 @@ def check_content_against_patterns(
                         "suggestion": suggestion,
                     }
 
-    for pattern in patterns:
-        if _pattern_matches_content(pattern, content):
+    for pattern, pattern_lower, _ in triples:
+        if _pattern_matches_content(pattern_lower, content):
             short_pattern = pattern[:100] + "..." if len(pattern) > 100 else pattern
             return {
                 "event": "PreToolUse",
@@ -262,27 +520,19 @@ def check_content_against_patterns(
     return None
 
 
-def _pattern_matches_content(pattern: str, content: str) -> bool:
+def _pattern_matches_content(pattern_lower: str, content: str) -> bool:
     """Check if a DON'T pattern matches the content.
 
     Args:
-        pattern: The DON'T pattern to check.
+        pattern_lower: The DON'T pattern to check, already lowercased.
         content: The content being validated.
 
     Returns:
         True if pattern indicates a violation in content.
     """
-    pattern_lower = pattern.lower()
-    content_lower = content.lower()
-
-    critical_patterns = [
-        ("single-letter variable", r"\bconst [a-z] ="),
-        ("hungarian notation", r"\b(str|arr|obj|int|bool)[A-Z]"),
-    ]
-
-    for pattern_name, regex_pattern in critical_patterns:
+    for pattern_name, compiled_pattern in _CRITICAL_PATTERNS:
         if pattern_name in pattern_lower:
-            if re.search(regex_pattern, content):
+            if compiled_pattern.search(content):
                 return True
 
     return False
@@ -303,20 +553,150 @@ def find_applicable_standards(
     Returns:
         List of (plugin_name, plugin_path) tuples for applicable standards.
     """
-    applicable: list[tuple[str, Path]] = []
+    file_name = file_path[file_path.rfind("/") + 1:]
+    standards_key = tuple(enabled_standards)
+    plugins_dir_str = str(plugins_dir)
+    validity_key = _standards_index_validity(standards_key, plugins_dir_str)
+    return list(
+        _applicable_for_file_name(
+            file_name, standards_key, plugins_dir_str, validity_key
+        )
+    )
+
+
+_SUFFIX_GLOB_RE = re.compile(r"^\*(\.[A-Za-z0-9_]+)$")
+
+_suffix_index_cache: dict[
+    tuple[tuple[str, ...], str],
+    tuple[
+        tuple,
+        tuple[dict[str, set[str]], list[tuple[str, re.Pattern]], dict[str, Path]],
+    ],
+] = {}
+
+
+def _standards_index_validity(
+    enabled_standards: tuple[str, ...],
+    plugins_dir: str,
+) -> tuple:
+    """Build an invalidation key from the plugins' standards.json files.
+
+    Recomputed per request so long-lived (--daemon) processes notice
+    edits, additions, and removals of standards.json without restart.
+
+    Args:
+        enabled_standards: Enabled standard plugin names.
+        plugins_dir: Path to the plugins directory.
 
+    Returns:
+        Tuple with one (mtime_ns, size) pair or None per plugin.
+    """
+    key = []
     for standard_name in enabled_standards:
-        plugin_path = plugins_dir / standard_name
+        try:
+            stat = os.stat(os.path.join(plugins_dir, standard_name, "standards.json"))
+            key.append((stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            key.append(None)
+    return tuple(key)
+
+
+def _get_standards_index(
+    enabled_standards: tuple[str, ...],
+    plugins_dir: str,
+    validity_key: tuple,
+) -> tuple[dict[str, set[str]], list[tuple[str, re.Pattern]], dict[str, Path]]:
+    """Build an inverted index from file suffix to plugins.
+
+    Simple `*.ext` patterns are expanded into a suffix lookup table;
+    any other pattern is kept as a per-plugin compiled fallback regex.
+    The index is rebuilt whenever the validity key changes.
+
+    Args:
+        enabled_standards: Enabled standard plugin names.
+        plugins_dir: Path to the plugins directory.
+        validity_key: Current standards.json invalidation key.
+
+    Returns:
+        Tuple of (suffix map, fallback regexes, existing plugin paths).
+    """
+    key = (enabled_standards, plugins_dir)
+    entry = _suffix_index_cache.get(key)
+    if entry is not None and entry[0] == validity_key:
+        return entry[1]
+
+    suffix_map: dict[str, set[str]] = {}
+    fallbacks: list[tuple[str, re.Pattern]] = []
+    plugin_paths: dict[str, Path] = {}
+
+    for standard_name in enabled_standards:
+        plugin_path = Path(plugins_dir) / standard_name
         if not plugin_path.exists():
             continue
 
-        standards_json = load_standards_json(plugin_path)
-        patterns = get_file_patterns(standards_json)
+        plugin_paths[standard_name] = plugin_path
+        patterns = get_file_patterns(load_standards_json(plugin_path))
+
+        other_patterns: list[str] = []
+        for pattern in patterns:
+            match = _SUFFIX_GLOB_RE.match(pattern)
+            if match:
+                suffix_map.setdefault(match.group(1), set()).add(standard_name)
+            else:
+                other_patterns.append(pattern)
+
+        if other_patterns:
+            fallbacks.append(
+                (standard_name, _compile_glob_patterns(other_patterns))
+            )
+
+    index = (suffix_map, fallbacks, plugin_paths)
+    _suffix_index_cache[key] = (validity_key, index)
+    return index
+
+
+@functools.lru_cache(maxsize=256)
+def _applicable_for_file_name(
+    file_name: str,
+    enabled_standards: tuple[str, ...],
+    plugins_dir: str,
+    validity_key: tuple,
+) -> tuple[tuple[str, Path], ...]:
+    """Memoized lookup of standards applicable to a file name.
+
+    Uses the inverted suffix index for `*.ext` patterns so the common
+    case is a single dict lookup, with fallback regexes covering
+    name-based patterns. Results keep the enabled-standards order.
+    The validity key is part of the memo key, so entries computed
+    against an outdated standards.json stop being served as soon as
+    the caller observes the change.
+
+    Args:
+        file_name: Base name of the file being edited/written.
+        enabled_standards: Enabled standard plugin names.
+        plugins_dir: Path to the plugins directory.
+        validity_key: Current standards.json invalidation key.
+
+    Returns:
+        Tuple of (plugin_name, plugin_path) pairs for applicable standards.
+    """
+    suffix_map, fallbacks, plugin_paths = _get_standards_index(
+        enabled_standards, plugins_dir, validity_key
+    )
+
+    dot = file_name.rfind(".")
+    suffix = file_name[dot:] if dot > 0 else ""
 
-        if file_matches_patterns(file_path, patterns):
-            applicable.append((standard_name, plugin_path))
+    matched = set(suffix_map.get(suffix, ()))
+    for standard_name, compiled in fallbacks:
+        if standard_name not in matched and compiled.match(file_name):
+            matched.add(standard_name)
 
-    return applicable
+    return tuple(
+        (standard_name, plugin_paths[standard_name])
+        for standard_name in enabled_standards
+        if standard_name in matched
+    )
 
 
 def validate_tool_use(input_data: ValidatorInput) -> ValidatorOutput:
@@ -372,26 +752,151 @@ def validate_tool_use(input_data: ValidatorInput) -> ValidatorOutput:
     return {"event": "PreToolUse", "decision": "allow"}
 
 
+def get_daemon_socket_path() -> Path:
+    """Return the Unix socket path used by the validator daemon.
+
+    Returns:
+        Socket path, overridable via RED64_STANDARDS_VALIDATOR_SOCKET.
+    """
+    override = os.environ.get("RED64_STANDARDS_VALIDATOR_SOCKET")
+    if override:
+        return Path(override)
+    return Path.home() / ".red64" / "standards-validator.sock"
+
+
+def _try_daemon(input_data: ValidatorInput) -> ValidatorOutput | None:
+    """Forward the request to a running validator daemon, if any.
+
+    Args:
+        input_data: Parsed PreToolUse hook input.
+
+    Returns:
+        Validator output from the daemon, or None if no daemon is
+        reachable (caller falls back to validating in-process).
+    """
+    socket_path = get_daemon_socket_path()
+    if not socket_path.exists():
+        return None
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(5.0)
+            client.connect(str(socket_path))
+            client.sendall(_dumps(input_data).encode() + b"\n")
+            chunks = []
+            while True:
+                chunk = client.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                if chunk.endswith(b"\n"):
+                    break
+        return _loads(b"".join(chunks))
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
 def main() -> int:
     """Main entry point for the standards validator hook.
 
-    Reads JSON input from stdin, validates against enabled standards,
-    and returns JSON output with decision.
+    Reads JSON input from stdin, forwards it to a running validator
+    daemon when one is available (see main_loop), and otherwise
+    validates in-process. Returns JSON output with decision.
 
     Returns:
         Exit code: 0 for success.
     """
     try:
-        input_data: ValidatorInput = json.load(sys.stdin)
+        input_data: ValidatorInput = _loads(sys.stdin.buffer.read())
     except json.JSONDecodeError:
         output: ValidatorOutput = {"event": "PreToolUse", "decision": "allow"}
-        print(json.dumps(output))
+        print(_dumps(output))
         return 0
 
-    output = validate_tool_use(input_data)
-    print(json.dumps(output))
+    output = _try_daemon(input_data)
+    if output is None:
+        output = validate_tool_use(input_data)
+    print(_dumps(output))
+    return 0
+
+
+def _handle_request_line(line: bytes) -> bytes:
+    """Validate one serialized request line.
+
+    Args:
+        line: One JSON-encoded hook input, without the trailing newline.
+
+    Returns:
+        Serialized response line, newline-terminated.
+    """
+    try:
+        input_data: ValidatorInput = _loads(line)
+    except json.JSONDecodeError:
+        output: ValidatorOutput = {"event": "PreToolUse", "decision": "allow"}
+    else:
+        output = validate_tool_use(input_data)
+    return _dumps(output).encode() + b"\n"
+
+
+def _handle_connection(connection: socket.socket) -> None:
+    """Process requests on an accepted connection until the client closes.
+
+    Args:
+        connection: Accepted client socket.
+    """
+    buffer = b""
+    while True:
+        chunk = connection.recv(65536)
+        if not chunk:
+            break
+        buffer += chunk
+        while b"\n" in buffer:
+            line, buffer = buffer.split(b"\n", 1)
+            if line.strip():
+                connection.sendall(_handle_request_line(line))
+
+
+def main_loop(socket_path: Path | None = None) -> int:
+    """Run as a persistent validator serving requests over a Unix socket.
+
+    One-shot hook invocations forward their request here whenever the
+    socket exists (see main), so the skills, regex, and config caches
+    stay warm across hook calls instead of being rebuilt per call.
+    Protocol matches context_loaderd: newline-terminated JSON requests,
+    answered in order with one JSON response line each.
+
+    Args:
+        socket_path: Socket to listen on; defaults to
+            get_daemon_socket_path().
+
+    Returns:
+        Exit code: 0 on clean shutdown.
+    """
+    if socket_path is None:
+        socket_path = get_daemon_socket_path()
+
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    if socket_path.exists():
+        socket_path.unlink()
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(str(socket_path))
+        server.listen()
+        try:
+            while True:
+                connection, _ = server.accept()
+                with connection:
+                    _handle_connection(connection)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if socket_path.exists():
+                socket_path.unlink()
+
     return 0
 
 
 if __name__ == "__main__":
+    if "--daemon" in sys.argv[1:]:
+        sys.exit(main_loop())
     sys.exit(main())
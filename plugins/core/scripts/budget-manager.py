@@ -11,6 +11,7 @@ Manages token budget allocation for context items, implementing:
 """
 
 import json
+import operator
 import sys
 from pathlib import Path
 from typing import TypedDict
@@ -49,6 +50,18 @@ class BudgetManagerOutput(TypedDict, total=False):
     exclusion_summary: str
 
 
+try:
+    import orjson
+
+    def _dumps(obj: object) -> str:
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    _dumps = json.dumps
+    _loads = json.loads
+
+
 CHARS_PER_TOKEN = 4
 
 
@@ -73,7 +86,11 @@ def sort_by_priority(items: list[ContextItem]) -> list[ContextItem]:
     Returns:
         Sorted list with highest priority (lowest number) first.
     """
-    return sorted(items, key=lambda x: x.get("priority", 999))
+    try:
+        # itemgetter avoids per-item lambda call overhead.
+        return sorted(items, key=operator.itemgetter("priority"))
+    except KeyError:
+        return sorted(items, key=lambda x: x.get("priority", 999))
 
 
 def truncate_content(content: str, max_tokens: int) -> str:
@@ -129,35 +146,53 @@ def manage_budget(
 
     sorted_items = sort_by_priority(context_items)
 
-    total_tokens = calculate_total_tokens(sorted_items)
-    if total_tokens <= max_tokens:
+    # Token counts are computed once per item; `>> 2` matches
+    # `// CHARS_PER_TOKEN` for non-negative lengths.
+    pairs = [(item, len(item["content"]) >> 2) for item in sorted_items]
+
+    # Early-exit the pre-scan as soon as the budget is known exceeded.
+    total_tokens = 0
+    for _, tokens in pairs:
+        total_tokens += tokens
+        if total_tokens > max_tokens:
+            break
+    else:
         return {"selected_items": sorted_items}
 
     can_truncate = overflow_behavior.get("truncate", True)
     can_exclude = overflow_behavior.get("exclude", True)
     show_summary = overflow_behavior.get("summary", True)
 
+    if not can_truncate and not can_exclude:
+        # Degenerate config: neither overflow tier is allowed, so take
+        # the longest priority-ordered prefix that fits the budget.
+        prefix_items: list[ContextItem] = []
+        used = 0
+        for item, item_tokens in pairs:
+            if used + item_tokens > max_tokens:
+                break
+            prefix_items.append(item)
+            used += item_tokens
+        return {"selected_items": prefix_items}
+
     selected_items: list[ContextItem] = []
     excluded_items: list[str] = []
     used_tokens = 0
 
-    for item in sorted_items:
-        item_tokens = estimate_tokens(item["content"])
-
+    for item, item_tokens in pairs:
         if used_tokens + item_tokens <= max_tokens:
-            selected_items.append(item.copy())
+            # Items are only copied when their content is mutated below.
+            selected_items.append(item)
             used_tokens += item_tokens
             continue
 
         remaining_budget = max_tokens - used_tokens
         if can_truncate and remaining_budget > 0:
             truncated_content = truncate_content(item["content"], remaining_budget)
-            truncated_tokens = estimate_tokens(truncated_content)
+            truncated_tokens = len(truncated_content) >> 2
 
             if truncated_tokens > 10:
-                truncated_item = item.copy()
-                truncated_item["content"] = truncated_content
-                selected_items.append(truncated_item)
+                selected_items.append(dict(item, content=truncated_content))
                 used_tokens += truncated_tokens
                 continue
 
@@ -166,10 +201,8 @@ def manage_budget(
         else:
             if remaining_budget > 0:
                 truncated_content = truncate_content(item["content"], remaining_budget)
-                truncated_item = item.copy()
-                truncated_item["content"] = truncated_content
-                selected_items.append(truncated_item)
-                used_tokens += estimate_tokens(truncated_content)
+                selected_items.append(dict(item, content=truncated_content))
+                used_tokens += len(truncated_content) >> 2
 
     output: BudgetManagerOutput = {"selected_items": selected_items}
 
@@ -192,7 +225,7 @@ def main() -> int:
         Exit code: 0 for success, 2 for blocking errors.
     """
     try:
-        input_data: BudgetManagerInput = json.load(sys.stdin)
+        input_data: BudgetManagerInput = _loads(sys.stdin.buffer.read())
         context_items = input_data.get("context_items", [])
         config_path = input_data.get("config_path")
 
@@ -208,7 +241,7 @@ def main() -> int:
                 pass
 
         output = manage_budget(context_items, max_tokens, overflow_behavior)
-        print(json.dumps(output))
+        print(_dumps(output))
         return 0
 
     except json.JSONDecodeError:
@@ -216,7 +249,7 @@ def main() -> int:
             "selected_items": [],
             "exclusion_summary": "Error: Invalid JSON input",
         }
-        print(json.dumps(error_output))
+        print(_dumps(error_output))
         return 2
 
     except Exception as e:
@@ -224,7 +257,7 @@ def main() -> int:
             "selected_items": [],
             "exclusion_summary": f"Error: {str(e)}",
         }
-        print(json.dumps(error_output))
+        print(_dumps(error_output))
         return 2
 
 
@@ -65,44 +65,50 @@ class Red64Config(TypedDict):
     standards: Standards
 
 
+_DEFAULT_CONFIG: Red64Config = {
+    "version": "1.0",
+    "token_budget": {
+        "max_tokens": 3000,
+        "overflow_behavior": {
+            "truncate": True,
+            "exclude": True,
+            "summary": True,
+        },
+    },
+    "context_loader": {
+        "enabled": True,
+        "task_detection": True,
+        "file_type_detection": True,
+    },
+    "priorities": {
+        "product_mission": 1,
+        "current_spec": 2,
+        "relevant_standards": 3,
+        "tech_stack": 4,
+        "roadmap": 5,
+    },
+    "features": {
+        "standards_injection": False,
+        "multi_agent": False,
+        "metrics": False,
+    },
+    "standards": {
+        "enabled": [],
+        "token_budget_priority": 3,
+    },
+}
+
+
 def get_default_config() -> Red64Config:
     """Return the default configuration for new Red64 projects.
 
+    The returned dict is a shared module-level template and must be
+    treated as read-only; merge code builds its result into new dicts.
+
     Returns:
         Red64Config with default values as per specification.
     """
-    return {
-        "version": "1.0",
-        "token_budget": {
-            "max_tokens": 3000,
-            "overflow_behavior": {
-                "truncate": True,
-                "exclude": True,
-                "summary": True,
-            },
-        },
-        "context_loader": {
-            "enabled": True,
-            "task_detection": True,
-            "file_type_detection": True,
-        },
-        "priorities": {
-            "product_mission": 1,
-            "current_spec": 2,
-            "relevant_standards": 3,
-            "tech_stack": 4,
-            "roadmap": 5,
-        },
-        "features": {
-            "standards_injection": False,
-            "multi_agent": False,
-            "metrics": False,
-        },
-        "standards": {
-            "enabled": [],
-            "token_budget_priority": 3,
-        },
-    }
+    return _DEFAULT_CONFIG
 
 
 SCHEMA_VERSION = "1.0"
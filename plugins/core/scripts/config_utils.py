@@ -3,10 +3,12 @@
 Provides functions to load, validate, and access Red64 configuration.
 """
 
+import hashlib
+import json
+import os
+import threading
 from pathlib import Path
-from typing import Any
-
-import yaml
+from typing import Any, Callable
 
 from config_schema import (
     Red64Config,
@@ -65,6 +67,137 @@ def find_config_path(start_path: str | Path | None = None) -> Path:
     )
 
 
+# Disk cache location; RED64_CACHE_DIR overrides it (the test suite
+# points it at a throwaway directory). Entries are one small JSON file
+# per distinct source path, rewritten in place on change, so growth is
+# bounded by the number of paths a machine has seen; stale entries can
+# be pruned by age (e.g. find -mtime -delete) without correctness
+# impact, since every read re-validates against the source file.
+CACHE_DIR = Path(os.environ.get("RED64_CACHE_DIR") or Path.home() / ".cache" / "red64")
+
+# Resolved once per process; sub-scripts all go through config_utils,
+# so they share one yaml import and one loader-class lookup.
+_yaml_parser: tuple[Any, Any] | None = None
+
+
+def _get_yaml_parser() -> tuple[Any, Any]:
+    """Return the yaml module and its fastest available safe loader.
+
+    Imported lazily so callers that never parse YAML skip the import
+    cost; prefers the C-extension loader over the pure-Python one.
+
+    Returns:
+        Tuple of (yaml module, loader class).
+    """
+    global _yaml_parser
+    if _yaml_parser is None:
+        import yaml
+
+        try:
+            from yaml import CSafeLoader as loader
+        except ImportError:
+            from yaml import SafeLoader as loader
+
+        _yaml_parser = (yaml, loader)
+    return _yaml_parser
+
+# In-process config cache keyed by path, invalidated on stat signature
+# change. Cached configs are shared; callers must treat them as read-only.
+_config_cache: dict[str, tuple[tuple[int, int, int], "Red64Config"]] = {}
+_config_cache_lock = threading.Lock()
+
+
+def _cache_file_for(key: str) -> Path:
+    """Return the on-disk cache file path for a cache key.
+
+    Args:
+        key: Logical cache key (e.g. the source file path).
+
+    Returns:
+        Path under the red64 cache directory, named by key hash.
+    """
+    digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+    return CACHE_DIR / f"{digest}.json"
+
+
+def _cached(source_path: Path, loader_fn: Callable[[], Any]) -> Any:
+    """Load JSON-serializable data through an mtime-keyed disk cache.
+
+    Stores the loader result under ~/.cache/red64/ keyed by the source
+    path, and invalidates when the source file's mtime or size changes.
+    Cache failures are silently ignored; the loader is the source of truth.
+
+    Args:
+        source_path: File whose mtime/size key the cached data.
+        loader_fn: Zero-argument callable producing the data on cache miss.
+
+    Returns:
+        Cached or freshly loaded data.
+    """
+    try:
+        stat = source_path.stat()
+        key = (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        return loader_fn()
+
+    cache_file = _cache_file_for(str(source_path))
+    try:
+        with open(cache_file) as f:
+            entry = json.load(f)
+        if entry.get("key") == list(key):
+            return entry["data"]
+    except (OSError, json.JSONDecodeError, KeyError):
+        pass
+
+    data = loader_fn()
+
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(".tmp")
+        try:
+            with open(tmp_file, "w") as f:
+                json.dump({"key": list(key), "data": data}, f)
+        except (TypeError, ValueError):
+            # YAML-native values (dates, etc.) are not JSON serializable;
+            # serve the data uncached instead of failing the load.
+            tmp_file.unlink(missing_ok=True)
+            return data
+        tmp_file.replace(cache_file)
+    except OSError:
+        pass
+
+    return data
+
+
+def parse_config_text(text: str) -> Red64Config:
+    """Parse config YAML text and merge it with defaults.
+
+    Args:
+        text: Raw YAML content of a config file.
+
+    Returns:
+        Validated Red64Config object.
+
+    Raises:
+        ConfigMalformedError: If the text is invalid YAML, empty, or
+            not a mapping.
+    """
+    yaml, loader = _get_yaml_parser()
+
+    try:
+        config_data = yaml.load(text, Loader=loader)
+    except yaml.YAMLError as e:
+        raise ConfigMalformedError(f"Invalid YAML in config file: {e}")
+
+    if config_data is None:
+        raise ConfigMalformedError("Config file is empty.")
+
+    if not isinstance(config_data, dict):
+        raise ConfigMalformedError("Config file must contain a YAML mapping.")
+
+    return merge_with_defaults(config_data)
+
+
 def load_config(config_path: str | Path) -> Red64Config:
     """Load and validate configuration from the specified path.
 
@@ -80,24 +213,31 @@ def load_config(config_path: str | Path) -> Red64Config:
     """
     path = Path(config_path)
 
-    if not path.exists():
+    try:
+        stat = path.stat()
+    except OSError:
         raise ConfigNotFoundError(
             f"Config not found at {config_path}. Run /red64:init to initialize."
         )
 
-    try:
+    signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    cache_key = str(path)
+
+    with _config_cache_lock:
+        entry = _config_cache.get(cache_key)
+        if entry is not None and entry[0] == signature:
+            return entry[1]
+
+    def parse_and_merge() -> Red64Config:
         with open(path) as f:
-            config_data = yaml.safe_load(f)
-    except yaml.YAMLError as e:
-        raise ConfigMalformedError(f"Invalid YAML in config file: {e}")
+            return parse_config_text(f.read())
 
-    if config_data is None:
-        raise ConfigMalformedError("Config file is empty.")
+    config = _cached(path, parse_and_merge)
 
-    if not isinstance(config_data, dict):
-        raise ConfigMalformedError("Config file must contain a YAML mapping.")
+    with _config_cache_lock:
+        _config_cache[cache_key] = (signature, config)
 
-    return merge_with_defaults(config_data)
+    return config
 
 
 def merge_with_defaults(config_data: dict[str, Any]) -> Red64Config:
@@ -109,99 +249,33 @@ def merge_with_defaults(config_data: dict[str, Any]) -> Red64Config:
     Returns:
         Complete Red64Config with defaults applied.
     """
-    defaults = get_default_config()
+    return _deep_merge(get_default_config(), config_data)  # type: ignore[return-value]
 
-    merged: dict[str, Any] = {}
 
-    merged["version"] = config_data.get("version", defaults["version"])
-
-    if "token_budget" in config_data:
-        token_budget = config_data["token_budget"]
-        merged["token_budget"] = {
-            "max_tokens": token_budget.get(
-                "max_tokens", defaults["token_budget"]["max_tokens"]
-            ),
-            "overflow_behavior": {
-                "truncate": token_budget.get("overflow_behavior", {}).get(
-                    "truncate",
-                    defaults["token_budget"]["overflow_behavior"]["truncate"],
-                ),
-                "exclude": token_budget.get("overflow_behavior", {}).get(
-                    "exclude",
-                    defaults["token_budget"]["overflow_behavior"]["exclude"],
-                ),
-                "summary": token_budget.get("overflow_behavior", {}).get(
-                    "summary",
-                    defaults["token_budget"]["overflow_behavior"]["summary"],
-                ),
-            },
-        }
-    else:
-        merged["token_budget"] = defaults["token_budget"]
-
-    if "context_loader" in config_data:
-        context_loader = config_data["context_loader"]
-        merged["context_loader"] = {
-            "enabled": context_loader.get(
-                "enabled", defaults["context_loader"]["enabled"]
-            ),
-            "task_detection": context_loader.get(
-                "task_detection", defaults["context_loader"]["task_detection"]
-            ),
-            "file_type_detection": context_loader.get(
-                "file_type_detection",
-                defaults["context_loader"]["file_type_detection"],
-            ),
-        }
-    else:
-        merged["context_loader"] = defaults["context_loader"]
-
-    if "priorities" in config_data:
-        priorities = config_data["priorities"]
-        merged["priorities"] = {
-            "product_mission": priorities.get(
-                "product_mission", defaults["priorities"]["product_mission"]
-            ),
-            "current_spec": priorities.get(
-                "current_spec", defaults["priorities"]["current_spec"]
-            ),
-            "relevant_standards": priorities.get(
-                "relevant_standards", defaults["priorities"]["relevant_standards"]
-            ),
-            "tech_stack": priorities.get(
-                "tech_stack", defaults["priorities"]["tech_stack"]
-            ),
-            "roadmap": priorities.get("roadmap", defaults["priorities"]["roadmap"]),
-        }
-    else:
-        merged["priorities"] = defaults["priorities"]
-
-    if "features" in config_data:
-        features = config_data["features"]
-        merged["features"] = {
-            "standards_injection": features.get(
-                "standards_injection", defaults["features"]["standards_injection"]
-            ),
-            "multi_agent": features.get(
-                "multi_agent", defaults["features"]["multi_agent"]
-            ),
-            "metrics": features.get("metrics", defaults["features"]["metrics"]),
-        }
-    else:
-        merged["features"] = defaults["features"]
-
-    if "standards" in config_data:
-        standards = config_data["standards"]
-        merged["standards"] = {
-            "enabled": standards.get("enabled", defaults["standards"]["enabled"]),
-            "token_budget_priority": standards.get(
-                "token_budget_priority", defaults["standards"]["token_budget_priority"]
-            ),
-        }
-    else:
-        merged["standards"] = defaults["standards"]
+def _deep_merge(defaults: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
+    """Recursively merge override values onto the default template.
 
-    return merged  # type: ignore[return-value]
+    The default config acts as the schema: only keys present in the
+    defaults are kept, nested sections are merged per leaf, and
+    non-mapping override values for mapping sections are ignored.
+
+    Args:
+        defaults: Default values defining the expected structure.
+        override: Partially loaded configuration values.
+
+    Returns:
+        New dict with defaults applied for missing fields.
+    """
+    merged: dict[str, Any] = {}
+    for key, default_value in defaults.items():
+        if isinstance(default_value, dict):
+            override_value = override.get(key)
+            if not isinstance(override_value, dict):
+                override_value = {}
+            merged[key] = _deep_merge(default_value, override_value)
+        else:
+            merged[key] = override.get(key, default_value)
+    return merged
 
 
 def get_token_budget(config: Red64Config) -> int:
@@ -7,10 +7,14 @@ file detection, standards loading, budget management, and product context,
 then returns structured context.
 """
 
+import importlib.util
 import json
-import subprocess
+import os
+import socket
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import ModuleType
 from typing import TypedDict
 
 sys.path.insert(0, str(Path(__file__).parent))
@@ -18,9 +22,12 @@ sys.path.insert(0, str(Path(__file__).parent))
 from config_utils import (
     find_config_path,
     load_config,
+    get_token_budget,
+    get_overflow_behavior,
     ConfigNotFoundError,
     ConfigMalformedError,
 )
+from config_schema import DEFAULT_MAX_TOKENS
 
 
 class HookInput(TypedDict):
@@ -87,66 +94,95 @@ class HookOutput(TypedDict):
     hookSpecificOutput: dict
 
 
+try:
+    import orjson
+
+    def _dumps(obj: object) -> str:
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    _dumps = json.dumps
+    _loads = json.loads
+
+
 SCRIPTS_DIR = Path(__file__).parent
 
 
-def run_sub_script(script_name: str, input_data: dict) -> dict:
-    """Run a sub-script and capture its JSON output.
+def _load_script_module(script_name: str) -> ModuleType:
+    """Import a sibling script as a module, once per process.
+
+    The sub-scripts keep their hyphenated file names and CLI entry
+    points for standalone use; the hook path imports them in-process
+    to avoid one interpreter startup per pipeline stage.
 
     Args:
         script_name: Name of the script file (e.g., 'task-detector.py').
-        input_data: Dictionary to pass as JSON input via stdin.
 
     Returns:
-        Parsed JSON output from the script.
+        The imported module.
 
     Raises:
-        RuntimeError: If script fails or returns invalid JSON.
+        RuntimeError: If the module cannot be loaded.
     """
-    script_path = SCRIPTS_DIR / script_name
-
-    result = subprocess.run(
-        [sys.executable, str(script_path)],
-        input=json.dumps(input_data),
-        capture_output=True,
-        text=True,
-    )
-
-    if result.returncode != 0 and result.returncode != 2:
-        raise RuntimeError(f"Script {script_name} failed: {result.stderr}")
-
-    try:
-        return json.loads(result.stdout)
-    except json.JSONDecodeError as e:
-        raise RuntimeError(f"Script {script_name} returned invalid JSON: {e}")
+    module_name = script_name[:-3].replace("-", "_")
+    module = sys.modules.get(module_name)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(
+            module_name, SCRIPTS_DIR / script_name
+        )
+        if spec is None or spec.loader is None:
+            raise RuntimeError(f"Cannot load script {script_name}")
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+    return module
 
 
 def detect_task(prompt: str) -> TaskDetectorOutput:
-    """Run task-detector.py to classify the user prompt.
+    """Classify the user prompt via the task-detector module.
 
     Args:
         prompt: The user prompt to analyze.
 
     Returns:
         TaskDetectorOutput with detected task_type.
+
+    Raises:
+        RuntimeError: If task detection fails.
     """
-    return run_sub_script("task-detector.py", {"prompt": prompt})
+    try:
+        task_detector = _load_script_module("task-detector.py")
+        return {"task_type": task_detector.detect_task_type(prompt)}
+    except RuntimeError:
+        raise
+    except Exception as e:
+        raise RuntimeError(f"Script task-detector.py failed: {e}")
 
 
 def detect_files(prompt: str) -> FileDetectorOutput:
-    """Run file-detector.py to identify file types in the prompt.
+    """Identify file types in the prompt via the file-detector module.
 
     Args:
         prompt: The user prompt to analyze.
 
     Returns:
         FileDetectorOutput with list of detected file_types.
+
+    Raises:
+        RuntimeError: If file detection fails.
     """
-    return run_sub_script("file-detector.py", {"prompt": prompt})
+    try:
+        file_detector = _load_script_module("file-detector.py")
+        return {"file_types": file_detector.detect_file_types(prompt)}
+    except RuntimeError:
+        raise
+    except Exception as e:
+        raise RuntimeError(f"Script file-detector.py failed: {e}")
 
 
 def load_standards(file_types: list[str], cwd: str) -> StandardsLoaderOutput:
-    """Run standards-loader.py to load applicable standards skills.
+    """Load applicable standards skills via the standards-loader module.
 
     Args:
         file_types: List of detected file types from the prompt.
@@ -154,21 +190,24 @@ def load_standards(file_types: list[str], cwd: str) -> StandardsLoaderOutput:
 
     Returns:
         StandardsLoaderOutput with matched standards and skills.
+
+    Raises:
+        RuntimeError: If standards loading fails.
     """
-    return run_sub_script(
-        "standards-loader.py",
-        {
-            "file_types": file_types,
-            "cwd": cwd,
-        },
-    )
+    try:
+        standards_loader = _load_script_module("standards-loader.py")
+        return standards_loader.load_standards_for_file_types(file_types, cwd)
+    except RuntimeError:
+        raise
+    except Exception as e:
+        raise RuntimeError(f"Script standards-loader.py failed: {e}")
 
 
 def manage_budget(
     context_items: list[dict],
     config_path: str,
 ) -> BudgetManagerOutput:
-    """Run budget-manager.py to manage token budget for context items.
+    """Manage token budget for context items via the budget-manager module.
 
     Args:
         context_items: List of context items with name, content, priority.
@@ -176,18 +215,35 @@ def manage_budget(
 
     Returns:
         BudgetManagerOutput with selected_items and optional exclusion_summary.
+
+    Raises:
+        RuntimeError: If budget management fails.
     """
-    return run_sub_script(
-        "budget-manager.py",
-        {
-            "context_items": context_items,
-            "config_path": config_path,
-        },
-    )
+    try:
+        budget_manager = _load_script_module("budget-manager.py")
+
+        max_tokens = DEFAULT_MAX_TOKENS
+        overflow_behavior = {"truncate": True, "exclude": True, "summary": True}
+
+        if config_path:
+            try:
+                config = load_config(config_path)
+                max_tokens = get_token_budget(config)
+                overflow_behavior = get_overflow_behavior(config)
+            except (ConfigNotFoundError, ConfigMalformedError):
+                pass
+
+        return budget_manager.manage_budget(
+            context_items, max_tokens, overflow_behavior
+        )
+    except RuntimeError:
+        raise
+    except Exception as e:
+        raise RuntimeError(f"Script budget-manager.py failed: {e}")
 
 
 def get_product_context(cwd: str) -> str | None:
-    """Run product-context.py to get product context.
+    """Get product context via the product-context module.
 
     Args:
         cwd: Current working directory.
@@ -196,12 +252,16 @@ def get_product_context(cwd: str) -> str | None:
         Product context string or None if unavailable.
     """
     try:
-        result = run_sub_script("product-context.py", {"cwd": cwd})
-        product_context = result.get("product_context", "")
+        product_context_module = _load_script_module("product-context.py")
+        mission_lite = product_context_module.get_mission_lite(cwd)
+        current_item = product_context_module.get_current_item(cwd)
+        product_context = product_context_module.format_product_context(
+            mission_lite, current_item
+        )
         if product_context and "No product context available" not in product_context:
             return product_context
         return None
-    except RuntimeError:
+    except Exception:
         return None
 
 
@@ -229,11 +289,7 @@ def create_standards_context_items(
         plugin_name = standard.get("plugin_name", "unknown")
         skills = standard.get("skills", [])
 
-        skill_contents: list[str] = []
-        for skill in skills:
-            skill_contents.append(skill.get("content", ""))
-
-        combined_content = "\n\n".join(skill_contents)
+        combined_content = "\n\n".join(skill.get("content", "") for skill in skills)
         if combined_content:
             adjusted_priority = token_budget_priority + (idx / (total_standards + 1))
             context_items.append({
@@ -258,7 +314,6 @@ def format_standards_context(
     Returns:
         Formatted string with standards headers and content.
     """
-    lines: list[str] = []
     standards = standards_result.get("standards", [])
 
     if not standards:
@@ -266,11 +321,13 @@ def format_standards_context(
 
     selected_names = {item.get("name", "") for item in selected_items}
 
+    # One block string per standard joined once at the end, instead of
+    # two list appends per skill plus a line-level join.
+    blocks: list[str] = []
+
     precedence_note = standards_result.get("precedence_note")
     if precedence_note:
-        lines.append("")
-        lines.append(f"*Note: {precedence_note}*")
-        lines.append("")
+        blocks.append(f"*Note: {precedence_note}*")
 
     for standard in standards:
         plugin_name = standard.get("plugin_name", "unknown")
@@ -283,16 +340,15 @@ def format_standards_context(
         if not skills:
             continue
 
-        lines.append(f"## Standards: {plugin_name}")
-        lines.append("")
-
-        for skill in skills:
-            content = skill.get("content", "")
-            if content:
-                lines.append(content)
-                lines.append("")
+        block = f"## Standards: {plugin_name}"
+        contents = "\n\n".join(
+            content for skill in skills if (content := skill.get("content", ""))
+        )
+        if contents:
+            block = f"{block}\n\n{contents}"
+        blocks.append(block)
 
-    return "\n".join(lines).strip()
+    return "\n\n".join(blocks).strip()
 
 
 def format_additional_context(
@@ -338,6 +394,17 @@ def format_additional_context(
     return "\n".join(lines)
 
 
+def _emit(output: object) -> None:
+    """Write one JSON line to stdout, bypassing the print machinery.
+
+    Args:
+        output: JSON-serializable hook output.
+    """
+    sys.stdout.write(_dumps(output))
+    sys.stdout.write("\n")
+    sys.stdout.flush()
+
+
 def create_error_output(message: str) -> HookOutput:
     """Create a hook output for error conditions.
 
@@ -372,30 +439,19 @@ def create_success_output(additional_context: str) -> HookOutput:
     }
 
 
-def main() -> int:
-    """Main entry point for the context loader hook.
+def process_hook_input(input_data: HookInput) -> tuple[HookOutput, int]:
+    """Run the context loading pipeline for one hook request.
 
-    Orchestrates the context loading pipeline:
-    1. Read and validate JSON input from stdin
-    2. Validate .red64/config.yaml presence and format
-    3. Chain to sub-scripts for task/file detection
-    4. Load applicable standards based on detected file types
-    5. Manage token budget with standards included
-    6. Get product context from product-context.py
-    7. Return structured JSON with hookSpecificOutput.additionalContext
+    Orchestrates config validation, task/file detection, standards
+    loading, budget management, and product context, independent of
+    how the request arrived (stdin one-shot or daemon socket).
+
+    Args:
+        input_data: Parsed UserPromptSubmit hook input.
 
     Returns:
-        Exit code: 0 for success, 2 for blocking errors.
+        Tuple of (hook output, exit code).
     """
-    try:
-        input_data: HookInput = json.load(sys.stdin)
-    except json.JSONDecodeError:
-        output = create_error_output(
-            "Error: Invalid JSON input. Please run /red64:init to set up your project."
-        )
-        print(json.dumps(output))
-        return 2
-
     prompt = input_data.get("prompt", "")
     cwd = input_data.get("cwd", "")
 
@@ -403,56 +459,71 @@ def main() -> int:
         config_path = find_config_path(cwd)
         config = load_config(config_path)
     except ConfigNotFoundError:
-        output = create_error_output(
+        return create_error_output(
             "Error: Red64 configuration not found. "
             "Please run /red64:init to initialize your project."
-        )
-        print(json.dumps(output))
-        return 2
+        ), 2
     except ConfigMalformedError as e:
-        output = create_error_output(
+        return create_error_output(
             f"Error: Red64 configuration is malformed. {str(e)} "
             "Please run /red64:init to reinitialize your project."
-        )
-        print(json.dumps(output))
-        return 2
-
-    try:
-        task_result = detect_task(prompt)
-        task_type = task_result.get("task_type", "unknown")
-    except RuntimeError:
-        task_type = "unknown"
-
-    try:
-        file_result = detect_files(prompt)
-        file_types = file_result.get("file_types", [])
-    except RuntimeError:
-        file_types = []
+        ), 2
 
-    standards_result: StandardsLoaderOutput = {"standards": []}
-    standards_context_items: list[dict] = []
-    token_budget_priority = config.get("standards", {}).get("token_budget_priority", 3)
+    # Task detection, file detection, and product context are mutually
+    # independent, so they run concurrently; standards loading and budget
+    # management depend on the detected file types and stay sequential.
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        task_future = executor.submit(detect_task, prompt)
+        file_future = executor.submit(detect_files, prompt)
+        product_future = executor.submit(get_product_context, cwd)
 
-    if file_types:
         try:
-            standards_result = load_standards(file_types, cwd)
-            standards_context_items = create_standards_context_items(
-                standards_result, token_budget_priority
-            )
+            task_type = task_future.result().get("task_type", "unknown")
         except RuntimeError:
-            pass
+            task_type = "unknown"
 
-    context_items: list[dict] = standards_context_items
+        try:
+            file_types = file_future.result().get("file_types", [])
+        except RuntimeError:
+            file_types = []
 
-    try:
-        budget_result = manage_budget(context_items, str(config_path))
-    except RuntimeError:
-        budget_result = {"selected_items": context_items}
+        standards_result: StandardsLoaderOutput = {"standards": []}
+        standards_context_items: list[dict] = []
+        token_budget_priority = config.get("standards", {}).get(
+            "token_budget_priority", 3
+        )
 
-    selected_items = budget_result.get("selected_items", [])
-    standards_context = format_standards_context(standards_result, selected_items)
+        if file_types:
+            try:
+                standards_result = load_standards(file_types, cwd)
+                standards_context_items = create_standards_context_items(
+                    standards_result, token_budget_priority
+                )
+            except RuntimeError:
+                pass
+
+        context_items: list[dict] = standards_context_items
+
+        # No context items means the budget outcome is already known;
+        # skip the budget stage entirely rather than running it on [].
+        if context_items:
+            try:
+                budget_result = manage_budget(context_items, str(config_path))
+            except RuntimeError:
+                budget_result = {"selected_items": context_items}
+        else:
+            budget_result = {"selected_items": []}
+
+        selected_items = budget_result.get("selected_items", [])
+
+        if standards_result.get("standards"):
+            standards_context = format_standards_context(
+                standards_result, selected_items
+            )
+        else:
+            standards_context = ""
 
-    product_context = get_product_context(cwd)
+        product_context = product_future.result()
 
     additional_context = format_additional_context(
         task_type,
@@ -462,9 +533,83 @@ def main() -> int:
         standards_context,
     )
 
-    output = create_success_output(additional_context)
-    print(json.dumps(output))
-    return 0
+    return create_success_output(additional_context), 0
+
+
+def get_daemon_socket_path() -> Path:
+    """Return the Unix socket path used by the context loader daemon.
+
+    Returns:
+        Socket path, overridable via RED64_CONTEXT_LOADER_SOCKET.
+    """
+    override = os.environ.get("RED64_CONTEXT_LOADER_SOCKET")
+    if override:
+        return Path(override)
+    return Path.home() / ".red64" / "context-loader.sock"
+
+
+def _try_daemon(input_data: HookInput) -> tuple[HookOutput, int] | None:
+    """Forward the request to a running context loader daemon, if any.
+
+    Args:
+        input_data: Parsed UserPromptSubmit hook input.
+
+    Returns:
+        Tuple of (hook output, exit code) from the daemon, or None if
+        no daemon is reachable (caller falls back to in-process).
+    """
+    socket_path = get_daemon_socket_path()
+    if not socket_path.exists():
+        return None
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(5.0)
+            client.connect(str(socket_path))
+            client.sendall(_dumps(input_data).encode() + b"\n")
+            chunks = []
+            while True:
+                chunk = client.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                if chunk.endswith(b"\n"):
+                    break
+        response = _loads(b"".join(chunks))
+        return response["output"], response.get("exit_code", 0)
+    except (OSError, json.JSONDecodeError, KeyError):
+        return None
+
+
+def main() -> int:
+    """Main entry point for the context loader hook.
+
+    Reads JSON input from stdin, forwards it to a running context
+    loader daemon when one is available (see context_loaderd.py), and
+    otherwise runs the pipeline in-process.
+
+    Returns:
+        Exit code: 0 for success, 2 for blocking errors.
+    """
+    try:
+        # One raw read of the full (small) payload; no TextIOWrapper
+        # decode pass. Empty stdin is treated as an empty request.
+        data = sys.stdin.buffer.read()
+        input_data: HookInput = _loads(data) if data else {}
+    except json.JSONDecodeError:
+        output = create_error_output(
+            "Error: Invalid JSON input. Please run /red64:init to set up your project."
+        )
+        _emit(output)
+        return 2
+
+    result = _try_daemon(input_data)
+    if result is None:
+        result = process_hook_input(input_data)
+
+    output, exit_code = result
+    _emit(output)
+    return exit_code
 
 
 if __name__ == "__main__":
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Persistent context loader daemon for UserPromptSubmit hooks.
+
+Serves the context loading pipeline over a Unix domain socket so the
+interpreter startup, module imports, and config/YAML parsing are paid
+once instead of on every prompt. The hook entry (context-loader.py)
+forwards requests to this daemon when the socket exists and falls back
+to running in-process otherwise.
+
+Protocol: one or more newline-terminated JSON requests per connection;
+each is answered in order with `{"output": <hook output>, "exit_code":
+<int>}` plus a trailing newline. Batch clients can pipeline several
+requests over a single connection to amortize the connect cost.
+"""
+
+import importlib.util
+import json
+import socket
+import sys
+from pathlib import Path
+from types import ModuleType
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+try:
+    import orjson
+
+    def _dumps(obj: object) -> str:
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    _dumps = json.dumps
+    _loads = json.loads
+
+
+def _load_context_loader() -> ModuleType:
+    """Import the hyphenated context-loader script as a module.
+
+    Returns:
+        The imported context_loader module.
+    """
+    module = sys.modules.get("context_loader")
+    if module is None:
+        spec = importlib.util.spec_from_file_location(
+            "context_loader", Path(__file__).parent / "context-loader.py"
+        )
+        module = importlib.util.module_from_spec(spec)
+        sys.modules["context_loader"] = module
+        spec.loader.exec_module(module)
+    return module
+
+
+def _handle_request(line: bytes, context_loader: ModuleType) -> bytes:
+    """Run the pipeline for one serialized request line.
+
+    Args:
+        line: One JSON-encoded hook input, without the trailing newline.
+        context_loader: Imported context loader module.
+
+    Returns:
+        Serialized response line, newline-terminated.
+    """
+    try:
+        input_data = _loads(line)
+        output, exit_code = context_loader.process_hook_input(input_data)
+    except Exception as e:
+        output = context_loader.create_error_output(f"Error: {str(e)}")
+        exit_code = 2
+
+    response = {"output": output, "exit_code": exit_code}
+    return _dumps(response).encode() + b"\n"
+
+
+def _handle_connection(connection: socket.socket, context_loader: ModuleType) -> None:
+    """Process requests on an accepted connection until the client closes.
+
+    Args:
+        connection: Accepted client socket.
+        context_loader: Imported context loader module.
+    """
+    buffer = b""
+    while True:
+        chunk = connection.recv(65536)
+        if not chunk:
+            break
+        buffer += chunk
+        while b"\n" in buffer:
+            line, buffer = buffer.split(b"\n", 1)
+            if line.strip():
+                connection.sendall(_handle_request(line, context_loader))
+
+
+def serve(socket_path: Path | None = None) -> int:
+    """Run the daemon accept loop until interrupted.
+
+    Args:
+        socket_path: Socket to listen on; defaults to the path used by
+            context-loader.py (RED64_CONTEXT_LOADER_SOCKET or
+            ~/.red64/context-loader.sock).
+
+    Returns:
+        Exit code: 0 on clean shutdown.
+    """
+    context_loader = _load_context_loader()
+
+    if socket_path is None:
+        socket_path = context_loader.get_daemon_socket_path()
+
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    if socket_path.exists():
+        socket_path.unlink()
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(str(socket_path))
+        server.listen()
+        try:
+            while True:
+                connection, _ = server.accept()
+                with connection:
+                    _handle_connection(connection, context_loader)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if socket_path.exists():
+                socket_path.unlink()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(serve())
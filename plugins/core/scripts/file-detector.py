@@ -5,6 +5,7 @@ Detects file extensions, explicit filenames, and path references from
 user prompts to help determine relevant context for the context loader.
 """
 
+import functools
 import json
 import re
 import sys
@@ -23,6 +24,18 @@ class FileDetectorOutput(TypedDict):
     file_types: list[str]
 
 
+try:
+    import orjson
+
+    def _dumps(obj: object) -> str:
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    _dumps = json.dumps
+    _loads = json.loads
+
+
 EXTENSION_KEYWORDS: dict[str, list[str]] = {
     ".py": ["python", "py", ".py"],
     ".ts": ["typescript", "ts", ".ts"],
@@ -34,6 +47,55 @@ EXTENSION_KEYWORDS: dict[str, list[str]] = {
     ".css": ["css", ".css"],
 }
 
+try:
+    import ahocorasick
+
+    _KEYWORD_AC = ahocorasick.Automaton()
+    for _extension, _keywords in EXTENSION_KEYWORDS.items():
+        for _keyword in _keywords:
+            _KEYWORD_AC.add_word(_keyword, _extension)
+    _KEYWORD_AC.make_automaton()
+except ImportError:
+    _KEYWORD_AC = None
+
+
+def _build_keyword_regex() -> tuple[re.Pattern, dict[str, list[str]]]:
+    """Build the single-scan keyword regex and its extension mapping.
+
+    The lookahead alternation reports a keyword at every start position
+    (zero-width matches advance one character), so overlapping keywords
+    are still found; keywords nested at the same start position (e.g.
+    'js' within 'json') are recovered via the prefix expansion map.
+
+    Returns:
+        Tuple of (compiled lookahead pattern, keyword -> extensions map).
+    """
+    keywords = sorted(
+        {kw for kws in EXTENSION_KEYWORDS.values() for kw in kws},
+        key=len,
+        reverse=True,
+    )
+    pattern = re.compile(
+        "(?=(" + "|".join(re.escape(keyword) for keyword in keywords) + "))",
+        re.IGNORECASE,
+    )
+
+    keyword_to_extensions: dict[str, list[str]] = {}
+    for keyword in keywords:
+        extensions: list[str] = []
+        for extension, kws in EXTENSION_KEYWORDS.items():
+            if any(keyword.startswith(kw) for kw in kws):
+                extensions.append(extension)
+        keyword_to_extensions[keyword] = extensions
+    return pattern, keyword_to_extensions
+
+
+_KEYWORD_RE, _KEYWORD_TO_EXTENSIONS = _build_keyword_regex()
+
+# Detection scans at most this many characters, bounding worst-case
+# regex cost on adversarially long prompts.
+MAX_PROMPT_LENGTH = 32_768
+
 FILENAME_PATTERN = re.compile(
     r"\b([a-zA-Z0-9_-]+\.(?:py|ts|js|md|yaml|yml|json|html|css))\b"
 )
@@ -42,6 +104,43 @@ PATH_PATTERN = re.compile(
     r"\b([a-zA-Z0-9_.-]+(?:/[a-zA-Z0-9_.-]+)+/?)\b"
 )
 
+COMBINED_PATTERN = re.compile(
+    r"(?P<path>\b[a-zA-Z0-9_.-]+(?:/[a-zA-Z0-9_.-]+)+/?\b)"
+    r"|(?P<file>\b[a-zA-Z0-9_-]+\.(?:py|ts|js|md|yaml|yml|json|html|css)\b)"
+)
+
+
+def _scan_filenames_and_paths(prompt: str) -> tuple[list[str], list[str]]:
+    """Scan the prompt once for explicit filenames and path references.
+
+    Fuses FILENAME_PATTERN and PATH_PATTERN into a single traversal;
+    filenames embedded in matched paths are still reported, matching
+    the behavior of the two independent scans.
+
+    Args:
+        prompt: The user prompt to analyze.
+
+    Returns:
+        Tuple of (filenames, normalized path references).
+    """
+    # dicts dedup in insertion order, keeping the output deterministic
+    # for downstream caches (unlike the previous throwaway sets).
+    filenames: dict[str, None] = {}
+    paths: dict[str, None] = {}
+
+    for match in COMBINED_PATTERN.finditer(prompt):
+        if match.lastgroup == "file":
+            filenames[match.group()] = None
+        else:
+            matched_path = match.group()
+            for filename in FILENAME_PATTERN.findall(matched_path):
+                filenames[filename] = None
+            path = matched_path if matched_path.endswith("/") else matched_path + "/"
+            if any(c.isalpha() for c in matched_path.split("/")[0]):
+                paths[path] = None
+
+    return list(filenames), list(paths)
+
 
 def detect_extensions_from_keywords(prompt: str) -> list[str]:
     """Detect file extensions based on language/type keywords in prompt.
@@ -52,17 +151,20 @@ def detect_extensions_from_keywords(prompt: str) -> list[str]:
     Returns:
         List of detected file extensions.
     """
-    prompt_lower = prompt.lower()
-    detected: list[str] = []
-
-    for extension, keywords in EXTENSION_KEYWORDS.items():
-        for keyword in keywords:
-            if keyword in prompt_lower:
-                if extension not in detected:
-                    detected.append(extension)
-                break
-
-    return detected
+    if _KEYWORD_AC is not None:
+        # Single C-level pass over the prompt instead of one substring
+        # scan per keyword; order follows EXTENSION_KEYWORDS definition.
+        # The automaton matches literally, so it needs the lowered copy.
+        seen = {extension for _, extension in _KEYWORD_AC.iter(prompt.lower())}
+        return [extension for extension in EXTENSION_KEYWORDS if extension in seen]
+
+    # Fallback: one case-insensitive regex scan over the original prompt,
+    # avoiding the O(len(prompt)) lowercased copy; only the short matched
+    # keywords are lowered for the map lookup.
+    seen = set()
+    for match in _KEYWORD_RE.finditer(prompt):
+        seen.update(_KEYWORD_TO_EXTENSIONS[match.group(1).lower()])
+    return [extension for extension in EXTENSION_KEYWORDS if extension in seen]
 
 
 def detect_explicit_filenames(prompt: str) -> list[str]:
@@ -75,7 +177,7 @@ def detect_explicit_filenames(prompt: str) -> list[str]:
         List of detected filenames.
     """
     matches = FILENAME_PATTERN.findall(prompt)
-    return list(set(matches))
+    return list(dict.fromkeys(matches))
 
 
 def detect_path_references(prompt: str) -> list[str]:
@@ -96,30 +198,61 @@ def detect_path_references(prompt: str) -> list[str]:
             if any(c.isalpha() for c in match.split("/")[0]):
                 paths.append(path)
 
-    return list(set(paths))
+    return list(dict.fromkeys(paths))
 
 
-def detect_file_types(prompt: str) -> list[str]:
-    """Detect all file types, filenames, and paths from a prompt.
+@functools.lru_cache(maxsize=256)
+def _detect_file_types_cached(prompt: str) -> tuple[str, ...]:
+    """Detect file types for a prompt, memoized on the prompt string.
+
+    Prompts in iterative sessions often repeat verbatim, so the scans
+    are cached; the tuple return keeps cached values immutable.
 
     Args:
         prompt: The user prompt to analyze.
 
     Returns:
-        List of all detected file types, filenames, and paths.
+        Tuple of all detected file types, filenames, and paths.
     """
     file_types: list[str] = []
 
     extensions = detect_extensions_from_keywords(prompt)
     file_types.extend(extensions)
 
-    filenames = detect_explicit_filenames(prompt)
+    filenames, paths = _scan_filenames_and_paths(prompt)
     file_types.extend(filenames)
-
-    paths = detect_path_references(prompt)
     file_types.extend(paths)
 
-    return file_types
+    return tuple(file_types)
+
+
+def detect_file_types(prompt: str) -> list[str]:
+    """Detect all file types, filenames, and paths from a prompt.
+
+    Prompts longer than MAX_PROMPT_LENGTH are truncated before scanning;
+    file references that far into a prompt are not worth unbounded
+    regex time.
+
+    Args:
+        prompt: The user prompt to analyze.
+
+    Returns:
+        List of all detected file types, filenames, and paths.
+    """
+    if len(prompt) > MAX_PROMPT_LENGTH:
+        prompt = prompt[:MAX_PROMPT_LENGTH]
+    return list(_detect_file_types_cached(prompt))
+
+
+def _emit(output: object) -> None:
+    """Write one JSON line to stdout, bypassing the print machinery.
+
+    Args:
+        output: JSON-serializable hook output.
+    """
+    sys.stdout.write(_dumps(output))
+    sys.stdout.write("\n")
+    sys.stdout.flush()
 
 
 def main() -> int:
@@ -131,23 +264,26 @@ def main() -> int:
         Exit code: 0 for success, 2 for blocking errors.
     """
     try:
-        input_data: FileDetectorInput = json.load(sys.stdin)
+        # One raw read of the full (small) payload; no TextIOWrapper
+        # decode pass. Empty stdin is treated as an empty request.
+        data = sys.stdin.buffer.read()
+        input_data: FileDetectorInput = _loads(data) if data else {}
         prompt = input_data.get("prompt", "")
 
         file_types = detect_file_types(prompt)
 
         output: FileDetectorOutput = {"file_types": file_types}
-        print(json.dumps(output))
+        _emit(output)
         return 0
 
     except json.JSONDecodeError:
         error_output = {"file_types": [], "error": "Invalid JSON input"}
-        print(json.dumps(error_output))
+        _emit(error_output)
         return 2
 
     except Exception as e:
         error_output = {"file_types": [], "error": str(e)}
-        print(json.dumps(error_output))
+        _emit(error_output)
         return 2
 
 
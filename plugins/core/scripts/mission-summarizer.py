@@ -37,6 +37,25 @@ class ScriptOutput(TypedDict):
     mission_lite: MissionLite | None
 
 
+try:
+    import orjson
+
+    def _dumps(obj: object) -> str:
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    _dumps = json.dumps
+    _loads = json.loads
+
+
+# One alternation covers both bold-feature forms -- colon inside the
+# bold (`**Name:** desc`) and colon after it (`**Name**: desc`) -- so
+# each bullet costs a single match call.
+_FEATURE_RE = re.compile(r"^\*\*(?P<name>[^*]+?)(?:\*\*:|:\*\*)\s*(?P<desc>.*)$")
+_BOLD_STRIP_RE = re.compile(r"\*\*([^*]+)\*\*")
+
+
 def find_mission_path(cwd: str) -> Path | None:
     """Find the mission.md file in the project.
 
@@ -65,9 +84,14 @@ def extract_first_sentence(text: str) -> str:
     if not text:
         return ""
 
-    match = re.search(r"^[^.!?]*[.!?]", text)
-    if match:
-        return match.group(0).strip()
+    # Manual scan for the earliest sentence terminator; cheaper than
+    # regex engine setup for the short lines this sees.
+    end = min(
+        (pos for pos in (text.find(c) for c in ".!?") if pos >= 0),
+        default=-1,
+    )
+    if end >= 0:
+        return text[: end + 1].strip()
 
     lines = text.split("\n")
     for line in lines:
@@ -78,6 +102,60 @@ def extract_first_sentence(text: str) -> str:
     return text[:200] if len(text) > 200 else text
 
 
+def _normalize_section_name(name: str) -> str:
+    """Normalize a section header name for lookup.
+
+    Args:
+        name: Raw section name, possibly prefixed with "The".
+
+    Returns:
+        Lowercased name with any leading "The " removed.
+    """
+    name = name.strip()
+    if name.lower().startswith("the "):
+        name = name[4:]
+    return name.strip().lower()
+
+
+def _split_sections(content: str) -> dict[str, str]:
+    """Split markdown content into section-name -> cleaned-body map.
+
+    Walks the content once, opening a section at each `## Name` header
+    and collecting its non-empty lines; `###` sub-headers and HTML
+    comments are dropped. The first occurrence of a section name wins.
+
+    Args:
+        content: The full markdown content.
+
+    Returns:
+        Mapping of normalized section name to joined body lines.
+    """
+    sections: dict[str, str] = {}
+    current_key: str | None = None
+    current_lines: list[str] = []
+
+    for line in content.splitlines():
+        stripped = line.strip()
+        if stripped.startswith("##") and not stripped.startswith("###"):
+            if current_key is not None:
+                sections.setdefault(current_key, "\n".join(current_lines))
+            current_key = _normalize_section_name(stripped[2:])
+            current_lines = []
+            continue
+        if current_key is None or not stripped:
+            continue
+        if stripped.startswith("###"):
+            continue
+        if stripped.startswith("<!--") and stripped.endswith("-->"):
+            continue
+        current_lines.append(stripped)
+
+    if current_key is not None:
+        sections.setdefault(current_key, "\n".join(current_lines))
+
+    return sections
+
+
 def extract_section_content(content: str, section_name: str) -> str:
     """Extract content from a specific markdown section.
 
@@ -88,37 +166,21 @@ def extract_section_content(content: str, section_name: str) -> str:
     Returns:
         The content of the section, or empty string if not found.
     """
-    pattern = rf"##\s*(?:The\s+)?{re.escape(section_name)}\s*\n(.*?)(?=\n##|\Z)"
-    match = re.search(pattern, content, re.DOTALL | re.IGNORECASE)
-
-    if match:
-        section_content = match.group(1).strip()
-        lines = []
-        for line in section_content.split("\n"):
-            stripped = line.strip()
-            if stripped.startswith("###"):
-                continue
-            if stripped.startswith("<!--") and stripped.endswith("-->"):
-                continue
-            if stripped:
-                lines.append(stripped)
-        return "\n".join(lines)
-
-    return ""
+    return _split_sections(content).get(_normalize_section_name(section_name), "")
 
 
-def extract_key_features(content: str) -> list[str]:
+def extract_key_features(sections: dict[str, str]) -> list[str]:
     """Extract key features as a list from the Key Features section.
 
     Args:
-        content: The full markdown content.
+        sections: Pre-split section map from _split_sections.
 
     Returns:
         List of feature descriptions.
     """
     features: list[str] = []
 
-    section_content = extract_section_content(content, "Key Features")
+    section_content = sections.get("key features", "")
     if not section_content:
         return features
 
@@ -126,35 +188,25 @@ def extract_key_features(content: str) -> list[str]:
         line = line.strip()
         if line.startswith("- "):
             feature_text = line[2:].strip()
-            # Pattern: **Feature Name:** description (colon inside bold)
-            match = re.match(r"\*\*(.+?):\*\*\s*(.*)", feature_text)
+            match = _FEATURE_RE.match(feature_text)
             if match:
-                feature_name = match.group(1).strip()
-                features.append(feature_name)
-            # Pattern: **Feature Name**: description (colon outside bold)
-            elif feature_text.startswith("**"):
-                match = re.match(r"\*\*([^*]+)\*\*:\s*(.*)", feature_text)
-                if match:
-                    feature_name = match.group(1).strip()
-                    features.append(feature_name)
-                else:
-                    features.append(feature_text[:100])
+                features.append(match.group("name").strip())
             else:
                 features.append(feature_text[:100])
 
     return features[:10]
 
 
-def extract_pitch_summary(content: str) -> str:
+def extract_pitch_summary(sections: dict[str, str]) -> str:
     """Extract pitch summary from the Pitch section.
 
     Args:
-        content: The full markdown content.
+        sections: Pre-split section map from _split_sections.
 
     Returns:
         First sentence from pitch section.
     """
-    section_content = extract_section_content(content, "Pitch")
+    section_content = sections.get("pitch", "")
     if not section_content:
         return ""
 
@@ -166,22 +218,22 @@ def extract_pitch_summary(content: str) -> str:
             continue
         sentence = extract_first_sentence(line)
         if sentence:
-            sentence = re.sub(r"\*\*([^*]+)\*\*", r"\1", sentence)
+            sentence = _BOLD_STRIP_RE.sub(r"\1", sentence)
             return sentence
 
     return ""
 
 
-def extract_problem_summary(content: str) -> str:
+def extract_problem_summary(sections: dict[str, str]) -> str:
     """Extract problem summary from the Problem section.
 
     Args:
-        content: The full markdown content.
+        sections: Pre-split section map from _split_sections.
 
     Returns:
         First sentence from problem section.
     """
-    section_content = extract_section_content(content, "Problem")
+    section_content = sections.get("problem", "")
     if not section_content:
         return ""
 
@@ -210,17 +262,23 @@ def summarize_mission(mission_path: Path) -> MissionLite | None:
     Returns:
         MissionLite with extracted summaries, or None on error.
     """
+    # One raw read plus one bulk decode; read_text would decode
+    # incrementally through a TextIOWrapper.
     try:
-        content = mission_path.read_text(encoding="utf-8")
+        content = mission_path.read_bytes().decode("utf-8")
     except (OSError, UnicodeDecodeError):
         return None
 
     if not content.strip():
         return None
 
-    pitch = extract_pitch_summary(content)
-    problem = extract_problem_summary(content)
-    key_features = extract_key_features(content)
+    # One linear pass over mission.md replaces three DOTALL regex
+    # sweeps; the extractors share the resulting section map.
+    sections = _split_sections(content)
+
+    pitch = extract_pitch_summary(sections)
+    problem = extract_problem_summary(sections)
+    key_features = extract_key_features(sections)
 
     if not pitch and not problem and not key_features:
         return None
@@ -242,10 +300,10 @@ def main() -> int:
         Exit code: 0 for success.
     """
     try:
-        input_data: ScriptInput = json.load(sys.stdin)
+        input_data: ScriptInput = _loads(sys.stdin.buffer.read())
     except json.JSONDecodeError:
         output: ScriptOutput = {"mission_lite": None}
-        print(json.dumps(output))
+        print(_dumps(output))
         return 0
 
     cwd = input_data.get("cwd", "")
@@ -253,13 +311,13 @@ def main() -> int:
     mission_path = find_mission_path(cwd)
     if mission_path is None:
         output: ScriptOutput = {"mission_lite": None}
-        print(json.dumps(output))
+        print(_dumps(output))
         return 0
 
     mission_lite = summarize_mission(mission_path)
 
     output: ScriptOutput = {"mission_lite": mission_lite}
-    print(json.dumps(output))
+    print(_dumps(output))
     return 0
 
 
@@ -10,10 +10,12 @@ Markdown block with "Product Context" header, including:
 Handles failures gracefully with partial output if one script fails.
 """
 
+import importlib.util
 import json
-import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import ModuleType
 from typing import TypedDict
 
 
@@ -46,39 +48,49 @@ class ScriptOutput(TypedDict):
     product_context: str
 
 
+try:
+    import orjson
+
+    def _dumps(obj: object) -> str:
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    _dumps = json.dumps
+    _loads = json.loads
+
+
 SCRIPTS_DIR = Path(__file__).parent
 
 
-def run_sub_script(script_name: str, cwd: str) -> dict | None:
-    """Run a sub-script and capture its JSON output.
+def _load_script_module(script_name: str) -> ModuleType:
+    """Import a sibling script as a module, once per process.
+
+    The sub-scripts keep their hyphenated file names and CLI entry
+    points for standalone use; this orchestrator imports them
+    in-process to avoid one interpreter startup per stage.
 
     Args:
-        script_name: Name of the script file.
-        cwd: Current working directory to pass to the script.
+        script_name: Name of the script file (e.g., 'roadmap-parser.py').
 
     Returns:
-        Parsed JSON output from the script, or None on failure.
-    """
-    script_path = SCRIPTS_DIR / script_name
-
-    if not script_path.exists():
-        return None
+        The imported module.
 
-    try:
-        result = subprocess.run(
-            [sys.executable, str(script_path)],
-            input=json.dumps({"cwd": cwd}),
-            capture_output=True,
-            text=True,
-            timeout=30,
+    Raises:
+        RuntimeError: If the module cannot be loaded.
+    """
+    module_name = script_name[:-3].replace("-", "_")
+    module = sys.modules.get(module_name)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(
+            module_name, SCRIPTS_DIR / script_name
         )
-
-        if result.returncode != 0:
-            return None
-
-        return json.loads(result.stdout)
-    except (subprocess.TimeoutExpired, json.JSONDecodeError, OSError):
-        return None
+        if spec is None or spec.loader is None:
+            raise RuntimeError(f"Cannot load script {script_name}")
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+    return module
 
 
 def get_mission_lite(cwd: str) -> MissionLite | None:
@@ -90,10 +102,14 @@ def get_mission_lite(cwd: str) -> MissionLite | None:
     Returns:
         MissionLite dict or None if unavailable.
     """
-    result = run_sub_script("mission-summarizer.py", cwd)
-    if result and result.get("mission_lite"):
-        return result["mission_lite"]
-    return None
+    try:
+        mission_summarizer = _load_script_module("mission-summarizer.py")
+        mission_path = mission_summarizer.find_mission_path(cwd)
+        if mission_path is None:
+            return None
+        return mission_summarizer.summarize_mission(mission_path)
+    except Exception:
+        return None
 
 
 def get_current_item(cwd: str) -> CurrentItem | None:
@@ -105,68 +121,15 @@ def get_current_item(cwd: str) -> CurrentItem | None:
     Returns:
         CurrentItem dict or None if unavailable.
     """
-    result = run_sub_script("roadmap-parser.py", cwd)
-    if result and result.get("current_item"):
-        return result["current_item"]
-    return None
-
-
-def format_mission_section(mission_lite: MissionLite) -> list[str]:
-    """Format mission-lite as markdown lines.
-
-    Args:
-        mission_lite: The mission-lite summary.
-
-    Returns:
-        List of markdown lines.
-    """
-    lines: list[str] = []
-
-    lines.append("### Product Mission")
-    lines.append("")
-
-    if mission_lite.get("pitch"):
-        lines.append(f"**Pitch:** {mission_lite['pitch']}")
-
-    if mission_lite.get("problem"):
-        lines.append(f"**Problem:** {mission_lite['problem']}")
-
-    if mission_lite.get("key_features"):
-        lines.append("")
-        lines.append("**Key Features:**")
-        for feature in mission_lite["key_features"]:
-            lines.append(f"- {feature}")
-
-    return lines
-
-
-def format_roadmap_section(current_item: CurrentItem) -> list[str]:
-    """Format current roadmap item as markdown lines.
-
-    Args:
-        current_item: The current roadmap item.
-
-    Returns:
-        List of markdown lines.
-    """
-    lines: list[str] = []
-
-    lines.append("### Current Work Item")
-    lines.append("")
-
-    milestone = current_item.get("parent_milestone", "")
-    if milestone:
-        lines.append(f"**Milestone:** {milestone}")
-
-    item_num = current_item.get("item_number", 0)
-    title = current_item.get("item_title", "")
-    effort = current_item.get("effort_estimate", "")
-
-    if title:
-        effort_str = f" ({effort})" if effort else ""
-        lines.append(f"**Item {item_num}:** {title}{effort_str}")
-
-    return lines
+    try:
+        roadmap_parser = _load_script_module("roadmap-parser.py")
+        roadmap_path = roadmap_parser.find_roadmap_path(cwd)
+        if roadmap_path is None:
+            return None
+        current_item, _ = roadmap_parser.parse_roadmap(roadmap_path)
+        return current_item
+    except Exception:
+        return None
 
 
 def format_product_context(
@@ -182,21 +145,52 @@ def format_product_context(
     Returns:
         Formatted markdown string.
     """
-    lines: list[str] = []
-
-    lines.append("## Product Context")
-    lines.append("")
-
     if mission_lite is None and current_item is None:
-        lines.append("*No product context available. Run `/red64:plan-mission` and `/red64:plan-roadmap` to set up product planning.*")
-        return "\n".join(lines)
+        return (
+            "## Product Context\n\n"
+            "*No product context available. Run `/red64:plan-mission` and `/red64:plan-roadmap` to set up product planning.*"
+        )
+
+    # Both sections append into the one list, avoiding the per-section
+    # list allocations and extend copies of the old helper split.
+    # summarize_mission and parse_roadmap always populate every key of
+    # their TypedDicts, so the fields are read by subscript rather than
+    # defaulted .get lookups.
+    lines: list[str] = ["## Product Context", ""]
 
     if mission_lite:
-        lines.extend(format_mission_section(mission_lite))
+        lines.append("### Product Mission")
+        lines.append("")
+
+        if mission_lite["pitch"]:
+            lines.append(f"**Pitch:** {mission_lite['pitch']}")
+
+        if mission_lite["problem"]:
+            lines.append(f"**Problem:** {mission_lite['problem']}")
+
+        if mission_lite["key_features"]:
+            lines.append("")
+            lines.append("**Key Features:**")
+            for feature in mission_lite["key_features"]:
+                lines.append(f"- {feature}")
+
         lines.append("")
 
     if current_item:
-        lines.extend(format_roadmap_section(current_item))
+        lines.append("### Current Work Item")
+        lines.append("")
+
+        milestone = current_item["parent_milestone"]
+        if milestone:
+            lines.append(f"**Milestone:** {milestone}")
+
+        item_num = current_item["item_number"]
+        title = current_item["item_title"]
+        effort = current_item["effort_estimate"]
+
+        if title:
+            effort_str = f" ({effort})" if effort else ""
+            lines.append(f"**Item {item_num}:** {title}{effort_str}")
 
     return "\n".join(lines)
 
@@ -211,21 +205,26 @@ def main() -> int:
         Exit code: 0 for success.
     """
     try:
-        input_data: ScriptInput = json.load(sys.stdin)
+        input_data: ScriptInput = _loads(sys.stdin.buffer.read())
     except json.JSONDecodeError:
         output: ScriptOutput = {"product_context": ""}
-        print(json.dumps(output))
+        print(_dumps(output))
         return 0
 
     cwd = input_data.get("cwd", "")
 
-    mission_lite = get_mission_lite(cwd)
-    current_item = get_current_item(cwd)
+    # The two stages are independent and mostly wait on file I/O, so
+    # they run on a small thread pool rather than back to back.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        mission_future = executor.submit(get_mission_lite, cwd)
+        item_future = executor.submit(get_current_item, cwd)
+        mission_lite = mission_future.result()
+        current_item = item_future.result()
 
     product_context = format_product_context(mission_lite, current_item)
 
     output: ScriptOutput = {"product_context": product_context}
-    print(json.dumps(output))
+    print(_dumps(output))
     return 0
 
 
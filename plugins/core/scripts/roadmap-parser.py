@@ -40,6 +40,18 @@ class ScriptOutput(TypedDict):
     error: str | None
 
 
+try:
+    import orjson
+
+    def _dumps(obj: object) -> str:
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    _dumps = json.dumps
+    _loads = json.loads
+
+
 def find_roadmap_path(cwd: str) -> Path | None:
     """Find the roadmap.md file in the project.
 
@@ -55,76 +67,49 @@ def find_roadmap_path(cwd: str) -> Path | None:
     return None
 
 
-def parse_effort_estimate(line: str) -> str:
-    """Extract effort estimate from a roadmap line.
-
-    Args:
-        line: The roadmap item line.
-
-    Returns:
-        Effort estimate (XS, S, M, L, XL) or empty string if not found.
-    """
-    match = re.search(r"`(XS|S|M|L|XL)`", line)
-    if match:
-        return match.group(1)
-    return ""
-
+# One match per roadmap line captures the item number, checkbox state,
+# and the raw remainder; title cleanup and the effort search run only
+# on the single matched item.
+_ITEM_RE = re.compile(r"^(?P<num>\d+)\.\s*\[(?P<check>\s*[xX]?\s*)\]\s*(?P<rest>.*)$")
+_EFFORT_RE = re.compile(r"`(XS|S|M|L|XL)`")
+_TITLE_COMMENT_RE = re.compile(r"\s*--\s*.*$")
+_TITLE_EFFORT_RE = re.compile(r"\s*`(XS|S|M|L|XL)`\s*$")
+_MILESTONE_PREFIX_RE = re.compile(r"^Milestone\s+\d+:\s*")
 
-def parse_item_title(line: str) -> str:
-    """Extract item title from a roadmap line.
 
-    Args:
-        line: The roadmap item line.
+_WS_BYTES = b" \t\r\n\v\f"
 
-    Returns:
-        The item title without checkbox, number, or effort estimate.
-    """
-    match = re.match(r"\d+\.\s*\[\s*[xX]?\s*\]\s*(.+)", line)
-    if match:
-        title = match.group(1).strip()
-        title = re.sub(r"\s*--\s*.*$", "", title)
-        title = re.sub(r"\s*`(XS|S|M|L|XL)`\s*$", "", title)
-        return title.strip()
-    return ""
 
+def _is_unchecked_item(line: bytes) -> bool:
+    """Check whether a stripped line opens an unchecked roadmap item.
 
-def parse_item_number(line: str) -> int:
-    """Extract item number from a roadmap line.
+    Hand-coded scan for the `<digits>.<ws>[<ws>]` prefix; a handful of
+    byte comparisons per line is far cheaper than running the
+    capturing regex against every line of a large roadmap. Working on
+    raw bytes also means only the lines that actually match are ever
+    decoded.
 
     Args:
-        line: The roadmap item line.
+        line: A stripped roadmap line, still encoded.
 
     Returns:
-        The item number, or 0 if not found.
+        True if the line starts an unchecked `N. [ ]` item.
     """
-    match = re.match(r"(\d+)\.\s*\[", line)
-    if match:
-        return int(match.group(1))
-    return 0
-
-
-def find_current_milestone(content: str, item_line_number: int) -> str:
-    """Find the parent milestone for a given item.
-
-    Args:
-        content: The full roadmap content.
-        item_line_number: Line number of the current item.
-
-    Returns:
-        The milestone name, or empty string if not found.
-    """
-    lines = content.split("\n")
-    current_milestone = ""
-
-    for i, line in enumerate(lines):
-        if i >= item_line_number:
-            break
-        if line.startswith("## "):
-            milestone_text = line[3:].strip()
-            milestone_text = re.sub(r"^Milestone\s+\d+:\s*", "", milestone_text)
-            current_milestone = milestone_text
-
-    return current_milestone
+    i = 0
+    n = len(line)
+    while i < n and 0x30 <= line[i] <= 0x39:
+        i += 1
+    if i == 0 or i >= n or line[i] != 0x2E:  # "."
+        return False
+    i += 1
+    while i < n and line[i] in _WS_BYTES:
+        i += 1
+    if i >= n or line[i] != 0x5B:  # "["
+        return False
+    i += 1
+    while i < n and line[i] in _WS_BYTES:
+        i += 1
+    return i < n and line[i] == 0x5D  # "]"
 
 
 def parse_roadmap(roadmap_path: Path) -> tuple[CurrentItem | None, str | None]:
@@ -136,35 +121,54 @@ def parse_roadmap(roadmap_path: Path) -> tuple[CurrentItem | None, str | None]:
     Returns:
         Tuple of (CurrentItem or None, error message or None).
     """
+    # The file is streamed line by line and the parse returns at the
+    # first unchecked item, so neither the full content nor a lines
+    # list is ever materialized. The milestone is tracked while
+    # walking forward, so no backward rescan is needed either.
+    current_milestone = ""
+
     try:
-        content = roadmap_path.read_text(encoding="utf-8")
+        with open(roadmap_path, "rb") as f:
+            for raw_line in f:
+                # The structural markers are all ASCII, so lines are
+                # filtered as raw bytes; only milestone headers and
+                # the single matched item line are decoded.
+                if raw_line.startswith(b"## "):
+                    current_milestone = _MILESTONE_PREFIX_RE.sub(
+                        "", raw_line[3:].strip().decode("utf-8")
+                    )
+                    continue
+
+                stripped = raw_line.strip()
+                # The cheap scanner rejects checked and non-item lines,
+                # so the capturing regex runs at most once per parse.
+                if not _is_unchecked_item(stripped):
+                    continue
+                line = stripped.decode("utf-8")
+                match = _ITEM_RE.match(line)
+                if match is None:
+                    continue
+
+                item_number = int(match.group("num"))
+                item_title = match.group("rest").strip()
+                item_title = _TITLE_COMMENT_RE.sub("", item_title)
+                item_title = _TITLE_EFFORT_RE.sub("", item_title).strip()
+
+                effort_match = _EFFORT_RE.search(line)
+                effort_estimate = effort_match.group(1) if effort_match else ""
+
+                if item_number == 0 or not item_title:
+                    return None, "Malformed roadmap item format"
+
+                return {
+                    "item_number": item_number,
+                    "item_title": item_title,
+                    "effort_estimate": effort_estimate,
+                    "parent_milestone": current_milestone,
+                }, None
     except (OSError, UnicodeDecodeError) as e:
         return None, f"Error reading roadmap: {str(e)}"
 
-    if not content.strip():
-        return None, None
-
-    lines = content.split("\n")
-    unchecked_pattern = re.compile(r"^\d+\.\s*\[\s*\]")
-
-    for line_number, line in enumerate(lines):
-        line = line.strip()
-        if unchecked_pattern.match(line):
-            item_number = parse_item_number(line)
-            item_title = parse_item_title(line)
-            effort_estimate = parse_effort_estimate(line)
-            parent_milestone = find_current_milestone(content, line_number)
-
-            if item_number == 0 or not item_title:
-                return None, "Malformed roadmap item format"
-
-            return {
-                "item_number": item_number,
-                "item_title": item_title,
-                "effort_estimate": effort_estimate,
-                "parent_milestone": parent_milestone,
-            }, None
-
     return None, None
 
 
@@ -178,10 +182,10 @@ def main() -> int:
         Exit code: 0 for success.
     """
     try:
-        input_data: ScriptInput = json.load(sys.stdin)
+        input_data: ScriptInput = _loads(sys.stdin.buffer.read())
     except json.JSONDecodeError:
         output: ScriptOutput = {"current_item": None, "error": None}
-        print(json.dumps(output))
+        print(_dumps(output))
         return 0
 
     cwd = input_data.get("cwd", "")
@@ -189,13 +193,13 @@ def main() -> int:
     roadmap_path = find_roadmap_path(cwd)
     if roadmap_path is None:
         output: ScriptOutput = {"current_item": None, "error": None}
-        print(json.dumps(output))
+        print(_dumps(output))
         return 0
 
     current_item, error = parse_roadmap(roadmap_path)
 
     output: ScriptOutput = {"current_item": current_item, "error": error}
-    print(json.dumps(output))
+    print(_dumps(output))
     return 0
 
 
@@ -7,7 +7,10 @@ returns skill content for inclusion in context.
 """
 
 import fnmatch
+import functools
 import json
+import os
+import re
 import sys
 from pathlib import Path
 from typing import TypedDict
@@ -52,6 +55,18 @@ class StandardsLoaderOutput(TypedDict, total=False):
     error: str
 
 
+try:
+    import orjson
+
+    def _dumps(obj: object) -> str:
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    _dumps = json.dumps
+    _loads = json.loads
+
+
 def get_plugins_dir(cwd: str) -> Path:
     """Determine the plugins directory path.
 
@@ -64,6 +79,12 @@ def get_plugins_dir(cwd: str) -> Path:
     return Path(cwd) / "plugins"
 
 
+# Parsed standards.json per plugin, invalidated on stat signature
+# change (same scheme as the config cache in config_utils). Cached
+# dicts are shared; callers must treat them as read-only.
+_standards_json_cache: dict[str, tuple[tuple[int, int], dict]] = {}
+
+
 def load_standards_json(plugin_path: Path) -> dict:
     """Load standards.json from a plugin directory.
 
@@ -74,13 +95,26 @@ def load_standards_json(plugin_path: Path) -> dict:
         Parsed standards.json content or empty dict if not found.
     """
     standards_json_path = plugin_path / "standards.json"
-    if standards_json_path.exists():
-        try:
-            with open(standards_json_path) as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
-            pass
-    return {}
+
+    try:
+        stat = os.stat(standards_json_path)
+    except OSError:
+        return {}
+
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cache_key = str(standards_json_path)
+    entry = _standards_json_cache.get(cache_key)
+    if entry is not None and entry[0] == signature:
+        return entry[1]
+
+    try:
+        with open(standards_json_path, "rb") as f:
+            data = json.loads(f.read())
+    except (json.JSONDecodeError, OSError):
+        data = {}
+
+    _standards_json_cache[cache_key] = (signature, data)
+    return data
 
 
 def get_file_patterns(standards_json: dict) -> list[str]:
@@ -95,6 +129,19 @@ def get_file_patterns(standards_json: dict) -> list[str]:
     return standards_json.get("file_patterns", [])
 
 
+@functools.lru_cache(maxsize=256)
+def _compile_patterns(patterns: tuple[str, ...]) -> re.Pattern:
+    """Compile a tuple of glob patterns into one alternation regex.
+
+    Args:
+        patterns: Glob patterns from a plugin's standards.json.
+
+    Returns:
+        Compiled pattern matching any of the globs.
+    """
+    return re.compile("|".join(fnmatch.translate(pattern) for pattern in patterns))
+
+
 def file_type_matches_patterns(file_type: str, patterns: list[str]) -> bool:
     """Check if a file type matches any of the glob patterns.
 
@@ -105,18 +152,18 @@ def file_type_matches_patterns(file_type: str, patterns: list[str]) -> bool:
     Returns:
         True if file type matches any pattern, False otherwise.
     """
-    for pattern in patterns:
-        if file_type.startswith("."):
-            test_filename = f"test{file_type}"
-            if fnmatch.fnmatch(test_filename, pattern):
-                return True
-        else:
-            if fnmatch.fnmatch(file_type, pattern):
-                return True
-            filename = Path(file_type).name
-            if fnmatch.fnmatch(filename, pattern):
-                return True
-    return False
+    if not patterns:
+        return False
+
+    # One compiled alternation per pattern set replaces a fnmatch call
+    # per pattern per file type; compilation is cached across plugins.
+    pattern_re = _compile_patterns(tuple(patterns))
+
+    if file_type.startswith("."):
+        return pattern_re.match(f"test{file_type}") is not None
+    if pattern_re.match(file_type) is not None:
+        return True
+    return pattern_re.match(Path(file_type).name) is not None
 
 
 def load_skills_from_plugin(plugin_path: Path) -> list[SkillInfo]:
@@ -131,22 +178,125 @@ def load_skills_from_plugin(plugin_path: Path) -> list[SkillInfo]:
     skills: list[SkillInfo] = []
     skills_dir = plugin_path / "skills"
 
-    if not skills_dir.exists():
+    # scandir DirEntry objects carry cached type info, avoiding the
+    # per-entry stat and Path allocation that glob + sorted incurred.
+    try:
+        entries = [
+            entry
+            for entry in os.scandir(skills_dir)
+            if entry.is_file() and entry.name.endswith(".md")
+        ]
+    except OSError:
         return skills
 
-    for skill_file in sorted(skills_dir.glob("*.md")):
+    entries.sort(key=lambda entry: entry.name)
+
+    for entry in entries:
         try:
-            content = skill_file.read_text()
+            with open(entry.path, "rb") as f:
+                content = f.read().decode("utf-8")
             skills.append({
-                "name": skill_file.stem,
+                "name": entry.name[:-3],
                 "content": content,
             })
-        except IOError:
+        except (OSError, UnicodeDecodeError):
             continue
 
     return skills
 
 
+_SUFFIX_GLOB_RE = re.compile(r"^\*(\.[A-Za-z0-9_]+)$")
+
+# Inverted index from simple `*.ext` globs to the plugins that declare
+# them, keyed per (enabled standards, plugins dir); plugins with more
+# complex patterns are kept on a fallback list matched the slow way.
+# Entries carry a standards.json validity key, re-checked per request,
+# so long-lived daemon processes notice edits without a restart.
+_standards_index_cache: dict[
+    tuple[tuple[str, ...], str],
+    tuple[
+        tuple,
+        tuple[dict[str, list[tuple[str, str, int]]], list[tuple[str, str, int, tuple[str, ...]]]],
+    ],
+] = {}
+
+
+def _standards_index_validity(
+    enabled_standards: tuple[str, ...],
+    plugins_dir_str: str,
+) -> tuple:
+    """Build an invalidation key from the plugins' standards.json files.
+
+    Args:
+        enabled_standards: Enabled plugin names in priority order.
+        plugins_dir_str: Plugins directory as a string.
+
+    Returns:
+        Tuple with one (mtime_ns, size) pair or None per plugin.
+    """
+    key = []
+    for standard_name in enabled_standards:
+        try:
+            stat = os.stat(
+                os.path.join(plugins_dir_str, standard_name, "standards.json")
+            )
+            key.append((stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            key.append(None)
+    return tuple(key)
+
+
+def _get_standards_index(
+    enabled_standards: tuple[str, ...],
+    plugins_dir_str: str,
+) -> tuple[
+    dict[str, list[tuple[str, str, int]]],
+    list[tuple[str, str, int, tuple[str, ...]]],
+]:
+    """Build (or fetch) the suffix index for the enabled standards.
+
+    Args:
+        enabled_standards: Enabled plugin names in priority order.
+        plugins_dir_str: Plugins directory as a string.
+
+    Returns:
+        Tuple of (suffix -> plugin entries map, fallback entries with
+        their non-suffix patterns); entries are (name, path, priority).
+    """
+    cache_key = (enabled_standards, plugins_dir_str)
+    validity_key = _standards_index_validity(enabled_standards, plugins_dir_str)
+    cached = _standards_index_cache.get(cache_key)
+    if cached is not None and cached[0] == validity_key:
+        return cached[1]
+
+    suffix_map: dict[str, list[tuple[str, str, int]]] = {}
+    fallbacks: list[tuple[str, str, int, tuple[str, ...]]] = []
+    plugins_dir = Path(plugins_dir_str)
+
+    for priority_index, standard_name in enumerate(enabled_standards):
+        plugin_path = plugins_dir / standard_name
+        if not plugin_path.exists():
+            continue
+
+        patterns = get_file_patterns(load_standards_json(plugin_path))
+        entry = (standard_name, str(plugin_path), priority_index)
+
+        complex_patterns: list[str] = []
+        for pattern in patterns:
+            suffix_match = _SUFFIX_GLOB_RE.match(pattern)
+            if suffix_match:
+                suffix_map.setdefault(suffix_match.group(1), []).append(entry)
+            else:
+                complex_patterns.append(pattern)
+
+        if complex_patterns:
+            fallbacks.append(entry + (tuple(complex_patterns),))
+
+    result = (suffix_map, fallbacks)
+    _standards_index_cache[cache_key] = (validity_key, result)
+    return result
+
+
 def find_matching_standards(
     file_types: list[str],
     enabled_standards: list[str],
@@ -162,22 +312,36 @@ def find_matching_standards(
     Returns:
         List of (plugin_name, plugin_path, priority_index) tuples for matching standards.
     """
-    matching: list[tuple[str, Path, int]] = []
+    suffix_map, fallbacks = _get_standards_index(
+        tuple(enabled_standards), str(plugins_dir)
+    )
 
-    for priority_index, standard_name in enumerate(enabled_standards):
-        plugin_path = plugins_dir / standard_name
-        if not plugin_path.exists():
-            continue
+    matched: dict[int, tuple[str, str, int]] = {}
+
+    for file_type in file_types:
+        if len(matched) == len(enabled_standards):
+            break
+
+        if file_type.startswith("."):
+            suffix = file_type
+        else:
+            base = file_type[file_type.rfind("/") + 1:]
+            dot = base.rfind(".")
+            suffix = base[dot:] if dot != -1 else ""
 
-        standards_json = load_standards_json(plugin_path)
-        patterns = get_file_patterns(standards_json)
+        for entry in suffix_map.get(suffix, ()):
+            matched.setdefault(entry[2], entry)
 
-        for file_type in file_types:
-            if file_type_matches_patterns(file_type, patterns):
-                matching.append((standard_name, plugin_path, priority_index))
-                break
+        for standard_name, path_str, priority_index, patterns in fallbacks:
+            if priority_index in matched:
+                continue
+            if file_type_matches_patterns(file_type, list(patterns)):
+                matched[priority_index] = (standard_name, path_str, priority_index)
 
-    return matching
+    return [
+        (standard_name, Path(path_str), priority_index)
+        for priority_index, (standard_name, path_str, _) in sorted(matched.items())
+    ]
 
 
 def load_standards_for_file_types(
@@ -244,12 +408,12 @@ def main() -> int:
         Exit code: 0 for success, 2 for blocking errors.
     """
     try:
-        input_data: StandardsLoaderInput = json.load(sys.stdin)
+        input_data: StandardsLoaderInput = _loads(sys.stdin.buffer.read())
         file_types = input_data.get("file_types", [])
         cwd = input_data.get("cwd", "")
 
         output = load_standards_for_file_types(file_types, cwd)
-        print(json.dumps(output))
+        print(_dumps(output))
         return 0
 
     except json.JSONDecodeError:
@@ -257,7 +421,7 @@ def main() -> int:
             "standards": [],
             "error": "Invalid JSON input",
         }
-        print(json.dumps(error_output))
+        print(_dumps(error_output))
         return 2
 
     except Exception as e:
@@ -265,7 +429,7 @@ def main() -> int:
             "standards": [],
             "error": str(e),
         }
-        print(json.dumps(error_output))
+        print(_dumps(error_output))
         return 2
 
 
@@ -6,6 +6,7 @@ Task categories: shape, write-spec, implement, review, test, debug, refactor.
 """
 
 import json
+import re
 import sys
 from typing import TypedDict
 
@@ -22,6 +23,18 @@ class TaskDetectorOutput(TypedDict):
     task_type: str
 
 
+try:
+    import orjson
+
+    def _dumps(obj: object) -> str:
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    _dumps = json.dumps
+    _loads = json.loads
+
+
 TASK_PATTERNS: dict[str, list[str]] = {
     "shape": [
         "requirements",
@@ -100,11 +113,57 @@ TASK_PRIORITY: list[str] = [
 ]
 
 
+try:
+    import ahocorasick
+
+    _TASK_AC = ahocorasick.Automaton()
+    for _task_type, _keywords in TASK_PATTERNS.items():
+        for _keyword in _keywords:
+            _TASK_AC.add_word(_keyword, _task_type)
+    _TASK_AC.make_automaton()
+except ImportError:
+    _TASK_AC = None
+
+
+def _build_task_regex() -> tuple[re.Pattern, dict[str, list[str]]]:
+    """Build the single-scan keyword regex and its task mapping.
+
+    Same scheme as the file detector: a zero-width lookahead
+    alternation reports the longest keyword at every start position,
+    and keywords nested at the same start position (e.g. 'write'
+    within 'write spec') are recovered via the prefix expansion map.
+
+    Returns:
+        Tuple of (compiled lookahead pattern, keyword -> task types map).
+    """
+    keywords = sorted(
+        {kw for kws in TASK_PATTERNS.values() for kw in kws},
+        key=len,
+        reverse=True,
+    )
+    pattern = re.compile(
+        "(?=(" + "|".join(re.escape(keyword) for keyword in keywords) + "))",
+        re.IGNORECASE,
+    )
+
+    keyword_to_tasks: dict[str, list[str]] = {}
+    for keyword in keywords:
+        tasks: list[str] = []
+        for task_type, kws in TASK_PATTERNS.items():
+            if any(keyword.startswith(kw) for kw in kws):
+                tasks.append(task_type)
+        keyword_to_tasks[keyword] = tasks
+    return pattern, keyword_to_tasks
+
+
+_TASK_RE, _KEYWORD_TO_TASKS = _build_task_regex()
+
+
 def detect_task_type(prompt: str) -> str:
     """Detect the task type from the user prompt using keyword matching.
 
-    Uses lowercase keyword search against built-in patterns.
-    Returns the first matching task type based on priority order.
+    Scans the lowercased prompt once for all keywords, then returns
+    the highest-priority matching task type.
 
     Args:
         prompt: The user prompt to analyze.
@@ -112,13 +171,19 @@ def detect_task_type(prompt: str) -> str:
     Returns:
         The detected task type or 'unknown' if no patterns match.
     """
-    prompt_lower = prompt.lower()
+    if _TASK_AC is not None:
+        # The automaton matches literally, so it needs the lowered copy.
+        found = {task_type for _, task_type in _TASK_AC.iter(prompt.lower())}
+    else:
+        # The case-insensitive scan works on the original prompt; only
+        # each short matched keyword is lowered for the map lookup.
+        found = set()
+        for match in _TASK_RE.finditer(prompt):
+            found.update(_KEYWORD_TO_TASKS[match.group(1).lower()])
 
     for task_type in TASK_PRIORITY:
-        keywords = TASK_PATTERNS[task_type]
-        for keyword in keywords:
-            if keyword in prompt_lower:
-                return task_type
+        if task_type in found:
+            return task_type
 
     return "unknown"
 
@@ -133,17 +198,17 @@ def main() -> int:
         Exit code: 0 for success.
     """
     try:
-        input_data: TaskDetectorInput = json.load(sys.stdin)
+        input_data: TaskDetectorInput = _loads(sys.stdin.buffer.read())
         prompt = input_data.get("prompt", "")
 
         task_type = detect_task_type(prompt)
 
         output: TaskDetectorOutput = {"task_type": task_type}
-        print(json.dumps(output))
+        print(_dumps(output))
         return 0
     except json.JSONDecodeError:
         output: TaskDetectorOutput = {"task_type": "unknown"}
-        print(json.dumps(output))
+        print(_dumps(output))
         return 0
 
 
@@ -0,0 +1,46 @@
+"""Session-wide pytest configuration.
+
+Points the temporary-file base directory at a RAM-backed filesystem
+when one is available, so fixture trees are written without disk
+journaling overhead. Both tempfile.mkdtemp and pytest's
+tmp_path_factory honour this base directory. Set RED64_TEST_TMPDIR
+to choose the location explicitly; if it is unset and /dev/shm does
+not exist, the platform default is kept.
+"""
+
+import atexit
+import os
+import shutil
+import tempfile
+
+_ram_dir = os.environ.get("RED64_TEST_TMPDIR")
+if _ram_dir is None and os.path.isdir("/dev/shm"):
+    _ram_dir = "/dev/shm"
+
+if _ram_dir is not None and os.path.isdir(_ram_dir):
+    tempfile.tempdir = _ram_dir
+
+# Keep the scripts' disk cache (~/.cache/red64) out of the developer's
+# home directory: point it at a throwaway directory for this run. The
+# scripts read RED64_CACHE_DIR at import, and subprocess-based tests
+# inherit it through the environment.
+if "RED64_CACHE_DIR" not in os.environ:
+    _cache_dir = tempfile.mkdtemp(prefix="red64cache_")
+    os.environ["RED64_CACHE_DIR"] = _cache_dir
+    atexit.register(shutil.rmtree, _cache_dir, ignore_errors=True)
+
+# The hook entry points probe well-known Unix sockets under ~/.red64
+# for a running daemon before doing the work in-process. Point them at
+# paths nothing listens on, so the suite always exercises the code in
+# this tree rather than whatever an already-running daemon imported.
+# Daemon tests override this per test with a socket they own.
+_socket_dir = tempfile.mkdtemp(prefix="red64sock_")
+atexit.register(shutil.rmtree, _socket_dir, ignore_errors=True)
+if "RED64_CONTEXT_LOADER_SOCKET" not in os.environ:
+    os.environ["RED64_CONTEXT_LOADER_SOCKET"] = os.path.join(
+        _socket_dir, "context-loader.sock"
+    )
+if "RED64_STANDARDS_VALIDATOR_SOCKET" not in os.environ:
+    os.environ["RED64_STANDARDS_VALIDATOR_SOCKET"] = os.path.join(
+        _socket_dir, "standards-validator.sock"
+    )
@@ -0,0 +1,82 @@
+"""Shared in-process runner for the hook scripts under test.
+
+Imports each hyphenated script once per test session through an
+importlib shim and drives its main() with swapped stdin/stdout, so
+tests exercise the real stdin JSON and exit-code contract without a
+subprocess per call. Module objects are cached in sys.modules, which
+also keeps the scripts' own caches (YAML loader, config cache) warm
+across every test that uses the runner.
+
+Also hosts the serialization helpers the test files share: the
+orjson-backed json_dumps/json_loads pair (mirroring the scripts' own
+fallback shim) and the C-extension YAML dumper/loader classes.
+"""
+
+import importlib.util
+import io
+import json
+import sys
+from contextlib import redirect_stdout
+from pathlib import Path
+from types import ModuleType
+
+try:
+    from yaml import CSafeDumper as YamlDumper, CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeDumper as YamlDumper, SafeLoader as YamlLoader
+
+try:
+    import orjson
+
+    def json_dumps(obj: object) -> str:
+        return orjson.dumps(obj).decode()
+
+    json_loads = orjson.loads
+except ImportError:
+    json_dumps = json.dumps
+    json_loads = json.loads
+
+
+def load_script_module(script_path: Path) -> ModuleType:
+    """Import a hyphenated script as a module, once per test session.
+
+    Args:
+        script_path: Path to the script file.
+
+    Returns:
+        The imported module.
+    """
+    module_name = script_path.stem.replace("-", "_")
+    module = sys.modules.get(module_name)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(module_name, script_path)
+        assert spec is not None and spec.loader is not None
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+    return module
+
+
+def run_script_main(module: ModuleType, input_data: str) -> tuple[str, int]:
+    """Run a script's main() in-process with the given stdin text.
+
+    Calling main() directly skips the per-test interpreter startup a
+    subprocess.run would pay while still exercising the script's real
+    stdin/stdout contract.
+
+    Args:
+        module: Imported script module exposing main().
+        input_data: JSON text to present on stdin.
+
+    Returns:
+        Tuple of (captured stdout, exit code).
+    """
+    stdout = io.StringIO()
+    original_stdin = sys.stdin
+    sys.stdin = io.TextIOWrapper(io.BytesIO(input_data.encode()))
+    try:
+        with redirect_stdout(stdout):
+            exit_code = module.main()
+    finally:
+        sys.stdin = original_stdin
+    return stdout.getvalue(), exit_code
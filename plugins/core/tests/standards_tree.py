@@ -0,0 +1,116 @@
+"""Factory for the standards project trees built by test fixtures.
+
+The context-loader and standards-loader tests all scaffold the same
+layout: a .red64/config.yaml plus one plugins/<name> tree per
+standards plugin (.claude-plugin/plugin.json, standards.json,
+skills/*.md, hooks/hooks.json). Building that scaffold here keeps
+each fixture to a config dict and a list of plugin specs.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import TypedDict
+
+from tests.script_runner import json_dumps as _dumps
+
+
+# Every plugin gets the same empty hooks file; serialize it once.
+_HOOKS_JSON = _dumps({"hooks": {}})
+
+
+class PluginSpec(TypedDict, total=False):
+    """One standards plugin to scaffold under plugins/<name>.
+
+    standards_name overrides the "name" field written to
+    standards.json; it defaults to the plugin name.
+    """
+
+    name: str
+    standards_name: str
+    file_patterns: list[str]
+    skills: dict[str, str]
+
+
+# Template trees built once per (base dir, spec), then hardlinked into
+# each project that wants the same plugin; keyed by base dir so workers
+# with separate pytest temp roots never share paths.
+_template_cache: dict[tuple[str, str], Path] = {}
+
+
+def _build_plugin_tree(plugin_dir: Path, spec: PluginSpec) -> None:
+    """Write one standards plugin tree at the given directory.
+
+    Args:
+        plugin_dir: Directory to create (parents included).
+        spec: Plugin name, file patterns, and skill files to write.
+    """
+    claude_plugin_dir = plugin_dir / ".claude-plugin"
+    skills_dir = plugin_dir / "skills"
+    hooks_dir = plugin_dir / "hooks"
+
+    for sub_dir in (claude_plugin_dir, skills_dir, hooks_dir):
+        sub_dir.mkdir(parents=True, exist_ok=True)
+
+    plugin_json = {"name": spec["name"], "category": "standards"}
+    (claude_plugin_dir / "plugin.json").write_text(_dumps(plugin_json))
+
+    standards_json = {
+        "name": spec.get("standards_name", spec["name"]),
+        "file_patterns": spec["file_patterns"],
+    }
+    (plugin_dir / "standards.json").write_text(_dumps(standards_json))
+
+    for skill_name, skill_content in spec["skills"].items():
+        (skills_dir / f"{skill_name}.md").write_text(skill_content)
+
+    (hooks_dir / "hooks.json").write_text(_HOOKS_JSON)
+
+
+def make_plugin(root: Path, spec: PluginSpec) -> None:
+    """Create one standards plugin tree under root/plugins.
+
+    The tree for each distinct spec is built once under the shared
+    pytest temp root and snapshot-copied with hardlinks, so repeated
+    projects reuse the template's file content instead of rewriting it.
+
+    Args:
+        root: Project root containing the plugins directory.
+        spec: Plugin name, file patterns, and skill files to write.
+    """
+    base = root.parent
+    digest = hashlib.blake2b(
+        json.dumps(spec, sort_keys=True).encode(), digest_size=8
+    ).hexdigest()
+    key = (str(base), digest)
+
+    template = _template_cache.get(key)
+    if template is None:
+        template = base / "plugin_templates" / digest
+        _build_plugin_tree(template, spec)
+        _template_cache[key] = template
+
+    shutil.copytree(template, root / "plugins" / spec["name"], copy_function=os.link)
+
+
+def build_standards_project(
+    root: Path, config: dict, plugins: list[PluginSpec]
+) -> None:
+    """Scaffold a project with a config and standards plugins.
+
+    Args:
+        root: Empty project root directory.
+        config: Mapping dumped to .red64/config.yaml.
+        plugins: Plugin specs to scaffold under plugins/.
+    """
+    red64_dir = root / ".red64"
+    red64_dir.mkdir()
+
+    for spec in plugins:
+        make_plugin(root, spec)
+
+    # YAML is a superset of JSON, so the config can be emitted with the
+    # JSON serializer; the loader parses it like any other config.yaml.
+    (red64_dir / "config.yaml").write_text(_dumps(config))
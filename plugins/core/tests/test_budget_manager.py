@@ -9,38 +9,82 @@ Tests cover:
 - Includes exclusion summary when items removed
 """
 
-import json
-import subprocess
-import sys
-import tempfile
+import os
 from pathlib import Path
+from uuid import uuid4
 
 import pytest
 import yaml
 
+from tests.script_runner import (
+    YamlDumper as _YamlDumper,
+    json_dumps as _dumps,
+    json_loads as _loads,
+    load_script_module,
+    run_script_main,
+)
+
 
 SCRIPT_PATH = Path(__file__).parent.parent / "scripts" / "budget-manager.py"
 
 
-def create_temp_config(config_data: dict) -> str:
+def _write_file_bytes(path: Path, data: bytes) -> None:
+    """Write data to path through a raw file descriptor.
+
+    One open/write/close syscall sequence; skips the buffered
+    TextIOWrapper machinery the tests do not need for small blobs.
+
+    Args:
+        path: Destination file path.
+        data: Bytes to write.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+# Shared filler strings, built once at import so each test reuses the
+# same objects instead of allocating fresh multi-KB content payloads.
+_FILL_A = {n: "a" * n for n in (100, 160, 400, 800)}
+_FILL_B = {n: "b" * n for n in (400, 800, 4000)}
+_FILL_C = {n: "c" * n for n in (400, 800)}
+_FILL_X = {16000: "x" * 16000}
+
+
+@pytest.fixture(scope="class")
+def config_root(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Shared base directory for a test class's config files.
+
+    One pytest-managed directory per class replaces a mkdtemp call
+    per test; each config still gets a uniquely named subdirectory.
+    """
+    return tmp_path_factory.mktemp("red64cfg")
+
+
+def create_temp_config(config_data: dict, base: Path) -> str:
     """Create a temporary config file and return its path.
 
     Args:
         config_data: Configuration dictionary to write.
+        base: Shared base directory to create the config under.
 
     Returns:
         Path to the temporary config file.
     """
-    temp_dir = tempfile.mkdtemp()
-    config_path = Path(temp_dir) / ".red64" / "config.yaml"
-    config_path.parent.mkdir(parents=True)
-    with open(config_path, "w") as f:
-        yaml.dump(config_data, f)
+    config_dir = base / f"cfg_{uuid4().hex}" / ".red64"
+    os.makedirs(config_dir)
+    config_path = config_dir / "config.yaml"
+    _write_file_bytes(
+        config_path, yaml.dump(config_data, Dumper=_YamlDumper).encode()
+    )
     return str(config_path)
 
 
 def run_budget_manager(
     context_items: list[dict],
+    base: Path,
     config_path: str | None = None,
     config_data: dict | None = None,
 ) -> dict:
@@ -48,225 +92,166 @@ def run_budget_manager(
 
     Args:
         context_items: List of context items to process.
+        base: Shared base directory for any temp config file.
         config_path: Path to existing config file.
         config_data: Config data to write to temp file if config_path not provided.
 
     Returns:
         Parsed JSON output from the script.
     """
-    if config_path is None and config_data is not None:
-        config_path = create_temp_config(config_data)
-    elif config_path is None:
-        config_path = create_temp_config({
-            "version": "1.0",
-            "token_budget": {
-                "max_tokens": 3000,
-                "overflow_behavior": {
-                    "truncate": True,
-                    "exclude": True,
-                    "summary": True,
-                },
-            },
-        })
+    if config_path is None:
+        config_path = create_temp_config(config_data, base)
 
-    input_data = json.dumps({
+    input_data = _dumps({
         "context_items": context_items,
         "config_path": config_path,
     })
-    result = subprocess.run(
-        [sys.executable, str(SCRIPT_PATH)],
-        input=input_data,
-        capture_output=True,
-        text=True,
-    )
-    return json.loads(result.stdout)
-
-
-class TestBudgetManager:
-    """Test suite for budget-manager.py script."""
-
-    def test_reads_budget_from_config_token_budget_section(self):
-        """Test: Reads budget from config.yaml token_budget section.
-
-        With 4 chars per token:
-        - item1: 800 chars = 200 tokens
-        - item2: 800 chars = 200 tokens
-        - Budget of 150 tokens means only item1 should fit (with truncation)
-        """
-        config_data = {
-            "version": "1.0",
-            "token_budget": {
-                "max_tokens": 150,
-                "overflow_behavior": {
-                    "truncate": True,
-                    "exclude": True,
-                    "summary": True,
-                },
-            },
-        }
-
-        context_items = [
-            {"name": "item1", "content": "a" * 800, "priority": 1},
-            {"name": "item2", "content": "b" * 800, "priority": 2},
-        ]
-
-        result = run_budget_manager(context_items, config_data=config_data)
-
-        assert "selected_items" in result
-        selected_names = [item["name"] for item in result["selected_items"]]
-        assert "item1" in selected_names
-        assert "item2" not in selected_names
-
-    def test_uses_default_3000_tokens_if_not_specified(self):
-        """Test: Uses default 3000 tokens if not specified.
-
-        With 4 chars per token:
-        - 16000 chars = 4000 tokens
-        - Default budget is 3000 tokens = 12000 chars max
-        """
-        config_data = {
-            "version": "1.0",
-        }
+    stdout, _ = run_script_main(load_script_module(SCRIPT_PATH), input_data)
+    return _loads(stdout)
 
-        context_items = [
-            {"name": "item1", "content": "x" * 16000, "priority": 1},
-        ]
 
-        result = run_budget_manager(context_items, config_data=config_data)
+def _budget_config(max_tokens: int) -> dict:
+    """Build a config dict with the given token budget.
 
-        assert "selected_items" in result
-        assert len(result["selected_items"]) == 1
-        selected_content = result["selected_items"][0]["content"]
-        assert len(selected_content) <= 12003
-
-    def test_sorts_context_items_by_priority_lower_is_higher(self):
-        """Test: Sorts context items by priority (lower number = higher priority).
-
-        With 4 chars per token:
-        - Each item: 400 chars = 100 tokens
-        - Budget of 100 tokens means only highest priority item fits
-        """
-        config_data = {
-            "version": "1.0",
-            "token_budget": {
-                "max_tokens": 100,
-                "overflow_behavior": {
-                    "truncate": True,
-                    "exclude": True,
-                    "summary": True,
-                },
-            },
-        }
-
-        context_items = [
-            {"name": "low_priority", "content": "c" * 400, "priority": 3},
-            {"name": "high_priority", "content": "a" * 400, "priority": 1},
-            {"name": "medium_priority", "content": "b" * 400, "priority": 2},
-        ]
-
-        result = run_budget_manager(context_items, config_data=config_data)
-
-        assert "selected_items" in result
-        if len(result["selected_items"]) > 0:
-            assert result["selected_items"][0]["name"] == "high_priority"
-
-    def test_truncates_lower_priority_items_when_budget_exceeded(self):
-        """Test: Truncates lower-priority items when budget exceeded.
+    Args:
+        max_tokens: Token budget for the config.
 
-        With 4 chars per token:
-        - high_priority: 400 chars = 100 tokens
-        - low_priority: 800 chars = 200 tokens
-        - Budget of 150 tokens: high fits (100), low gets truncated
-        """
-        config_data = {
-            "version": "1.0",
-            "token_budget": {
-                "max_tokens": 150,
-                "overflow_behavior": {
-                    "truncate": True,
-                    "exclude": True,
-                    "summary": True,
-                },
+    Returns:
+        Config dict with all overflow behaviors enabled.
+    """
+    return {
+        "version": "1.0",
+        "token_budget": {
+            "max_tokens": max_tokens,
+            "overflow_behavior": {
+                "truncate": True,
+                "exclude": True,
+                "summary": True,
             },
-        }
+        },
+    }
+
+
+def _verify_reads_budget_from_config(result: dict) -> None:
+    """item1/item2 are 200 tokens each; budget 150 fits only item1."""
+    selected_names = [item["name"] for item in result["selected_items"]]
+    assert "item1" in selected_names
+    assert "item2" not in selected_names
+
+
+def _verify_default_budget(result: dict) -> None:
+    """16000 chars = 4000 tokens; default 3000-token budget caps at 12000 chars."""
+    assert len(result["selected_items"]) == 1
+    selected_content = result["selected_items"][0]["content"]
+    assert len(selected_content) <= 12003
+
+
+def _verify_priority_sort(result: dict) -> None:
+    """100 tokens per item, budget 100: the priority-1 item comes first."""
+    if len(result["selected_items"]) > 0:
+        assert result["selected_items"][0]["name"] == "high_priority"
+
+
+def _verify_truncates_lower_priority(result: dict) -> None:
+    """Budget 150: high (100 tokens) fits intact, low (200) is truncated."""
+    selected = {item["name"]: item for item in result["selected_items"]}
+    assert "high_priority" in selected
+    assert len(selected["high_priority"]["content"]) == 400
+    if "low_priority" in selected:
+        assert len(selected["low_priority"]["content"]) < 800
+
+
+def _verify_excludes_when_truncation_insufficient(result: dict) -> None:
+    """Budget 50: must_include (40 tokens) fits, the 200-token items drop."""
+    selected_names = [item["name"] for item in result["selected_items"]]
+    assert "must_include" in selected_names
+    assert "also_exclude" not in selected_names
+
+
+def _verify_exclusion_summary(result: dict) -> None:
+    """Budget 30: excluded_item (1000 tokens) is dropped and summarized."""
+    assert "exclusion_summary" in result
+    summary = result["exclusion_summary"]
+    assert "excluded_item" in summary or "1" in summary
+
+
+# (config_data, context_items, verify) per behavior; token math assumes
+# 4 chars per token throughout.
+_BUDGET_CASES = [
+    pytest.param(
+        _budget_config(150),
+        [
+            {"name": "item1", "content": _FILL_A[800], "priority": 1},
+            {"name": "item2", "content": _FILL_B[800], "priority": 2},
+        ],
+        _verify_reads_budget_from_config,
+        id="reads-budget-from-config",
+    ),
+    pytest.param(
+        {"version": "1.0"},
+        [{"name": "item1", "content": _FILL_X[16000], "priority": 1}],
+        _verify_default_budget,
+        id="default-3000-tokens",
+    ),
+    pytest.param(
+        _budget_config(100),
+        [
+            {"name": "low_priority", "content": _FILL_C[400], "priority": 3},
+            {"name": "high_priority", "content": _FILL_A[400], "priority": 1},
+            {"name": "medium_priority", "content": _FILL_B[400], "priority": 2},
+        ],
+        _verify_priority_sort,
+        id="sorts-by-priority",
+    ),
+    pytest.param(
+        _budget_config(150),
+        [
+            {"name": "high_priority", "content": _FILL_A[400], "priority": 1},
+            {"name": "low_priority", "content": _FILL_B[800], "priority": 2},
+        ],
+        _verify_truncates_lower_priority,
+        id="truncates-lower-priority",
+    ),
+    pytest.param(
+        _budget_config(50),
+        [
+            {"name": "must_include", "content": _FILL_A[160], "priority": 1},
+            {"name": "can_exclude", "content": _FILL_B[800], "priority": 2},
+            {"name": "also_exclude", "content": _FILL_C[800], "priority": 3},
+        ],
+        _verify_excludes_when_truncation_insufficient,
+        id="excludes-when-truncation-insufficient",
+    ),
+    pytest.param(
+        _budget_config(30),
+        [
+            {"name": "included", "content": _FILL_A[100], "priority": 1},
+            {"name": "excluded_item", "content": _FILL_B[4000], "priority": 2},
+        ],
+        _verify_exclusion_summary,
+        id="exclusion-summary",
+    ),
+]
 
-        context_items = [
-            {"name": "high_priority", "content": "a" * 400, "priority": 1},
-            {"name": "low_priority", "content": "b" * 800, "priority": 2},
-        ]
 
-        result = run_budget_manager(context_items, config_data=config_data)
-
-        assert "selected_items" in result
-        selected = {item["name"]: item for item in result["selected_items"]}
-
-        assert "high_priority" in selected
-        assert len(selected["high_priority"]["content"]) == 400
-
-        if "low_priority" in selected:
-            assert len(selected["low_priority"]["content"]) < 800
-
-    def test_excludes_items_entirely_if_truncation_insufficient(self):
-        """Test: Excludes items entirely if truncation insufficient.
+class TestBudgetManager:
+    """Test suite for budget-manager.py script."""
 
-        With 4 chars per token:
-        - must_include: 160 chars = 40 tokens
-        - can_exclude: 800 chars = 200 tokens
-        - also_exclude: 800 chars = 200 tokens
-        - Budget of 50 tokens: must_include fits, others excluded
+    @pytest.mark.parametrize("config_data,context_items,verify", _BUDGET_CASES)
+    def test_budget_management(
+        self,
+        config_root: Path,
+        config_data: dict,
+        context_items: list[dict],
+        verify,
+    ):
+        """Test: budget manager behaviors over shared scaffolding.
+
+        The six original cases differed only in config, items, and
+        assertions, so they run as one data-driven test; each case's
+        expectations live in its verify function.
         """
-        config_data = {
-            "version": "1.0",
-            "token_budget": {
-                "max_tokens": 50,
-                "overflow_behavior": {
-                    "truncate": True,
-                    "exclude": True,
-                    "summary": True,
-                },
-            },
-        }
-
-        context_items = [
-            {"name": "must_include", "content": "a" * 160, "priority": 1},
-            {"name": "can_exclude", "content": "b" * 800, "priority": 2},
-            {"name": "also_exclude", "content": "c" * 800, "priority": 3},
-        ]
-
-        result = run_budget_manager(context_items, config_data=config_data)
+        result = run_budget_manager(context_items, config_root, config_data=config_data)
 
         assert "selected_items" in result
-        selected_names = [item["name"] for item in result["selected_items"]]
-        assert "must_include" in selected_names
-        assert "also_exclude" not in selected_names
-
-    def test_includes_exclusion_summary_when_items_removed(self):
-        """Test: Includes exclusion summary when items removed.
-
-        With 4 chars per token:
-        - included: 100 chars = 25 tokens
-        - excluded_item: 4000 chars = 1000 tokens
-        - Budget of 30 tokens: included fits, excluded_item is excluded
-        """
-        config_data = {
-            "version": "1.0",
-            "token_budget": {
-                "max_tokens": 30,
-                "overflow_behavior": {
-                    "truncate": True,
-                    "exclude": True,
-                    "summary": True,
-                },
-            },
-        }
-
-        context_items = [
-            {"name": "included", "content": "a" * 100, "priority": 1},
-            {"name": "excluded_item", "content": "b" * 4000, "priority": 2},
-        ]
-
-        result = run_budget_manager(context_items, config_data=config_data)
-
-        assert "exclusion_summary" in result
-        summary = result["exclusion_summary"]
-        assert "excluded_item" in summary or "1" in summary
+        verify(result)
@@ -7,18 +7,20 @@ Tests cover:
 - Skip message follows pattern from red64-init.md
 """
 
-import shutil
-import tempfile
+import functools
 from pathlib import Path
 
-import pytest
-
 
 TEMPLATES_DIR = Path(__file__).parent.parent / "templates"
 
 
+@functools.lru_cache(maxsize=16)
 def read_template(name: str) -> str:
-    """Read a template file and return its content."""
+    """Read a template file and return its content.
+
+    Templates are static for the duration of a test run, so each one
+    is read from disk once and served from the cache afterwards.
+    """
     template_path = TEMPLATES_DIR / name
     return template_path.read_text()
 
@@ -58,20 +60,13 @@ def simulate_plan_command(
 class TestPlanMissionCommand:
     """Test suite for /red64:plan-mission command behavior."""
 
-    @pytest.fixture
-    def temp_project(self):
-        """Create a temporary project directory for testing."""
-        temp_dir = tempfile.mkdtemp()
-        yield Path(temp_dir)
-        shutil.rmtree(temp_dir)
-
-    def test_creates_file_at_correct_path_when_missing(self, temp_project: Path):
+    def test_creates_file_at_correct_path_when_missing(self, tmp_path: Path):
         """Test: /red64:plan-mission creates file at correct path when missing."""
-        target_path = temp_project / ".red64" / "product" / "mission.md"
+        target_path = tmp_path / ".red64" / "product" / "mission.md"
         assert not target_path.exists()
 
         created, message = simulate_plan_command(
-            temp_project,
+            tmp_path,
             "mission.md",
             "mission-template.md",
         )
@@ -80,15 +75,15 @@ class TestPlanMissionCommand:
         assert target_path.exists()
         assert target_path.is_file()
 
-    def test_skips_with_message_when_file_exists(self, temp_project: Path):
+    def test_skips_with_message_when_file_exists(self, tmp_path: Path):
         """Test: /red64:plan-mission skips with message when file exists."""
-        product_dir = temp_project / ".red64" / "product"
+        product_dir = tmp_path / ".red64" / "product"
         product_dir.mkdir(parents=True, exist_ok=True)
         target_path = product_dir / "mission.md"
         target_path.write_text("# Existing Mission\n\nCustom content.")
 
         created, message = simulate_plan_command(
-            temp_project,
+            tmp_path,
             "mission.md",
             "mission-template.md",
         )
@@ -100,10 +95,10 @@ class TestPlanMissionCommand:
         content = target_path.read_text()
         assert "Custom content" in content
 
-    def test_success_message_includes_file_path(self, temp_project: Path):
+    def test_success_message_includes_file_path(self, tmp_path: Path):
         """Test: Success message includes created file path."""
         created, message = simulate_plan_command(
-            temp_project,
+            tmp_path,
             "mission.md",
             "mission-template.md",
         )
@@ -112,19 +107,19 @@ class TestPlanMissionCommand:
         assert "Success" in message
         assert ".red64/product/mission.md" in message
 
-    def test_skip_message_follows_pattern(self, temp_project: Path):
+    def test_skip_message_follows_pattern(self, tmp_path: Path):
         """Test: Skip message follows pattern from red64-init.md.
 
         The skip message should follow the format:
         "Skipped: [path] already exists. No changes made."
         """
-        product_dir = temp_project / ".red64" / "product"
+        product_dir = tmp_path / ".red64" / "product"
         product_dir.mkdir(parents=True, exist_ok=True)
         target_path = product_dir / "mission.md"
         target_path.write_text("# Existing Mission")
 
         created, message = simulate_plan_command(
-            temp_project,
+            tmp_path,
             "mission.md",
             "mission-template.md",
         )
@@ -11,21 +11,109 @@ Tests cover:
 - Error message directs user to run /red64:init if config missing
 """
 
-import json
 import os
-import subprocess
-import sys
-import tempfile
 from pathlib import Path
+from uuid import uuid4
 
 import pytest
 import yaml
 
+from tests.script_runner import (
+    YamlDumper as _YamlDumper,
+    json_dumps as _dumps,
+    json_loads as _loads,
+    load_script_module,
+    run_script_main,
+)
+
 
 SCRIPT_PATH = Path(__file__).parent.parent / "scripts" / "context-loader.py"
 
 
+_DEFAULT_CONFIG = {
+    "version": "1.0",
+    "token_budget": {
+        "max_tokens": 3000,
+        "overflow_behavior": {
+            "truncate": True,
+            "exclude": True,
+            "summary": True,
+        },
+    },
+    "context_loader": {
+        "enabled": True,
+        "task_detection": True,
+        "file_type_detection": True,
+    },
+    "priorities": {
+        "product_mission": 1,
+        "current_spec": 2,
+        "relevant_standards": 3,
+        "tech_stack": 4,
+        "roadmap": 5,
+    },
+    "features": {
+        "standards_injection": False,
+        "multi_agent": False,
+        "metrics": False,
+    },
+}
+
+# The default config is serialized once at import; tests that use it
+# write the cached text instead of re-dumping an identical dict.
+_DEFAULT_CONFIG_YAML = yaml.dump(_DEFAULT_CONFIG, Dumper=_YamlDumper)
+
+
+def _write_file_bytes(path: Path, data: bytes) -> None:
+    """Write data to path through a raw file descriptor.
+
+    One open/write/close syscall sequence; skips the buffered
+    TextIOWrapper machinery the tests do not need for small blobs.
+
+    Args:
+        path: Destination file path.
+        data: Bytes to write.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+# First default-config file written under each base dir; later tests
+# hardlink it rather than writing the same bytes again.
+_default_config_src: dict[str, str] = {}
+
+
+def _place_default_config(config_path: Path, base: Path) -> None:
+    """Materialize the default config at config_path.
+
+    Args:
+        config_path: Destination config.yaml path.
+        base: Shared base directory owning the linked source copy.
+    """
+    src = _default_config_src.get(str(base))
+    if src is None:
+        src_path = base / "default-config.yaml"
+        src_path.write_text(_DEFAULT_CONFIG_YAML)
+        src = str(src_path)
+        _default_config_src[str(base)] = src
+    os.link(src, config_path)
+
+
+@pytest.fixture(scope="class")
+def project_root(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Shared base directory for a test class's project trees.
+
+    One pytest-managed directory per class replaces a mkdtemp call
+    per test; each project still gets a uniquely named subdirectory.
+    """
+    return tmp_path_factory.mktemp("red64proj")
+
+
 def create_temp_project(
+    base: Path,
     with_config: bool = True,
     config_data: dict | None = None,
     malformed_yaml: bool = False,
@@ -33,6 +121,7 @@ def create_temp_project(
     """Create a temporary project directory with optional .red64/config.yaml.
 
     Args:
+        base: Shared base directory to create the project under.
         with_config: Whether to create config.yaml.
         config_data: Custom config data (uses defaults if None).
         malformed_yaml: If True, write invalid YAML content.
@@ -40,52 +129,36 @@ def create_temp_project(
     Returns:
         Path to the temporary project directory.
     """
-    temp_dir = tempfile.mkdtemp()
+    temp_dir = str(base / f"proj_{uuid4().hex}")
 
     if with_config:
         red64_dir = Path(temp_dir) / ".red64"
-        red64_dir.mkdir(parents=True)
+        os.makedirs(red64_dir)
         config_path = red64_dir / "config.yaml"
 
         if malformed_yaml:
-            with open(config_path, "w") as f:
-                f.write("invalid: yaml: content: [unclosed")
+            _write_file_bytes(config_path, b"invalid: yaml: content: [unclosed")
+        elif config_data is None:
+            _place_default_config(config_path, base)
         else:
-            if config_data is None:
-                config_data = {
-                    "version": "1.0",
-                    "token_budget": {
-                        "max_tokens": 3000,
-                        "overflow_behavior": {
-                            "truncate": True,
-                            "exclude": True,
-                            "summary": True,
-                        },
-                    },
-                    "context_loader": {
-                        "enabled": True,
-                        "task_detection": True,
-                        "file_type_detection": True,
-                    },
-                    "priorities": {
-                        "product_mission": 1,
-                        "current_spec": 2,
-                        "relevant_standards": 3,
-                        "tech_stack": 4,
-                        "roadmap": 5,
-                    },
-                    "features": {
-                        "standards_injection": False,
-                        "multi_agent": False,
-                        "metrics": False,
-                    },
-                }
-            with open(config_path, "w") as f:
-                yaml.dump(config_data, f)
+            _write_file_bytes(
+                config_path, yaml.dump(config_data, Dumper=_YamlDumper).encode()
+            )
 
+    os.makedirs(temp_dir, exist_ok=True)
     return temp_dir
 
 
+@pytest.fixture(scope="class")
+def default_project(project_root: Path) -> str:
+    """One default-config project shared by the class's read-only tests.
+
+    The context-loader tests only read the tree, so seven identical
+    default projects collapse into a single build.
+    """
+    return create_temp_project(project_root)
+
+
 def run_context_loader(
     prompt: str = "test prompt",
     session_id: str = "test-session",
@@ -106,44 +179,40 @@ def run_context_loader(
     if cwd is None:
         cwd = os.getcwd()
 
-    input_data = json.dumps({
+    input_data = _dumps({
         "session_id": session_id,
         "prompt": prompt,
         "cwd": cwd,
         "permission_mode": permission_mode,
     })
 
-    result = subprocess.run(
-        [sys.executable, str(SCRIPT_PATH)],
-        input=input_data,
-        capture_output=True,
-        text=True,
-        env={**os.environ, "PYTHONPATH": str(SCRIPT_PATH.parent)},
+    stdout, exit_code = run_script_main(
+        load_script_module(SCRIPT_PATH), input_data
     )
 
-    try:
-        output = json.loads(result.stdout)
-    except json.JSONDecodeError:
-        output = result.stdout
+    # Sniff the first character instead of paying for a raised
+    # JSONDecodeError on every non-JSON response.
+    if stdout[:1] in ("{", "["):
+        output = _loads(stdout)
+    else:
+        output = stdout
 
-    return output, result.returncode
+    return output, exit_code
 
 
 class TestContextLoader:
     """Test suite for context-loader.py main script."""
 
-    def test_receives_prompt_via_stdin_json_correctly(self):
+    def test_receives_prompt_via_stdin_json_correctly(self, default_project: str):
         """Test: Receives prompt via stdin JSON correctly.
 
         The script should accept JSON input with session_id, prompt, cwd,
         and permission_mode fields and process without error.
         """
-        temp_dir = create_temp_project(with_config=True)
-
         output, exit_code = run_context_loader(
             prompt="Implement a new feature",
             session_id="session-123",
-            cwd=temp_dir,
+            cwd=default_project,
             permission_mode="default",
         )
 
@@ -151,13 +220,13 @@ class TestContextLoader:
         assert isinstance(output, dict)
         assert "hookSpecificOutput" in output
 
-    def test_validates_config_presence_exits_code_2_if_missing(self):
+    def test_validates_config_presence_exits_code_2_if_missing(self, project_root: Path):
         """Test: Validates config presence and exits code 2 if missing.
 
         When .red64/config.yaml does not exist, the script should exit
         with code 2 (blocking error).
         """
-        temp_dir = create_temp_project(with_config=False)
+        temp_dir = create_temp_project(project_root, with_config=False)
 
         output, exit_code = run_context_loader(
             prompt="Implement a new feature",
@@ -166,13 +235,13 @@ class TestContextLoader:
 
         assert exit_code == 2
 
-    def test_validates_config_format_exits_code_2_if_malformed(self):
+    def test_validates_config_format_exits_code_2_if_malformed(self, project_root: Path):
         """Test: Validates config format and exits code 2 if malformed.
 
         When config.yaml contains invalid YAML, the script should exit
         with code 2 (blocking error).
         """
-        temp_dir = create_temp_project(with_config=True, malformed_yaml=True)
+        temp_dir = create_temp_project(project_root, malformed_yaml=True)
 
         output, exit_code = run_context_loader(
             prompt="Implement a new feature",
@@ -181,17 +250,15 @@ class TestContextLoader:
 
         assert exit_code == 2
 
-    def test_chains_to_task_detector_and_captures_output(self):
+    def test_chains_to_task_detector_and_captures_output(self, default_project: str):
         """Test: Chains to task-detector.py and captures output.
 
         The context loader should invoke task-detector.py and include
         the detected task type in its output.
         """
-        temp_dir = create_temp_project(with_config=True)
-
         output, exit_code = run_context_loader(
             prompt="Implement the user authentication feature",
-            cwd=temp_dir,
+            cwd=default_project,
         )
 
         assert exit_code == 0
@@ -199,17 +266,15 @@ class TestContextLoader:
         additional_context = output["hookSpecificOutput"]["additionalContext"]
         assert "implement" in additional_context.lower() or "task" in additional_context.lower()
 
-    def test_chains_to_file_detector_and_captures_output(self):
+    def test_chains_to_file_detector_and_captures_output(self, default_project: str):
         """Test: Chains to file-detector.py and captures output.
 
         The context loader should invoke file-detector.py and include
         detected file types in its output.
         """
-        temp_dir = create_temp_project(with_config=True)
-
         output, exit_code = run_context_loader(
             prompt="Update the config.yaml and main.py files",
-            cwd=temp_dir,
+            cwd=default_project,
         )
 
         assert exit_code == 0
@@ -217,34 +282,30 @@ class TestContextLoader:
         additional_context = output["hookSpecificOutput"]["additionalContext"]
         assert ".py" in additional_context or ".yaml" in additional_context or "file" in additional_context.lower()
 
-    def test_chains_to_budget_manager_and_captures_output(self):
+    def test_chains_to_budget_manager_and_captures_output(self, default_project: str):
         """Test: Chains to budget-manager.py and captures output.
 
         The context loader should invoke budget-manager.py to manage
         token budget for context items.
         """
-        temp_dir = create_temp_project(with_config=True)
-
         output, exit_code = run_context_loader(
             prompt="Review the codebase",
-            cwd=temp_dir,
+            cwd=default_project,
         )
 
         assert exit_code == 0
         assert isinstance(output, dict)
         assert "hookSpecificOutput" in output
 
-    def test_returns_valid_json_with_hook_specific_output(self):
+    def test_returns_valid_json_with_hook_specific_output(self, default_project: str):
         """Test: Returns valid JSON with hookSpecificOutput.additionalContext.
 
         The output must follow the Claude Code hook specification with
         the hookSpecificOutput.additionalContext structure.
         """
-        temp_dir = create_temp_project(with_config=True)
-
         output, exit_code = run_context_loader(
             prompt="Debug the failing tests",
-            cwd=temp_dir,
+            cwd=default_project,
         )
 
         assert exit_code == 0
@@ -253,13 +314,13 @@ class TestContextLoader:
         assert "additionalContext" in output["hookSpecificOutput"]
         assert isinstance(output["hookSpecificOutput"]["additionalContext"], str)
 
-    def test_error_message_directs_user_to_run_red64_init(self):
+    def test_error_message_directs_user_to_run_red64_init(self, project_root: Path):
         """Test: Error message directs user to run /red64:init if config missing.
 
         When config is missing, the error message should include clear
         instructions to run /red64:init.
         """
-        temp_dir = create_temp_project(with_config=False)
+        temp_dir = create_temp_project(project_root, with_config=False)
 
         output, exit_code = run_context_loader(
             prompt="Implement a new feature",
@@ -7,53 +7,25 @@ Tests cover:
 - Multiple standards skills are included with precedence header
 """
 
-import json
-import shutil
-import subprocess
-import sys
-import tempfile
 from pathlib import Path
+from uuid import uuid4
 
 import pytest
-import yaml
+
+from tests.script_runner import (
+    json_dumps as _dumps,
+    json_loads as _loads,
+    load_script_module,
+    run_script_main,
+)
+from tests.standards_tree import build_standards_project
 
 
 SCRIPTS_DIR = Path(__file__).parent.parent / "scripts"
 CONTEXT_LOADER_SCRIPT = SCRIPTS_DIR / "context-loader.py"
 STANDARDS_LOADER_SCRIPT = SCRIPTS_DIR / "standards-loader.py"
 
-
-class TestStandardsSkillsInContextOutput:
-    """Tests for standards skills appearing in context output."""
-
-    @pytest.fixture
-    def temp_project_with_standards(self):
-        """Create a temporary project with enabled standards and skills."""
-        temp_dir = tempfile.mkdtemp()
-        red64_dir = Path(temp_dir) / ".red64"
-        red64_dir.mkdir()
-
-        plugin_dir = Path(temp_dir) / "plugins" / "red64-standards-typescript"
-        plugin_dir.mkdir(parents=True)
-        (plugin_dir / ".claude-plugin").mkdir()
-        (plugin_dir / "skills").mkdir()
-        (plugin_dir / "hooks").mkdir()
-
-        plugin_json = {
-            "name": "red64-standards-typescript",
-            "category": "standards",
-        }
-        with open(plugin_dir / ".claude-plugin" / "plugin.json", "w") as f:
-            json.dump(plugin_json, f)
-
-        standards_json = {
-            "name": "typescript-standards",
-            "file_patterns": ["*.ts", "*.tsx"],
-        }
-        with open(plugin_dir / "standards.json", "w") as f:
-            json.dump(standards_json, f)
-
-        skill_content = """# Naming Conventions
+NAMING_CONVENTIONS_SKILL = """# Naming Conventions
 
 ## DO
 
@@ -67,326 +39,236 @@ const userName = 'Alice';
 
 Avoid single-letter names.
 """
-        with open(plugin_dir / "skills" / "naming-conventions.md", "w") as f:
-            f.write(skill_content)
 
-        hooks_json = {"hooks": {}}
-        with open(plugin_dir / "hooks" / "hooks.json", "w") as f:
-            json.dump(hooks_json, f)
 
-        config_content = {
-            "version": "1.0",
-            "token_budget": {"max_tokens": 5000},
-            "standards": {
-                "enabled": ["red64-standards-typescript"],
-                "token_budget_priority": 3,
-            },
-        }
-        with open(red64_dir / "config.yaml", "w") as f:
-            yaml.dump(config_content, f)
+def run_context_loader(prompt: str, cwd: Path) -> tuple[dict, int]:
+    """Run context-loader.py in-process and parse its JSON output.
 
-        yield Path(temp_dir)
-        shutil.rmtree(temp_dir)
+    The hook payload varies only in prompt and cwd across these
+    tests, so it is assembled and serialized here once per call.
 
-    def test_standards_skills_included_in_context_when_file_type_matches(
-        self, temp_project_with_standards: Path
-    ):
-        """Test: Standards skills are included in context output when file types match."""
-        input_data = {
+    Args:
+        prompt: User prompt to present in the hook payload.
+        cwd: Project directory the loader should resolve against.
+
+    Returns:
+        Tuple of (parsed JSON output, exit code).
+    """
+    input_data = _dumps(
+        {
             "session_id": "test-session",
-            "prompt": "Edit the app.ts file to add a new function",
-            "cwd": str(temp_project_with_standards),
+            "prompt": prompt,
+            "cwd": str(cwd),
             "permission_mode": "default",
         }
+    )
+    stdout, exit_code = run_script_main(
+        load_script_module(CONTEXT_LOADER_SCRIPT), input_data
+    )
+    return _loads(stdout), exit_code
+
+
+def run_standards_loader(input_data: dict) -> tuple[dict, int]:
+    """Run standards-loader.py in-process and parse its JSON output.
 
-        result = subprocess.run(
-            [sys.executable, str(CONTEXT_LOADER_SCRIPT)],
-            input=json.dumps(input_data),
-            capture_output=True,
-            text=True,
-            cwd=str(temp_project_with_standards),
-        )
-
-        output = json.loads(result.stdout)
-        additional_context = output.get("hookSpecificOutput", {}).get(
-            "additionalContext", ""
-        )
-        assert "Standards:" in additional_context or "red64-standards-typescript" in additional_context
-
-
-class TestFileTypeMatchingLoadsStandards:
-    """Tests for file type matching to load correct standards."""
-
-    @pytest.fixture
-    def temp_project_with_multi_standards(self):
-        """Create project with multiple standards for different file types."""
-        temp_dir = tempfile.mkdtemp()
-        red64_dir = Path(temp_dir) / ".red64"
-        red64_dir.mkdir()
-
-        for plugin_name, patterns, skill_content in [
-            (
-                "red64-standards-typescript",
-                ["*.ts", "*.tsx"],
-                "# TypeScript Standard\n\n## DO\n\nUse types.\n\n## DON'T\n\nAvoid any.",
-            ),
-            (
-                "red64-standards-python",
-                ["*.py"],
-                "# Python Standard\n\n## DO\n\nUse type hints.\n\n## DON'T\n\nAvoid bare except.",
-            ),
-        ]:
-            plugin_dir = Path(temp_dir) / "plugins" / plugin_name
-            plugin_dir.mkdir(parents=True)
-            (plugin_dir / ".claude-plugin").mkdir()
-            (plugin_dir / "skills").mkdir()
-            (plugin_dir / "hooks").mkdir()
-
-            plugin_json = {"name": plugin_name, "category": "standards"}
-            with open(plugin_dir / ".claude-plugin" / "plugin.json", "w") as f:
-                json.dump(plugin_json, f)
-
-            standards_json = {"name": plugin_name, "file_patterns": patterns}
-            with open(plugin_dir / "standards.json", "w") as f:
-                json.dump(standards_json, f)
-
-            with open(plugin_dir / "skills" / "main.md", "w") as f:
-                f.write(skill_content)
-
-            hooks_json = {"hooks": {}}
-            with open(plugin_dir / "hooks" / "hooks.json", "w") as f:
-                json.dump(hooks_json, f)
-
-        config_content = {
+    Args:
+        input_data: Loader input payload (file_types and "cwd").
+
+    Returns:
+        Tuple of (parsed JSON output, exit code).
+    """
+    stdout, exit_code = run_script_main(
+        load_script_module(STANDARDS_LOADER_SCRIPT), _dumps(input_data)
+    )
+    return _loads(stdout), exit_code
+
+
+def _additional_context(output: dict) -> str:
+    """Extract additionalContext from a context loader hook output."""
+    return output.get("hookSpecificOutput", {}).get("additionalContext", "")
+
+
+def _verify_skills_in_context(output: dict) -> None:
+    """Standards skills appear in context when file types match."""
+    context = _additional_context(output)
+    assert "Standards:" in context or "red64-standards-typescript" in context
+
+
+def _verify_file_type_matching(output: dict) -> None:
+    """TypeScript standards are loaded when .tsx files are mentioned."""
+    context = _additional_context(output)
+    assert "typescript" in context.lower() or ".ts" in context
+
+
+def _verify_budget_priority(output: dict) -> None:
+    """Loader produces hook output under a tight standards budget."""
+    assert "hookSpecificOutput" in output
+
+
+def _verify_precedence(output: dict) -> None:
+    """Multiple standards appear with precedence information."""
+    context = _additional_context(output)
+    assert "strict" in context.lower() or "Standards" in context
+
+
+_CONTEXT_CASES = [
+    pytest.param(
+        {
+            "version": "1.0",
+            "token_budget": {"max_tokens": 5000},
+            "standards": {
+                "enabled": ["red64-standards-typescript"],
+                "token_budget_priority": 3,
+            },
+        },
+        [
+            {
+                "name": "red64-standards-typescript",
+                "standards_name": "typescript-standards",
+                "file_patterns": ["*.ts", "*.tsx"],
+                "skills": {"naming-conventions": NAMING_CONVENTIONS_SKILL},
+            },
+        ],
+        "Edit the app.ts file to add a new function",
+        _verify_skills_in_context,
+        id="skills-in-context",
+    ),
+    pytest.param(
+        {
             "version": "1.0",
             "token_budget": {"max_tokens": 5000},
             "standards": {
                 "enabled": ["red64-standards-typescript", "red64-standards-python"],
                 "token_budget_priority": 3,
             },
-        }
-        with open(red64_dir / "config.yaml", "w") as f:
-            yaml.dump(config_content, f)
-
-        yield Path(temp_dir)
-        shutil.rmtree(temp_dir)
-
-    def test_typescript_standards_loaded_for_ts_files(
-        self, temp_project_with_multi_standards: Path
-    ):
-        """Test: TypeScript standards are loaded when .ts files are detected."""
-        input_data = {
-            "session_id": "test-session",
-            "prompt": "Update the component.tsx file",
-            "cwd": str(temp_project_with_multi_standards),
-            "permission_mode": "default",
-        }
-
-        result = subprocess.run(
-            [sys.executable, str(CONTEXT_LOADER_SCRIPT)],
-            input=json.dumps(input_data),
-            capture_output=True,
-            text=True,
-            cwd=str(temp_project_with_multi_standards),
-        )
-
-        output = json.loads(result.stdout)
-        additional_context = output.get("hookSpecificOutput", {}).get(
-            "additionalContext", ""
-        )
-        assert "typescript" in additional_context.lower() or ".ts" in additional_context
-
-
-class TestTokenBudgetPriorityRespected:
-    """Tests for token budget respecting standards.token_budget_priority."""
-
-    @pytest.fixture
-    def temp_project_with_priority(self):
-        """Create project with configured token budget priority."""
-        temp_dir = tempfile.mkdtemp()
-        red64_dir = Path(temp_dir) / ".red64"
-        red64_dir.mkdir()
-
-        plugin_dir = Path(temp_dir) / "plugins" / "red64-standards-test"
-        plugin_dir.mkdir(parents=True)
-        (plugin_dir / ".claude-plugin").mkdir()
-        (plugin_dir / "skills").mkdir()
-        (plugin_dir / "hooks").mkdir()
-
-        plugin_json = {"name": "red64-standards-test", "category": "standards"}
-        with open(plugin_dir / ".claude-plugin" / "plugin.json", "w") as f:
-            json.dump(plugin_json, f)
-
-        standards_json = {"name": "test", "file_patterns": ["*.ts"]}
-        with open(plugin_dir / "standards.json", "w") as f:
-            json.dump(standards_json, f)
-
-        long_skill = "# Long Skill\n\n## DO\n\n" + "Use patterns. " * 100 + "\n\n## DON'T\n\nAvoid bad patterns."
-        with open(plugin_dir / "skills" / "long-skill.md", "w") as f:
-            f.write(long_skill)
-
-        hooks_json = {"hooks": {}}
-        with open(plugin_dir / "hooks" / "hooks.json", "w") as f:
-            json.dump(hooks_json, f)
-
-        config_content = {
+        },
+        [
+            {
+                "name": "red64-standards-typescript",
+                "file_patterns": ["*.ts", "*.tsx"],
+                "skills": {
+                    "main": "# TypeScript Standard\n\n## DO\n\nUse types.\n\n## DON'T\n\nAvoid any.",
+                },
+            },
+            {
+                "name": "red64-standards-python",
+                "file_patterns": ["*.py"],
+                "skills": {
+                    "main": "# Python Standard\n\n## DO\n\nUse type hints.\n\n## DON'T\n\nAvoid bare except.",
+                },
+            },
+        ],
+        "Update the component.tsx file",
+        _verify_file_type_matching,
+        id="file-type-matching",
+    ),
+    pytest.param(
+        {
             "version": "1.0",
             "token_budget": {"max_tokens": 500},
             "standards": {
                 "enabled": ["red64-standards-test"],
                 "token_budget_priority": 2,
             },
-        }
-        with open(red64_dir / "config.yaml", "w") as f:
-            yaml.dump(config_content, f)
-
-        yield Path(temp_dir)
-        shutil.rmtree(temp_dir)
-
-    def test_standards_priority_affects_budget_allocation(
-        self, temp_project_with_priority: Path
-    ):
-        """Test: Token budget priority setting affects standards allocation."""
-        input_data = {
-            "session_id": "test-session",
-            "prompt": "Edit the main.ts file",
-            "cwd": str(temp_project_with_priority),
-            "permission_mode": "default",
-        }
-
-        result = subprocess.run(
-            [sys.executable, str(CONTEXT_LOADER_SCRIPT)],
-            input=json.dumps(input_data),
-            capture_output=True,
-            text=True,
-            cwd=str(temp_project_with_priority),
-        )
-
-        assert result.returncode == 0
-        output = json.loads(result.stdout)
-        assert "hookSpecificOutput" in output
-
-
-class TestMultipleStandardsWithPrecedence:
-    """Tests for multiple standards with precedence information."""
-
-    @pytest.fixture
-    def temp_project_multiple_standards(self):
-        """Create project with multiple standards for same file type."""
-        temp_dir = tempfile.mkdtemp()
-        red64_dir = Path(temp_dir) / ".red64"
-        red64_dir.mkdir()
-
-        for plugin_name, skill_name in [
-            ("red64-standards-strict", "strict-rules"),
-            ("red64-standards-base", "base-rules"),
-        ]:
-            plugin_dir = Path(temp_dir) / "plugins" / plugin_name
-            plugin_dir.mkdir(parents=True)
-            (plugin_dir / ".claude-plugin").mkdir()
-            (plugin_dir / "skills").mkdir()
-            (plugin_dir / "hooks").mkdir()
-
-            plugin_json = {"name": plugin_name, "category": "standards"}
-            with open(plugin_dir / ".claude-plugin" / "plugin.json", "w") as f:
-                json.dump(plugin_json, f)
-
-            standards_json = {"name": plugin_name, "file_patterns": ["*.ts"]}
-            with open(plugin_dir / "standards.json", "w") as f:
-                json.dump(standards_json, f)
-
-            skill_content = f"# {skill_name}\n\n## DO\n\nFollow {plugin_name} rules.\n\n## DON'T\n\nAvoid violations."
-            with open(plugin_dir / "skills" / f"{skill_name}.md", "w") as f:
-                f.write(skill_content)
-
-            hooks_json = {"hooks": {}}
-            with open(plugin_dir / "hooks" / "hooks.json", "w") as f:
-                json.dump(hooks_json, f)
-
-        config_content = {
+        },
+        [
+            {
+                "name": "red64-standards-test",
+                "standards_name": "test",
+                "file_patterns": ["*.ts"],
+                "skills": {
+                    "long-skill": "# Long Skill\n\n## DO\n\n"
+                    + "Use patterns. " * 100
+                    + "\n\n## DON'T\n\nAvoid bad patterns.",
+                },
+            },
+        ],
+        "Edit the main.ts file",
+        _verify_budget_priority,
+        id="budget-priority",
+    ),
+    pytest.param(
+        {
             "version": "1.0",
             "token_budget": {"max_tokens": 5000},
             "standards": {
                 "enabled": ["red64-standards-strict", "red64-standards-base"],
                 "token_budget_priority": 3,
             },
-        }
-        with open(red64_dir / "config.yaml", "w") as f:
-            yaml.dump(config_content, f)
-
-        yield Path(temp_dir)
-        shutil.rmtree(temp_dir)
-
-    def test_multiple_standards_included_with_precedence_info(
-        self, temp_project_multiple_standards: Path
+        },
+        [
+            {
+                "name": plugin_name,
+                "file_patterns": ["*.ts"],
+                "skills": {
+                    skill_name: f"# {skill_name}\n\n## DO\n\nFollow {plugin_name} rules.\n\n## DON'T\n\nAvoid violations.",
+                },
+            }
+            for plugin_name, skill_name in [
+                ("red64-standards-strict", "strict-rules"),
+                ("red64-standards-base", "base-rules"),
+            ]
+        ],
+        "Edit the app.ts file",
+        _verify_precedence,
+        id="multiple-standards-precedence",
+    ),
+]
+
+
+@pytest.fixture(scope="class")
+def standards_root(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Shared base directory for the parametrized standards projects."""
+    return tmp_path_factory.mktemp("stds")
+
+
+class TestContextLoaderStandards:
+    """Parametrized tests for standards support in the context loader."""
+
+    @pytest.mark.parametrize("config, plugins, prompt, verify", _CONTEXT_CASES)
+    def test_standards_in_context_output(
+        self, standards_root: Path, config: dict, plugins: list, prompt: str, verify
     ):
-        """Test: Multiple standards are included with precedence information."""
-        input_data = {
-            "session_id": "test-session",
-            "prompt": "Edit the app.ts file",
-            "cwd": str(temp_project_multiple_standards),
-            "permission_mode": "default",
-        }
-
-        result = subprocess.run(
-            [sys.executable, str(CONTEXT_LOADER_SCRIPT)],
-            input=json.dumps(input_data),
-            capture_output=True,
-            text=True,
-            cwd=str(temp_project_multiple_standards),
-        )
-
-        output = json.loads(result.stdout)
-        additional_context = output.get("hookSpecificOutput", {}).get(
-            "additionalContext", ""
-        )
-        assert "strict" in additional_context.lower() or "Standards" in additional_context
-
-
-class TestStandardsLoaderScript:
-    """Tests for standards-loader.py utility script."""
-
-    @pytest.fixture
-    def temp_project_for_loader(self):
-        """Create project for testing standards loader script."""
-        temp_dir = tempfile.mkdtemp()
-        red64_dir = Path(temp_dir) / ".red64"
-        red64_dir.mkdir()
-
-        plugin_dir = Path(temp_dir) / "plugins" / "red64-standards-typescript"
-        plugin_dir.mkdir(parents=True)
-        (plugin_dir / ".claude-plugin").mkdir()
-        (plugin_dir / "skills").mkdir()
-        (plugin_dir / "hooks").mkdir()
-
-        plugin_json = {"name": "red64-standards-typescript", "category": "standards"}
-        with open(plugin_dir / ".claude-plugin" / "plugin.json", "w") as f:
-            json.dump(plugin_json, f)
+        """Test: Context loader output reflects the configured standards."""
+        project = standards_root / f"proj_{uuid4().hex}"
+        project.mkdir()
+        build_standards_project(project, config, plugins)
 
-        standards_json = {"name": "typescript", "file_patterns": ["*.ts", "*.tsx"]}
-        with open(plugin_dir / "standards.json", "w") as f:
-            json.dump(standards_json, f)
+        output, exit_code = run_context_loader(prompt, project)
 
-        skill_content = "# Type Safety\n\n## DO\n\nUse explicit types.\n\n## DON'T\n\nAvoid any type."
-        with open(plugin_dir / "skills" / "type-safety.md", "w") as f:
-            f.write(skill_content)
+        assert exit_code == 0
+        verify(output)
 
-        hooks_json = {"hooks": {}}
-        with open(plugin_dir / "hooks" / "hooks.json", "w") as f:
-            json.dump(hooks_json, f)
 
-        config_content = {
+@pytest.fixture(scope="class")
+def temp_project_for_loader(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a project for the standards loader script, once per class."""
+    temp_dir = tmp_path_factory.mktemp("stds_loader")
+    build_standards_project(
+        temp_dir,
+        config={
             "version": "1.0",
             "standards": {
                 "enabled": ["red64-standards-typescript"],
                 "token_budget_priority": 3,
             },
-        }
-        with open(red64_dir / "config.yaml", "w") as f:
-            yaml.dump(config_content, f)
+        },
+        plugins=[
+            {
+                "name": "red64-standards-typescript",
+                "standards_name": "typescript",
+                "file_patterns": ["*.ts", "*.tsx"],
+                "skills": {
+                    "type-safety": "# Type Safety\n\n## DO\n\nUse explicit types.\n\n## DON'T\n\nAvoid any type.",
+                },
+            },
+        ],
+    )
+    return temp_dir
+
 
-        yield Path(temp_dir)
-        shutil.rmtree(temp_dir)
+class TestStandardsLoaderScript:
+    """Tests for standards-loader.py utility script."""
 
     def test_standards_loader_returns_matched_skills(
         self, temp_project_for_loader: Path
@@ -397,16 +279,9 @@ class TestStandardsLoaderScript:
             "cwd": str(temp_project_for_loader),
         }
 
-        result = subprocess.run(
-            [sys.executable, str(STANDARDS_LOADER_SCRIPT)],
-            input=json.dumps(input_data),
-            capture_output=True,
-            text=True,
-            cwd=str(temp_project_for_loader),
-        )
+        output, exit_code = run_standards_loader(input_data)
 
-        assert result.returncode == 0
-        output = json.loads(result.stdout)
+        assert exit_code == 0
         assert "standards" in output
         assert len(output["standards"]) > 0
         first_standard = output["standards"][0]
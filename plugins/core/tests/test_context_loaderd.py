@@ -0,0 +1,164 @@
+"""Tests for the context loader daemon (context_loaderd.py).
+
+Tests cover:
+- Daemon answers pipelined newline-delimited requests over one connection
+- Hook entry _try_daemon round-trips a request through a running daemon
+- Hook entry main() returns the daemon-served output unchanged
+- _try_daemon returns None when nothing listens on the socket
+"""
+
+import socket
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+import yaml
+
+from tests.script_runner import (
+    YamlDumper as _YamlDumper,
+    json_dumps as _dumps,
+    json_loads as _loads,
+    load_script_module,
+    run_script_main,
+)
+
+SCRIPTS_DIR = Path(__file__).parent.parent / "scripts"
+SCRIPT_PATH = SCRIPTS_DIR / "context-loader.py"
+
+sys.path.insert(0, str(SCRIPTS_DIR))
+import context_loaderd
+
+
+def _start_daemon(socket_path: Path) -> None:
+    """Start the daemon on socket_path and wait until it is listening.
+
+    The serving thread blocks in accept() forever, so it is daemonized
+    and simply dies with the test process.
+
+    Args:
+        socket_path: Unix socket the daemon should bind.
+    """
+    thread = threading.Thread(
+        target=context_loaderd.serve, args=(socket_path,), daemon=True
+    )
+    thread.start()
+    deadline = time.monotonic() + 5.0
+    while not socket_path.exists():
+        assert time.monotonic() < deadline, "daemon socket never appeared"
+        time.sleep(0.01)
+
+
+def _hook_input(cwd: str, prompt: str = "Implement a new feature") -> dict:
+    """Build a UserPromptSubmit hook input for the given project."""
+    return {
+        "session_id": "test-session",
+        "prompt": prompt,
+        "cwd": cwd,
+        "permission_mode": "default",
+    }
+
+
+@pytest.fixture(scope="class")
+def daemon_socket(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """One running daemon shared by the class's read-only tests."""
+    socket_path = tmp_path_factory.mktemp("red64d") / "context-loader.sock"
+    _start_daemon(socket_path)
+    return socket_path
+
+
+@pytest.fixture(scope="class")
+def daemon_project(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """A minimal project with config for the daemon to load context from."""
+    project_dir = tmp_path_factory.mktemp("red64dproj")
+    red64_dir = project_dir / ".red64"
+    red64_dir.mkdir()
+    (red64_dir / "config.yaml").write_text(
+        yaml.dump({"version": "1.0"}, Dumper=_YamlDumper)
+    )
+    return str(project_dir)
+
+
+class TestContextLoaderDaemon:
+    """Tests for daemon serving and the hook entry's daemon routing."""
+
+    def test_daemon_answers_pipelined_requests(
+        self, daemon_socket: Path, daemon_project: str
+    ):
+        """Test: Two newline-delimited requests on one connection get two responses."""
+        payload = b"".join(
+            _dumps(_hook_input(daemon_project, prompt)).encode() + b"\n"
+            for prompt in ("Implement a feature", "Fix a bug")
+        )
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(5.0)
+            client.connect(str(daemon_socket))
+            client.sendall(payload)
+            client.shutdown(socket.SHUT_WR)
+            chunks = []
+            while True:
+                chunk = client.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+
+        lines = b"".join(chunks).splitlines()
+        assert len(lines) == 2
+        for line in lines:
+            response = _loads(line)
+            assert response["exit_code"] == 0
+            assert "hookSpecificOutput" in response["output"]
+
+    def test_try_daemon_round_trip(
+        self,
+        daemon_socket: Path,
+        daemon_project: str,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Test: _try_daemon returns the daemon's output for a served socket."""
+        monkeypatch.setenv("RED64_CONTEXT_LOADER_SOCKET", str(daemon_socket))
+        module = load_script_module(SCRIPT_PATH)
+
+        result = module._try_daemon(_hook_input(daemon_project))
+
+        assert result is not None
+        output, exit_code = result
+        assert exit_code == 0
+        assert "hookSpecificOutput" in output
+
+    def test_main_serves_daemon_output(
+        self,
+        daemon_socket: Path,
+        daemon_project: str,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Test: main() routed through the daemon matches the in-process result."""
+        module = load_script_module(SCRIPT_PATH)
+        input_json = _dumps(_hook_input(daemon_project))
+
+        monkeypatch.setenv("RED64_CONTEXT_LOADER_SOCKET", str(daemon_socket))
+        daemon_stdout, daemon_exit = run_script_main(module, input_json)
+
+        monkeypatch.setenv(
+            "RED64_CONTEXT_LOADER_SOCKET", str(daemon_socket) + ".absent"
+        )
+        direct_stdout, direct_exit = run_script_main(module, input_json)
+
+        assert daemon_exit == direct_exit == 0
+        assert _loads(daemon_stdout) == _loads(direct_stdout)
+
+    def test_try_daemon_returns_none_without_listener(
+        self,
+        daemon_project: str,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Test: _try_daemon yields to the in-process path when no daemon runs."""
+        monkeypatch.setenv(
+            "RED64_CONTEXT_LOADER_SOCKET", str(tmp_path / "absent.sock")
+        )
+        module = load_script_module(SCRIPT_PATH)
+
+        assert module._try_daemon(_hook_input(daemon_project)) is None
@@ -18,12 +18,19 @@ from pathlib import Path
 import pytest
 import yaml
 
+from tests.script_runner import YamlDumper as _YamlDumper
+
 
 SCRIPTS_DIR = Path(__file__).parent.parent / "scripts"
+
+# Child-process environment built once; each subprocess launch reuses
+# it instead of copying os.environ per call.
+_CHILD_ENV = {**os.environ, "PYTHONPATH": str(SCRIPTS_DIR)}
 TEMPLATES_DIR = Path(__file__).parent.parent / "templates"
-CONTEXT_LOADER = SCRIPTS_DIR / "context-loader.py"
-MISSION_SUMMARIZER = SCRIPTS_DIR / "mission-summarizer.py"
-ROADMAP_PARSER = SCRIPTS_DIR / "roadmap-parser.py"
+# Resolved to str once; subprocess argv wants strings on every call.
+CONTEXT_LOADER = str(SCRIPTS_DIR / "context-loader.py")
+MISSION_SUMMARIZER = str(SCRIPTS_DIR / "mission-summarizer.py")
+ROADMAP_PARSER = str(SCRIPTS_DIR / "roadmap-parser.py")
 
 
 def create_project_with_config(
@@ -73,7 +80,7 @@ def create_project_with_config(
     }
     config_path = red64_dir / "config.yaml"
     with open(config_path, "w") as f:
-        yaml.dump(config_data, f)
+        yaml.dump(config_data, f, Dumper=_YamlDumper)
 
     if any([mission_content, roadmap_content, tech_stack_content]):
         product_dir = red64_dir / "product"
@@ -87,7 +94,7 @@ def create_project_with_config(
             (product_dir / "tech-stack.md").write_text(tech_stack_content)
 
 
-def run_script(script_path: Path, cwd: str) -> tuple[dict | None, int]:
+def run_script(script_path: str, cwd: str) -> tuple[dict | None, int]:
     """Run a script and capture its JSON output.
 
     Args:
@@ -97,14 +104,13 @@ def run_script(script_path: Path, cwd: str) -> tuple[dict | None, int]:
     Returns:
         Tuple of (parsed JSON output or None, exit code).
     """
-    input_data = json.dumps({"cwd": cwd})
+    input_data = json.dumps({"cwd": cwd}).encode()
 
     result = subprocess.run(
-        [sys.executable, str(script_path)],
+        [sys.executable, script_path],
         input=input_data,
         capture_output=True,
-        text=True,
-        env={**os.environ, "PYTHONPATH": str(SCRIPTS_DIR)},
+        env=_CHILD_ENV,
     )
 
     try:
@@ -130,20 +136,21 @@ def run_context_loader(cwd: str, prompt: str = "test prompt") -> tuple[dict | st
         "prompt": prompt,
         "cwd": cwd,
         "permission_mode": "default",
-    })
+    }).encode()
 
     result = subprocess.run(
-        [sys.executable, str(CONTEXT_LOADER)],
+        [sys.executable, CONTEXT_LOADER],
         input=input_data,
         capture_output=True,
-        text=True,
-        env={**os.environ, "PYTHONPATH": str(SCRIPTS_DIR)},
+        env=_CHILD_ENV,
     )
 
-    try:
+    # Sniff the first byte instead of paying for a raised
+    # JSONDecodeError on every non-JSON response.
+    if result.stdout[:1] in (b"{", b"["):
         output = json.loads(result.stdout)
-    except json.JSONDecodeError:
-        output = result.stdout
+    else:
+        output = result.stdout.decode("utf-8", errors="replace")
 
     return output, result.returncode
 
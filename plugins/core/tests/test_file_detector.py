@@ -16,7 +16,8 @@ from pathlib import Path
 import pytest
 
 
-SCRIPT_PATH = Path(__file__).parent.parent / "scripts" / "file-detector.py"
+# Resolved to str once; subprocess argv wants a string on every call.
+SCRIPT_PATH = str(Path(__file__).parent.parent / "scripts" / "file-detector.py")
 
 
 def run_file_detector(prompt: str) -> dict:
@@ -30,7 +31,7 @@ def run_file_detector(prompt: str) -> dict:
     """
     input_data = json.dumps({"prompt": prompt})
     result = subprocess.run(
-        [sys.executable, str(SCRIPT_PATH)],
+        [sys.executable, SCRIPT_PATH],
         input=input_data,
         capture_output=True,
         text=True,
@@ -16,8 +16,16 @@ from pathlib import Path
 import pytest
 import yaml
 
+from tests.script_runner import YamlDumper as _YamlDumper
 
-SCRIPT_PATH = Path(__file__).parent.parent / "scripts" / "context-loader.py"
+
+SCRIPTS_DIR = Path(__file__).parent.parent / "scripts"
+# Resolved to str once; subprocess argv wants a string on every call.
+SCRIPT_PATH = str(SCRIPTS_DIR / "context-loader.py")
+
+# Child-process environment built once; each subprocess launch reuses
+# it instead of copying os.environ per call.
+_CHILD_ENV = {**os.environ, "PYTHONPATH": str(SCRIPTS_DIR)}
 
 
 def create_temp_project(
@@ -74,7 +82,7 @@ def create_temp_project(
                 },
             }
         with open(config_path, "w") as f:
-            yaml.dump(config_data, f)
+            yaml.dump(config_data, f, Dumper=_YamlDumper)
 
     if mission_content is not None or roadmap_content is not None:
         product_dir = Path(temp_dir) / ".red64" / "product"
@@ -118,20 +126,21 @@ def run_context_loader(
         "prompt": prompt,
         "cwd": cwd,
         "permission_mode": permission_mode,
-    })
+    }).encode()
 
     result = subprocess.run(
-        [sys.executable, str(SCRIPT_PATH)],
+        [sys.executable, SCRIPT_PATH],
         input=input_data,
         capture_output=True,
-        text=True,
-        env={**os.environ, "PYTHONPATH": str(SCRIPT_PATH.parent)},
+        env=_CHILD_ENV,
     )
 
-    try:
+    # Sniff the first byte instead of paying for a raised
+    # JSONDecodeError on every non-JSON response.
+    if result.stdout[:1] in (b"{", b"["):
         output = json.loads(result.stdout)
-    except json.JSONDecodeError:
-        output = result.stdout
+    else:
+        output = result.stdout.decode("utf-8", errors="replace")
 
     return output, result.returncode
 
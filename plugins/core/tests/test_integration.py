@@ -17,10 +17,17 @@ from pathlib import Path
 import pytest
 import yaml
 
+from tests.script_runner import YamlDumper as _YamlDumper
+
 
 SCRIPTS_DIR = Path(__file__).parent.parent / "scripts"
-CONTEXT_LOADER_PATH = SCRIPTS_DIR / "context-loader.py"
-TASK_DETECTOR_PATH = SCRIPTS_DIR / "task-detector.py"
+
+# Child-process environment built once; each subprocess launch reuses
+# it instead of copying os.environ per call.
+_CHILD_ENV = {**os.environ, "PYTHONPATH": str(SCRIPTS_DIR)}
+# Resolved to str once; subprocess argv wants strings on every call.
+CONTEXT_LOADER_PATH = str(SCRIPTS_DIR / "context-loader.py")
+TASK_DETECTOR_PATH = str(SCRIPTS_DIR / "task-detector.py")
 
 
 def create_test_project(
@@ -74,7 +81,7 @@ def create_test_project(
             }
 
         with open(config_path, "w") as f:
-            yaml.dump(config_data, f)
+            yaml.dump(config_data, f, Dumper=_YamlDumper)
 
     return temp_dir
 
@@ -88,12 +95,11 @@ def run_task_detector(prompt: str) -> dict:
     Returns:
         The parsed JSON output from the script.
     """
-    input_data = json.dumps({"prompt": prompt})
+    input_data = json.dumps({"prompt": prompt}).encode()
     result = subprocess.run(
-        [sys.executable, str(TASK_DETECTOR_PATH)],
+        [sys.executable, TASK_DETECTOR_PATH],
         input=input_data,
         capture_output=True,
-        text=True,
     )
     return json.loads(result.stdout)
 
@@ -120,20 +126,21 @@ def run_context_loader(
         "prompt": prompt,
         "cwd": cwd,
         "permission_mode": permission_mode,
-    })
+    }).encode()
 
     result = subprocess.run(
-        [sys.executable, str(CONTEXT_LOADER_PATH)],
+        [sys.executable, CONTEXT_LOADER_PATH],
         input=input_data,
         capture_output=True,
-        text=True,
-        env={**os.environ, "PYTHONPATH": str(SCRIPTS_DIR)},
+        env=_CHILD_ENV,
     )
 
-    try:
+    # Sniff the first byte instead of paying for a raised
+    # JSONDecodeError on every non-JSON response.
+    if result.stdout[:1] in (b"{", b"["):
         output = json.loads(result.stdout)
-    except json.JSONDecodeError:
-        output = result.stdout
+    else:
+        output = result.stdout.decode("utf-8", errors="replace")
 
     return output, result.returncode
 
@@ -231,11 +238,10 @@ class TestIntegration:
         gracefully and returns appropriate error with exit code 2.
         """
         result = subprocess.run(
-            [sys.executable, str(CONTEXT_LOADER_PATH)],
-            input="this is not valid json",
+            [sys.executable, CONTEXT_LOADER_PATH],
+            input=b"this is not valid json",
             capture_output=True,
-            text=True,
-            env={**os.environ, "PYTHONPATH": str(SCRIPTS_DIR)},
+            env=_CHILD_ENV,
         )
 
         assert result.returncode == 2, "Should exit with code 2 for invalid input"
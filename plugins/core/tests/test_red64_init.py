@@ -15,6 +15,8 @@ from pathlib import Path
 import pytest
 import yaml
 
+from tests.script_runner import YamlDumper as _YamlDumper, YamlLoader as _YamlLoader
+
 sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
 from config_schema import get_default_config
 
@@ -40,7 +42,13 @@ def simulate_init_command(project_root: Path) -> tuple[bool, str]:
 
     default_config = get_default_config()
     with open(config_path, "w") as f:
-        yaml.dump(default_config, f, default_flow_style=False, sort_keys=False)
+        yaml.dump(
+            default_config,
+            f,
+            Dumper=_YamlDumper,
+            default_flow_style=False,
+            sort_keys=False,
+        )
 
     return True, "Success: Created .red64/ directory with default configuration."
 
@@ -75,7 +83,7 @@ class TestRed64Init:
         assert config_path.exists()
 
         with open(config_path) as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=_YamlLoader)
 
         expected = get_default_config()
         assert config == expected
@@ -92,7 +100,11 @@ class TestRed64Init:
 
         config_path = temp_project / ".red64" / "config.yaml"
         with open(config_path, "w") as f:
-            yaml.dump({"version": "custom", "custom_key": "custom_value"}, f)
+            yaml.dump(
+                {"version": "custom", "custom_key": "custom_value"},
+                f,
+                Dumper=_YamlDumper,
+            )
 
         created, message = simulate_init_command(temp_project)
 
@@ -101,7 +113,7 @@ class TestRed64Init:
         assert "already exists" in message
 
         with open(config_path) as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=_YamlLoader)
 
         assert config["version"] == "custom"
         assert config["custom_key"] == "custom_value"
@@ -20,9 +20,14 @@ import pytest
 
 
 SCRIPTS_DIR = Path(__file__).parent.parent / "scripts"
-MISSION_SUMMARIZER = SCRIPTS_DIR / "mission-summarizer.py"
-ROADMAP_PARSER = SCRIPTS_DIR / "roadmap-parser.py"
-PRODUCT_CONTEXT = SCRIPTS_DIR / "product-context.py"
+
+# Child-process environment built once; each subprocess launch reuses
+# it instead of copying os.environ per call.
+_CHILD_ENV = {**os.environ, "PYTHONPATH": str(SCRIPTS_DIR)}
+# Resolved to str once; subprocess argv wants strings on every call.
+MISSION_SUMMARIZER = str(SCRIPTS_DIR / "mission-summarizer.py")
+ROADMAP_PARSER = str(SCRIPTS_DIR / "roadmap-parser.py")
+PRODUCT_CONTEXT = str(SCRIPTS_DIR / "product-context.py")
 
 
 def create_temp_project(
@@ -56,7 +61,7 @@ def create_temp_project(
 
 
 def run_script(
-    script_path: Path,
+    script_path: str,
     cwd: str,
 ) -> tuple[dict | None, int]:
     """Run a script and capture its JSON output.
@@ -68,14 +73,13 @@ def run_script(
     Returns:
         Tuple of (parsed JSON output or None, exit code).
     """
-    input_data = json.dumps({"cwd": cwd})
+    input_data = json.dumps({"cwd": cwd}).encode()
 
     result = subprocess.run(
-        [sys.executable, str(script_path)],
+        [sys.executable, script_path],
         input=input_data,
         capture_output=True,
-        text=True,
-        env={**os.environ, "PYTHONPATH": str(SCRIPTS_DIR)},
+        env=_CHILD_ENV,
     )
 
     try:
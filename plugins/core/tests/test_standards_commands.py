@@ -15,6 +15,8 @@ from pathlib import Path
 import pytest
 import yaml
 
+from tests.script_runner import YamlDumper as _YamlDumper, YamlLoader as _YamlLoader
+
 sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
 from config_utils import load_config
 
@@ -77,7 +79,7 @@ class TestStandardsEnableCommand:
             },
         }
         with open(red64_dir / "config.yaml", "w") as f:
-            yaml.dump(config_content, f)
+            yaml.dump(config_content, f, Dumper=_YamlDumper)
 
         yield Path(temp_dir)
         shutil.rmtree(temp_dir)
@@ -104,10 +106,10 @@ class TestStandardsEnableCommand:
         assert standard_plugin_dir.exists(), "Mock plugin should exist"
 
         with open(config_path) as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=_YamlLoader)
         config["standards"]["enabled"].append("typescript")
         with open(config_path, "w") as f:
-            yaml.dump(config, f)
+            yaml.dump(config, f, Dumper=_YamlDumper)
 
         loaded = load_config(config_path)
         assert "typescript" in loaded["standards"]["enabled"]
@@ -119,11 +121,11 @@ class TestStandardsEnableCommand:
         config_path = temp_project_dir / ".red64" / "config.yaml"
 
         with open(config_path) as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=_YamlLoader)
         config["standards"]["enabled"].append("typescript")
         config["standards"]["enabled"].append("python")
         with open(config_path, "w") as f:
-            yaml.dump(config, f)
+            yaml.dump(config, f, Dumper=_YamlDumper)
 
         loaded = load_config(config_path)
         enabled = loaded["standards"]["enabled"]
@@ -150,7 +152,7 @@ class TestStandardsDisableCommand:
             },
         }
         with open(red64_dir / "config.yaml", "w") as f:
-            yaml.dump(config_content, f)
+            yaml.dump(config_content, f, Dumper=_YamlDumper)
 
         yield Path(temp_dir)
         shutil.rmtree(temp_dir)
@@ -160,10 +162,10 @@ class TestStandardsDisableCommand:
         config_path = temp_project_dir / ".red64" / "config.yaml"
 
         with open(config_path) as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=_YamlLoader)
         config["standards"]["enabled"].remove("typescript")
         with open(config_path, "w") as f:
-            yaml.dump(config, f)
+            yaml.dump(config, f, Dumper=_YamlDumper)
 
         loaded = load_config(config_path)
         assert "typescript" not in loaded["standards"]["enabled"]
@@ -233,7 +235,7 @@ class TestStandardsIdempotency:
             },
         }
         with open(red64_dir / "config.yaml", "w") as f:
-            yaml.dump(config_content, f)
+            yaml.dump(config_content, f, Dumper=_YamlDumper)
 
         yield Path(temp_dir)
         shutil.rmtree(temp_dir)
@@ -243,14 +245,14 @@ class TestStandardsIdempotency:
         config_path = temp_project_dir / ".red64" / "config.yaml"
 
         with open(config_path) as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=_YamlLoader)
         initial_enabled = list(config["standards"]["enabled"])
 
         standard_to_enable = "typescript"
         if standard_to_enable not in config["standards"]["enabled"]:
             config["standards"]["enabled"].append(standard_to_enable)
         with open(config_path, "w") as f:
-            yaml.dump(config, f)
+            yaml.dump(config, f, Dumper=_YamlDumper)
 
         loaded = load_config(config_path)
         assert loaded["standards"]["enabled"] == initial_enabled
@@ -261,14 +263,14 @@ class TestStandardsIdempotency:
         config_path = temp_project_dir / ".red64" / "config.yaml"
 
         with open(config_path) as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=_YamlLoader)
         initial_enabled = list(config["standards"]["enabled"])
 
         standard_to_disable = "python"
         if standard_to_disable in config["standards"]["enabled"]:
             config["standards"]["enabled"].remove(standard_to_disable)
         with open(config_path, "w") as f:
-            yaml.dump(config, f)
+            yaml.dump(config, f, Dumper=_YamlDumper)
 
         loaded = load_config(config_path)
         assert loaded["standards"]["enabled"] == initial_enabled
@@ -19,13 +19,16 @@ from pathlib import Path
 import pytest
 import yaml
 
+from tests.script_runner import YamlDumper as _YamlDumper, YamlLoader as _YamlLoader
+
 
 PLUGINS_DIR = Path(__file__).parent.parent.parent
 TYPESCRIPT_PLUGIN_DIR = PLUGINS_DIR / "red64-standards-typescript"
 HOOKS_DIR = Path(__file__).parent.parent / "hooks"
 SCRIPTS_DIR = Path(__file__).parent.parent / "scripts"
 VALIDATOR_SCRIPT = HOOKS_DIR / "standards-validator.py"
-CONTEXT_LOADER_SCRIPT = SCRIPTS_DIR / "context-loader.py"
+# Resolved to str once; subprocess argv wants a string on every call.
+CONTEXT_LOADER_SCRIPT = str(SCRIPTS_DIR / "context-loader.py")
 
 
 class TestEndToEndEnableAndContext:
@@ -51,7 +54,7 @@ class TestEndToEndEnableAndContext:
             },
         }
         with open(red64_dir / "config.yaml", "w") as f:
-            yaml.dump(config_content, f)
+            yaml.dump(config_content, f, Dumper=_YamlDumper)
 
         yield Path(temp_dir)
         shutil.rmtree(temp_dir)
@@ -68,7 +71,7 @@ class TestEndToEndEnableAndContext:
         }
 
         result = subprocess.run(
-            [sys.executable, str(CONTEXT_LOADER_SCRIPT)],
+            [sys.executable, CONTEXT_LOADER_SCRIPT],
             input=json.dumps(input_data),
             capture_output=True,
             text=True,
@@ -96,7 +99,7 @@ class TestEndToEndEnableAndContext:
         }
 
         result = subprocess.run(
-            [sys.executable, str(CONTEXT_LOADER_SCRIPT)],
+            [sys.executable, CONTEXT_LOADER_SCRIPT],
             input=json.dumps(input_data),
             capture_output=True,
             text=True,
@@ -131,7 +134,7 @@ class TestPreToolUseBlockingWorkflow:
             },
         }
         with open(red64_dir / "config.yaml", "w") as f:
-            yaml.dump(config_content, f)
+            yaml.dump(config_content, f, Dumper=_YamlDumper)
 
         yield Path(temp_dir)
         shutil.rmtree(temp_dir)
@@ -262,7 +265,7 @@ class TestMultipleStandardsOrderingPrecedence:
             },
         }
         with open(red64_dir / "config.yaml", "w") as f:
-            yaml.dump(config_content, f)
+            yaml.dump(config_content, f, Dumper=_YamlDumper)
 
         yield Path(temp_dir)
         shutil.rmtree(temp_dir)
@@ -338,7 +341,7 @@ class TestTokenBudgetWithStandardsPriority:
             },
         }
         with open(red64_dir / "config.yaml", "w") as f:
-            yaml.dump(config_content, f)
+            yaml.dump(config_content, f, Dumper=_YamlDumper)
 
         yield Path(temp_dir)
         shutil.rmtree(temp_dir)
@@ -355,7 +358,7 @@ class TestTokenBudgetWithStandardsPriority:
         }
 
         result = subprocess.run(
-            [sys.executable, str(CONTEXT_LOADER_SCRIPT)],
+            [sys.executable, CONTEXT_LOADER_SCRIPT],
             input=json.dumps(input_data),
             capture_output=True,
             text=True,
@@ -408,7 +411,7 @@ class TestConfigPersistenceAcrossWorkflow:
             },
         }
         with open(red64_dir / "config.yaml", "w") as f:
-            yaml.dump(initial_config, f)
+            yaml.dump(initial_config, f, Dumper=_YamlDumper)
 
         yield Path(temp_dir)
         shutil.rmtree(temp_dir)
@@ -420,13 +423,13 @@ class TestConfigPersistenceAcrossWorkflow:
         config_path = temp_project_for_persistence / ".red64" / "config.yaml"
 
         with open(config_path) as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=_YamlLoader)
         config["standards"]["enabled"].append("red64-standards-test")
         with open(config_path, "w") as f:
-            yaml.dump(config, f)
+            yaml.dump(config, f, Dumper=_YamlDumper)
 
         with open(config_path) as f:
-            reloaded = yaml.safe_load(f)
+            reloaded = yaml.load(f, Loader=_YamlLoader)
 
         assert "red64-standards-test" in reloaded["standards"]["enabled"]
 
@@ -437,19 +440,19 @@ class TestConfigPersistenceAcrossWorkflow:
         config_path = temp_project_for_persistence / ".red64" / "config.yaml"
 
         with open(config_path) as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=_YamlLoader)
         config["standards"]["enabled"] = ["red64-standards-test", "another-standard"]
         with open(config_path, "w") as f:
-            yaml.dump(config, f)
+            yaml.dump(config, f, Dumper=_YamlDumper)
 
         with open(config_path) as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=_YamlLoader)
         config["standards"]["enabled"].remove("another-standard")
         with open(config_path, "w") as f:
-            yaml.dump(config, f)
+            yaml.dump(config, f, Dumper=_YamlDumper)
 
         with open(config_path) as f:
-            final = yaml.safe_load(f)
+            final = yaml.load(f, Loader=_YamlLoader)
 
         assert "another-standard" not in final["standards"]["enabled"]
         assert "red64-standards-test" in final["standards"]["enabled"]
@@ -11,15 +11,21 @@ Tests cover:
 """
 
 import json
+import os
 import shutil
+import socket
 import subprocess
 import sys
 import tempfile
+import threading
+import time
 from pathlib import Path
 
 import pytest
 import yaml
 
+from tests.script_runner import YamlDumper as _YamlDumper, load_script_module
+
 
 SCRIPTS_DIR = Path(__file__).parent.parent / "scripts"
 HOOKS_DIR = Path(__file__).parent.parent / "hooks"
@@ -45,7 +51,7 @@ class TestStandardsValidatorInput:
             },
         }
         with open(config_path, "w") as f:
-            yaml.dump(config_content, f)
+            yaml.dump(config_content, f, Dumper=_YamlDumper)
         yield Path(temp_dir)
         shutil.rmtree(temp_dir)
 
@@ -89,7 +95,7 @@ class TestStandardsValidatorAllowDecision:
             },
         }
         with open(config_path, "w") as f:
-            yaml.dump(config_content, f)
+            yaml.dump(config_content, f, Dumper=_YamlDumper)
         yield Path(temp_dir)
         shutil.rmtree(temp_dir)
 
@@ -197,7 +203,7 @@ const data: any = fetchData();
             },
         }
         with open(red64_dir / "config.yaml", "w") as f:
-            yaml.dump(config_content, f)
+            yaml.dump(config_content, f, Dumper=_YamlDumper)
 
         yield Path(temp_dir)
         shutil.rmtree(temp_dir)
@@ -281,7 +287,7 @@ Avoid using any type.
             },
         }
         with open(red64_dir / "config.yaml", "w") as f:
-            yaml.dump(config_content, f)
+            yaml.dump(config_content, f, Dumper=_YamlDumper)
 
         yield Path(temp_dir)
         shutil.rmtree(temp_dir)
@@ -407,7 +413,7 @@ Avoid obvious issues.
             },
         }
         with open(red64_dir / "config.yaml", "w") as f:
-            yaml.dump(config_content, f)
+            yaml.dump(config_content, f, Dumper=_YamlDumper)
 
         yield Path(temp_dir)
         shutil.rmtree(temp_dir)
@@ -491,7 +497,7 @@ const d = new Date();
             },
         }
         with open(red64_dir / "config.yaml", "w") as f:
-            yaml.dump(config_content, f)
+            yaml.dump(config_content, f, Dumper=_YamlDumper)
 
         yield Path(temp_dir)
         shutil.rmtree(temp_dir)
@@ -596,3 +602,180 @@ Avoid callback hell.
         finally:
             if str(HOOKS_DIR) in sys.path:
                 sys.path.remove(str(HOOKS_DIR))
+
+
+def _send_requests(socket_path: Path, requests: list[dict]) -> list[dict]:
+    """Send newline-delimited requests to the daemon on one connection.
+
+    Args:
+        socket_path: Unix socket the daemon listens on.
+        requests: Hook inputs to pipeline over the connection.
+
+    Returns:
+        One parsed response per request, in order.
+    """
+    payload = b"".join(json.dumps(r).encode() + b"\n" for r in requests)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(5.0)
+        client.connect(str(socket_path))
+        client.sendall(payload)
+        client.shutdown(socket.SHUT_WR)
+        chunks = []
+        while True:
+            chunk = client.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    return [json.loads(line) for line in b"".join(chunks).splitlines()]
+
+
+class TestValidatorDaemon:
+    """Tests for the --daemon socket loop and main()'s daemon routing."""
+
+    @pytest.fixture
+    def temp_project_with_standards(self):
+        """Create a temporary project with enabled standards and DON'T patterns."""
+        temp_dir = tempfile.mkdtemp()
+        red64_dir = Path(temp_dir) / ".red64"
+        red64_dir.mkdir()
+
+        plugin_dir = Path(temp_dir) / "plugins" / "red64-standards-test"
+        plugin_dir.mkdir(parents=True)
+        (plugin_dir / ".claude-plugin").mkdir()
+        (plugin_dir / "skills").mkdir()
+        (plugin_dir / "hooks").mkdir()
+
+        plugin_json = {"name": "red64-standards-test", "category": "standards"}
+        with open(plugin_dir / ".claude-plugin" / "plugin.json", "w") as f:
+            json.dump(plugin_json, f)
+
+        standards_json = {"name": "test-standards", "file_patterns": ["*.ts"]}
+        with open(plugin_dir / "standards.json", "w") as f:
+            json.dump(standards_json, f)
+
+        skill_content = """# Test Skill
+
+## DO
+
+Use proper patterns.
+
+## DON'T
+
+### Avoid any type
+
+Never use the `any` type in TypeScript code.
+
+```typescript
+// Bad: using any
+const data: any = fetchData();
+```
+"""
+        with open(plugin_dir / "skills" / "test-skill.md", "w") as f:
+            f.write(skill_content)
+
+        hooks_json = {"hooks": {}}
+        with open(plugin_dir / "hooks" / "hooks.json", "w") as f:
+            json.dump(hooks_json, f)
+
+        config_content = {
+            "version": "1.0",
+            "standards": {
+                "enabled": ["red64-standards-test"],
+                "token_budget_priority": 3,
+            },
+        }
+        with open(red64_dir / "config.yaml", "w") as f:
+            yaml.dump(config_content, f, Dumper=_YamlDumper)
+
+        yield Path(temp_dir)
+        shutil.rmtree(temp_dir)
+
+    @pytest.fixture
+    def daemon_socket(self, tmp_path: Path):
+        """Start the validator daemon on a test-owned socket."""
+        module = load_script_module(VALIDATOR_SCRIPT)
+        socket_path = tmp_path / "standards-validator.sock"
+        thread = threading.Thread(
+            target=module.main_loop, args=(socket_path,), daemon=True
+        )
+        thread.start()
+        deadline = time.monotonic() + 5.0
+        while not socket_path.exists():
+            assert time.monotonic() < deadline, "daemon socket never appeared"
+            time.sleep(0.01)
+        return socket_path
+
+    def _write_request(self, project_dir: Path, content: str) -> dict:
+        """Build a Write hook input for a .ts file in the project."""
+        return {
+            "tool_name": "Write",
+            "tool_input": {
+                "file_path": str(project_dir / "src" / "app.ts"),
+                "content": content,
+            },
+            "cwd": str(project_dir),
+            "plugins_dir": str(project_dir / "plugins"),
+        }
+
+    def test_daemon_serves_newline_delimited_requests(
+        self, daemon_socket: Path, temp_project_with_standards: Path
+    ):
+        """Test: Pipelined requests on one connection get one response line each."""
+        responses = _send_requests(
+            daemon_socket,
+            [
+                self._write_request(
+                    temp_project_with_standards, "const data: any = fetchData();"
+                ),
+                self._write_request(temp_project_with_standards, "const x = 1;"),
+            ],
+        )
+
+        assert len(responses) == 2
+        assert responses[0]["decision"] == "block"
+        assert responses[1]["decision"] == "allow"
+
+    def test_daemon_revalidates_edited_skills(
+        self, daemon_socket: Path, temp_project_with_standards: Path
+    ):
+        """Test: Skill edits take effect on the next request without a restart."""
+        request = self._write_request(
+            temp_project_with_standards, "const data: any = fetchData();"
+        )
+        assert _send_requests(daemon_socket, [request])[0]["decision"] == "block"
+
+        skill_path = (
+            temp_project_with_standards
+            / "plugins"
+            / "red64-standards-test"
+            / "skills"
+            / "test-skill.md"
+        )
+        skill_path.write_text(
+            "# Test Skill\n\n## DO\n\nUse proper patterns.\n\n"
+            "## DON'T\n\n### Avoid eval\n\nNever use eval() anywhere.\n"
+        )
+
+        assert _send_requests(daemon_socket, [request])[0]["decision"] == "allow"
+
+    def test_one_shot_routes_through_daemon(
+        self, daemon_socket: Path, temp_project_with_standards: Path
+    ):
+        """Test: A fresh hook invocation forwards to the daemon via the socket."""
+        input_data = self._write_request(
+            temp_project_with_standards, "const data: any = fetchData();"
+        )
+
+        result = subprocess.run(
+            [sys.executable, str(VALIDATOR_SCRIPT)],
+            input=json.dumps(input_data),
+            capture_output=True,
+            text=True,
+            env={
+                **os.environ,
+                "RED64_STANDARDS_VALIDATOR_SOCKET": str(daemon_socket),
+            },
+        )
+
+        output = json.loads(result.stdout)
+        assert output["decision"] == "block"
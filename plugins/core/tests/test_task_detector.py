@@ -17,7 +17,8 @@ from pathlib import Path
 import pytest
 
 
-SCRIPT_PATH = Path(__file__).parent.parent / "scripts" / "task-detector.py"
+# Resolved to str once; subprocess argv wants a string on every call.
+SCRIPT_PATH = str(Path(__file__).parent.parent / "scripts" / "task-detector.py")
 
 
 def run_task_detector(prompt: str) -> dict:
@@ -31,7 +32,7 @@ def run_task_detector(prompt: str) -> dict:
     """
     input_data = json.dumps({"prompt": prompt})
     result = subprocess.run(
-        [sys.executable, str(SCRIPT_PATH)],
+        [sys.executable, SCRIPT_PATH],
         input=input_data,
         capture_output=True,
         text=True,
@@ -19,6 +19,8 @@ from pathlib import Path
 import pytest
 import yaml
 
+from tests.script_runner import YamlDumper as _YamlDumper
+
 
 PLUGINS_DIR = Path(__file__).parent.parent.parent
 TYPESCRIPT_PLUGIN_DIR = PLUGINS_DIR / "red64-standards-typescript"
@@ -210,7 +212,7 @@ class TestTypescriptPluginValidatorIntegration:
             },
         }
         with open(red64_dir / "config.yaml", "w") as f:
-            yaml.dump(config_content, f)
+            yaml.dump(config_content, f, Dumper=_YamlDumper)
 
         yield Path(temp_dir)
         shutil.rmtree(temp_dir)